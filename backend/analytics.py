@@ -0,0 +1,334 @@
+import asyncio
+import json
+import logging
+import os
+import time
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from config import ANALYTICS_FILE, ANALYTICS_BATCH_SIZE, ANALYTICS_LAG_SECONDS
+from database import get_supabase_client, execute
+import cold_storage
+import compositions
+import planning_engine
+
+# ============================================
+# CUMULS DE CONSOMMATION (SEMAINES ET MOIS)
+# ============================================
+# « Combien de croissants par semaine le trimestre dernier ? » : quantités par
+# produit et par type de formule, cumulées par semaine (lundi) et par mois de
+# livraison, sur les commandes archivées validées (Supabase et fichiers
+# Parquet). Une requête ne lit que ces cumuls : sa durée ne dépend pas de la
+# longueur de l'historique.
+#
+# - Mise à jour incrémentale à chaque passage de l'archivage (archiver.py, sous
+#   son verrou) : les commandes dont archived_at dépasse le dernier passage
+#   sont ajoutées. Les archivages des _LAG dernières secondes attendent le
+#   passage suivant (une écriture en cours ne doit pas être manquée).
+# - Reconstruction complète au premier passage (pas de fichier) ou sur
+#   POST /analytics/rebuild, par exemple après la modification d'une commande
+#   déjà archivée.
+# - Les cumuls vivent dans ANALYTICS_FILE (écrit puis renommé) ; chaque worker
+#   le relit quand un autre l'a réécrit.
+
+logger = logging.getLogger("omb.analytics")
+supabase = get_supabase_client()
+
+PERIODS = ("week", "month")
+# Clé de type_formule : toutes sources confondues, produits commandés hors formule
+ALL = "*"
+DIRECT = ""
+
+_VERSION = 1
+_PRECISION = 6
+_LAG = timedelta(seconds=ANALYTICS_LAG_SECONDS)
+_COLUMNS = ["id", "delivery_date", "nombre_couverts", "validated", "archived_at"]
+
+# Période → {"commandes", "couverts", "produits": {(produit_id, type_formule): [quantite, unite, commandes]}}
+Rollups = Dict[str, Any]
+
+_data: Optional[Rollups] = None
+_loaded_mtime: Optional[int] = None
+
+def period_key(kind: str, delivery_date: str) -> str:
+    """Monday of the week ("2026-01-05") or month ("2026-01") of a delivery date"""
+    day = date.fromisoformat(delivery_date[:10])
+    if kind == "week":
+        return (day - timedelta(days=day.weekday())).isoformat()
+    return day.isoformat()[:7]
+
+def _empty() -> Rollups:
+    return {"watermark": None, "updated_at": None, **{kind: {} for kind in PERIODS}}
+
+# ============================================
+# FICHIER PARTAGÉ
+# ============================================
+
+def _load() -> Rollups:
+    """The rollups, reloaded from ANALYTICS_FILE when another worker rewrote it"""
+    global _data, _loaded_mtime
+    try:
+        mtime = os.stat(ANALYTICS_FILE).st_mtime_ns
+    except OSError:
+        mtime = None
+    if mtime is not None and mtime != _loaded_mtime:
+        try:
+            with open(ANALYTICS_FILE, encoding="utf-8") as f:
+                raw = json.load(f)
+        except (OSError, ValueError):
+            logger.warning("fichier d'analyse illisible : %s (reconstruction au prochain passage)", ANALYTICS_FILE)
+            raw = {}
+        _loaded_mtime = mtime
+        if raw.get("version") == _VERSION:
+            _data = {
+                "watermark": raw["watermark"],
+                "updated_at": raw["updated_at"],
+                **{
+                    kind: {
+                        key: {
+                            "commandes": period["commandes"],
+                            "couverts": period["couverts"],
+                            "produits": {(p[0], p[1]): p[2:] for p in period["produits"]},
+                        }
+                        for key, period in raw[kind].items()
+                    }
+                    for kind in PERIODS
+                },
+            }
+        else:
+            _data = _empty()
+    if _data is None:
+        _data = _empty()
+    return _data
+
+def _save(data: Rollups):
+    global _data, _loaded_mtime
+    raw = {
+        "version": _VERSION,
+        "watermark": data["watermark"],
+        "updated_at": data["updated_at"],
+        **{
+            kind: {
+                key: {
+                    "commandes": period["commandes"],
+                    "couverts": period["couverts"],
+                    "produits": [[produit_id, type_formule, *total] for (produit_id, type_formule), total in period["produits"].items()],
+                }
+                for key, period in data[kind].items()
+            }
+            for kind in PERIODS
+        },
+    }
+    directory = os.path.dirname(ANALYTICS_FILE)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(ANALYTICS_FILE + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(raw, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(ANALYTICS_FILE + ".tmp", ANALYTICS_FILE)
+    _data = data
+    _loaded_mtime = os.stat(ANALYTICS_FILE).st_mtime_ns
+
+# ============================================
+# CUMUL DES COMMANDES
+# ============================================
+
+def _add_line(lines: Dict[Tuple[str, str], list], key: Tuple[str, str], quantite: float, unite: str):
+    line = lines.get(key)
+    if line is None:
+        lines[key] = [quantite, unite]
+    else:
+        line[0] += quantite
+        line[1] = unite
+
+def _add(data: Rollups, commandes: List[Dict[str, Any]], relations: Dict[str, Any]) -> int:
+    """Add the validated commandes to the rollups (relations as planning_engine.prefetch_relations)"""
+    commande_formules_map = planning_engine.group_by_commande(relations["commande_formules"])
+    commande_produits_map = planning_engine.group_by_commande(relations["commande_produits"])
+    formules_info_map = {f["id"]: f for f in relations["formules"]}
+    compositions_index = relations["compositions"]
+    exclusions_masks = relations["exclusions"]
+
+    added = 0
+    for commande in commandes:
+        if commande.get("validated") is False:
+            continue
+        lines: Dict[Tuple[str, str], list] = {}
+        for cp in commande_produits_map.get(commande["id"], ()):
+            _add_line(lines, (cp["produit_id"], DIRECT), cp["quantite"], cp["unite"])
+            _add_line(lines, (cp["produit_id"], ALL), cp["quantite"], cp["unite"])
+        for cf in commande_formules_map.get(commande["id"], ()):
+            type_formule = formules_info_map.get(cf["formule_id"], {}).get("type_formule") or "Autre"
+            excluded = exclusions_masks.get(cf["id"], compositions.NO_EXCLUSIONS)
+            for produit_id, quantite, unite in compositions.expand(compositions_index, cf["formule_id"], excluded):
+                _add_line(lines, (produit_id, type_formule), quantite * cf["quantite_finale"], unite)
+                _add_line(lines, (produit_id, ALL), quantite * cf["quantite_finale"], unite)
+
+        for kind in PERIODS:
+            period = data[kind].setdefault(
+                period_key(kind, commande["delivery_date"]), {"commandes": 0, "couverts": 0, "produits": {}}
+            )
+            period["commandes"] += 1
+            period["couverts"] += commande.get("nombre_couverts") or 0
+            for key, (quantite, unite) in lines.items():
+                total = period["produits"].get(key)
+                if total is None:
+                    period["produits"][key] = [round(quantite, _PRECISION), unite, 1]
+                else:
+                    total[0] = round(total[0] + quantite, _PRECISION)
+                    total[1] = unite
+                    total[2] += 1
+        added += 1
+    return added
+
+def _merge(data: Rollups, delta: Rollups):
+    for kind in PERIODS:
+        for key, period in delta[kind].items():
+            target = data[kind].setdefault(key, {"commandes": 0, "couverts": 0, "produits": {}})
+            target["commandes"] += period["commandes"]
+            target["couverts"] += period["couverts"]
+            for line, (quantite, unite, commandes) in period["produits"].items():
+                total = target["produits"].get(line)
+                if total is None:
+                    target["produits"][line] = [quantite, unite, commandes]
+                else:
+                    total[0] = round(total[0] + quantite, _PRECISION)
+                    total[1] = unite
+                    total[2] += commandes
+
+async def _scan_supabase(data: Rollups, after: Optional[str], until: str, seen: Optional[set] = None) -> int:
+    """
+    Add the archived commandes of Supabase, by pages of ANALYTICS_BATCH_SIZE:
+    archived_at in (after, until], or every one up to `until` when `after` is None
+    (archived_at missing included). Their ids go to `seen`.
+    """
+    added, last_id = 0, None
+    while True:
+        query = supabase.table("carnet_commande").select(", ".join(_COLUMNS)).eq("archived", True)
+        if after is not None:
+            query = query.gt("archived_at", after).lte("archived_at", until)
+        if last_id is not None:
+            query = query.gt("id", last_id)
+        response = await execute(query.order("id").limit(ANALYTICS_BATCH_SIZE))
+        commandes = response.data
+        if not commandes:
+            break
+        last_id = commandes[-1]["id"]
+        if seen is not None:
+            seen.update(c["id"] for c in commandes)
+        if after is None:
+            commandes = [c for c in commandes if not c.get("archived_at") or c["archived_at"] <= until]
+        if commandes:
+            relations = await planning_engine.prefetch_relations([c["id"] for c in commandes], {})
+            added += _add(data, commandes, relations)
+        if len(response.data) < ANALYTICS_BATCH_SIZE:
+            break
+    return added
+
+async def _scan_cold_storage(data: Rollups, seen: set) -> int:
+    """Add the commandes exported to Parquet (those still in Supabase are skipped)"""
+    added = 0
+    for month in cold_storage.months():
+        commandes = await asyncio.to_thread(cold_storage.read_month, month, _COLUMNS)
+        commandes = [c for c in commandes if c["id"] not in seen]
+        for i in range(0, len(commandes), ANALYTICS_BATCH_SIZE):
+            batch = commandes[i:i + ANALYTICS_BATCH_SIZE]
+            added += _add(data, batch, await cold_storage.load_relations(batch))
+    return added
+
+async def rebuild() -> Dict[str, Any]:
+    """Recompute every rollup from the archives (caller holds archiver.exclusive)"""
+    start = time.perf_counter()
+    until = (datetime.utcnow() - _LAG).isoformat()
+    data, seen = _empty(), set()
+    added = await _scan_supabase(data, None, until, seen)
+    if cold_storage.ENABLED:
+        added += await _scan_cold_storage(data, seen)
+    data["watermark"] = until
+    data["updated_at"] = datetime.utcnow().isoformat(timespec="seconds")
+    _save(data)
+    stats = {"mode": "rebuild", "commandes": added, "duration_ms": round((time.perf_counter() - start) * 1000, 1)}
+    logger.info("mode=rebuild commandes=%s duration_ms=%s", added, stats["duration_ms"])
+    return stats
+
+def watermark() -> Optional[str]:
+    """archived_at up to which the commandes are counted (None before the first update)"""
+    return _load()["watermark"]
+
+async def update() -> Dict[str, Any]:
+    """Add the commandes archived since the last update (rebuild when there is no rollup yet)"""
+    data = _load()
+    if data["watermark"] is None:
+        return await rebuild()
+    start = time.perf_counter()
+    until = (datetime.utcnow() - _LAG).isoformat()
+    # Delta à part : un échec en cours de route ne laisse pas de commande comptée deux fois
+    delta = _empty()
+    added = await _scan_supabase(delta, data["watermark"], until)
+    _merge(data, delta)
+    data["watermark"] = until
+    data["updated_at"] = datetime.utcnow().isoformat(timespec="seconds")
+    _save(data)
+    return {"mode": "incremental", "commandes": added, "duration_ms": round((time.perf_counter() - start) * 1000, 1)}
+
+# ============================================
+# LECTURE
+# ============================================
+
+def _matches(info: Dict[str, str], categorie: Optional[str], type_produit: Optional[str]) -> bool:
+    if categorie and info["categorie"].lower() != categorie.lower():
+        return False
+    if type_produit and info["type"].lower() != type_produit.lower():
+        return False
+    return True
+
+def consumption(
+    kind: str,
+    date_debut: str,
+    date_fin: str,
+    produits_infos: Dict[str, Dict[str, str]],
+    categorie: Optional[str] = None,
+    type_produit: Optional[str] = None,
+    type_formule: str = ALL,
+    produit_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Rollups of the periods touching [date_debut, date_fin]: one entry per
+    period (commandes, couverts, produits) and the totals per produit.
+    `type_formule`: ALL, DIRECT or a formule type.
+    """
+    data = _load()
+    first, last = period_key(kind, date_debut), period_key(kind, date_fin)
+    unknown = {"name": "Produit inconnu", "categorie": "Autre", "type": "Autre"}
+
+    series, totaux = [], {}
+    for key in sorted(data[kind]):
+        if not first <= key <= last:
+            continue
+        period = data[kind][key]
+        produits = []
+        for (line_produit_id, line_type_formule), (quantite, unite, commandes) in period["produits"].items():
+            if line_type_formule != type_formule or (produit_id and line_produit_id != produit_id):
+                continue
+            info = produits_infos.get(line_produit_id, unknown)
+            if not _matches(info, categorie, type_produit):
+                continue
+            produits.append({
+                "produit_id": line_produit_id,
+                "nom": info["name"],
+                "categorie": info["categorie"],
+                "type": info["type"],
+                "quantite": quantite,
+                "unite": unite,
+                "commandes": commandes,
+            })
+            total = totaux.setdefault(line_produit_id, {**produits[-1], "quantite": 0, "commandes": 0})
+            total["quantite"] = round(total["quantite"] + quantite, _PRECISION)
+            total["unite"] = unite
+            total["commandes"] += commandes
+        produits.sort(key=lambda produit: produit["nom"])
+        series.append({"periode": key, "commandes": period["commandes"], "couverts": period["couverts"], "produits": produits})
+
+    return {
+        "mis_a_jour": data["updated_at"],
+        "series": series,
+        "totaux": sorted(totaux.values(), key=lambda produit: produit["nom"]),
+    }
@@ -0,0 +1,301 @@
+import asyncio
+import json
+import logging
+import os
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from datetime import time as clock
+from typing import Any, Dict, Optional, Tuple
+from config import (
+    ARCHIVE_SCHEDULER, ARCHIVE_AFTER_DAYS, ARCHIVE_BATCH_SIZE, ARCHIVE_MAX_BATCHES,
+    ARCHIVE_INTERVAL_MINUTES, ARCHIVE_HOURS, ARCHIVE_LOCK_FILE,
+)
+from database import get_supabase_client, execute
+import analytics
+import cold_storage
+import metrics
+import totals
+
+try:
+    import fcntl
+except ImportError:  # Windows : pas de verrou entre workers, seulement dans le processus
+    fcntl = None
+
+# ============================================
+# ARCHIVAGE AUTOMATIQUE EN TÂCHE DE FOND
+# ============================================
+# Les commandes livrées depuis plus de ARCHIVE_AFTER_DAYS jours sont archivées
+# par une tâche lancée au démarrage de l'API (lifespan, main.py) quand
+# ARCHIVE_SCHEDULER=true, toutes les ARCHIVE_INTERVAL_MINUTES minutes pendant
+# les heures creuses ARCHIVE_HOURS.
+#
+# - Par lots : ARCHIVE_BATCH_SIZE commandes par mise à jour, au plus
+#   ARCHIVE_MAX_BATCHES lots par passage (le reste part au passage suivant),
+#   avec une pause entre deux lots pour laisser passer les requêtes.
+# - Un seul passage à la fois, tous workers de la machine confondus : verrou
+#   fcntl sur ARCHIVE_LOCK_FILE. Le worker qui le tient y écrit le bilan de son
+#   passage, lu par GET /commandes/auto-archive/status depuis n'importe quel
+#   worker. Le verrou ne couvre pas plusieurs machines : la tâche planifiée
+#   n'est activée que sur une seule (désactivée par défaut).
+# - Chaque passage met ensuite à jour les cumuls d'analyse (analytics.py) et,
+#   avec COLD_STORAGE_DIR, exporte les plus anciennes archives en Parquet
+#   (voir cold_storage.py).
+# - POST /commandes/auto-archive lance le même passage à la demande, mais
+#   répond dès les lots archivés : la suite (cumuls, export) tourne en tâche
+#   de fond, sous le même verrou ; si un autre passage le tient, elle est
+#   laissée au passage suivant.
+
+logger = logging.getLogger("omb.archiver")
+supabase = get_supabase_client()
+
+# Pause entre deux lots d'un passage planifié (secondes)
+_BATCH_PAUSE = 0.5
+
+class ArchiveBusy(Exception):
+    """An archive run is already in progress (in this worker or another one)"""
+
+def parse_hours(value: str) -> Tuple[int, int]:
+    """"1-6" → (1, 6); a window may wrap around midnight ("22-4")"""
+    start, _, end = value.partition("-")
+    start, end = int(start), int(end or 24)
+    if not (0 <= start <= 23 and 0 <= end <= 24):
+        raise ValueError(f"ARCHIVE_HOURS invalide : {value!r} (attendu : \"début-fin\", ex \"1-6\")")
+    return start, end
+
+def in_window(hour: int, hours: Tuple[int, int]) -> bool:
+    start, end = hours
+    if start < end:
+        return start <= hour < end
+    return hour >= start or hour < end
+
+def next_run_at(now: datetime, interval_minutes: int, hours: Tuple[int, int]) -> datetime:
+    """`now` + interval, pushed to the start of the next off-peak window if it falls outside"""
+    candidate = now + timedelta(minutes=interval_minutes)
+    if in_window(candidate.hour, hours):
+        return candidate
+    start = datetime.combine(candidate.date(), clock(hours[0]))
+    return start if start > candidate else start + timedelta(days=1)
+
+class _FileLock:
+    """Non-blocking exclusive lock on a file shared by every worker of the host"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+
+    def acquire(self) -> bool:
+        self._file = open(self.path, "a+", encoding="utf-8")
+        if fcntl is None:
+            return True
+        try:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            self._file.close()
+            self._file = None
+            return False
+        return True
+
+    def write(self, content: str):
+        self._file.seek(0)
+        self._file.truncate()
+        self._file.write(content)
+        self._file.flush()
+
+    def release(self):
+        if self._file is None:
+            return
+        if fcntl is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        self._file.close()
+        self._file = None
+
+# État de la tâche dans ce worker
+_running = asyncio.Lock()
+_task: Optional[asyncio.Task] = None
+_follow_up_task: Optional[asyncio.Task] = None
+_state: Dict[str, Any] = {"next_run": None, "runs": 0, "skipped": 0, "last_run": None}
+
+async def archive_batch(cutoff_date: str, archived_at: str, limit: int) -> Tuple[int, int]:
+    """Archive up to `limit` commandes delivered before `cutoff_date`: (selected, archived)"""
+    response = await execute(
+        supabase.table("carnet_commande").select("id")
+        .eq("archived", False).lt("delivery_date", cutoff_date)
+        .order("delivery_date").limit(limit)
+    )
+    ids = [row["id"] for row in response.data]
+    if not ids:
+        return 0, 0
+    # archived=False rejoué : une commande archivée entre-temps n'est pas réécrite
+    response = await execute(
+        supabase.table("carnet_commande")
+        .update({"archived": True, "archived_at": archived_at})
+        .in_("id", ids).eq("archived", False)
+    )
+    archived = [row["id"] for row in response.data or []]
+    totals.mark_dirty(*archived)
+    return len(ids), len(archived)
+
+@asynccontextmanager
+async def exclusive(trigger: str):
+    """
+    Hold the archive lock (this worker and the others) for a job touching the
+    archives; raises ArchiveBusy when another job holds it.
+    """
+    if _running.locked():
+        _state["skipped"] += 1
+        metrics.archive_runs.inc(trigger, "busy")
+        raise ArchiveBusy()
+    async with _running:
+        lock = _FileLock(ARCHIVE_LOCK_FILE)
+        if not lock.acquire():
+            _state["skipped"] += 1
+            metrics.archive_runs.inc(trigger, "busy")
+            raise ArchiveBusy()
+        try:
+            yield lock
+        finally:
+            lock.release()
+
+async def _follow_up(stats: Dict[str, Any]):
+    """What a run does once the commandes are archived (stats completed in place)"""
+    # Cumuls d'analyse mis à jour avant que les archives ne partent en Parquet
+    stats["analytics"] = await analytics.update()
+    if cold_storage.ENABLED:
+        # Sous le même verrou : un seul worker écrit les fichiers Parquet.
+        # Les archives plus récentes que les cumuls attendent le passage suivant.
+        stats["cold_storage"] = await cold_storage.export(analytics.watermark())
+
+async def run(trigger: str, pause: float = 0, background: bool = False) -> Dict[str, Any]:
+    """
+    One archive run, in batches. Raises ArchiveBusy when a run is already in
+    progress; the stats of the run are returned and kept for status().
+    With `background`, returns once the batches are done and leaves the
+    follow-up (rollups, cold storage export) to a background task.
+    """
+    async with exclusive(trigger) as lock:
+        now = datetime.utcnow()
+        stats = {
+            "trigger": trigger,
+            "pid": os.getpid(),
+            "started_at": now.isoformat(timespec="seconds"),
+            "cutoff_date": (now.date() - timedelta(days=ARCHIVE_AFTER_DAYS)).isoformat(),
+            "archived": 0,
+            "batches": 0,
+            "remaining": False,
+            "error": None,
+        }
+        start = time.perf_counter()
+        try:
+            for batch in range(ARCHIVE_MAX_BATCHES):
+                if batch and pause:
+                    await asyncio.sleep(pause)
+                selected, archived = await archive_batch(stats["cutoff_date"], now.isoformat(), ARCHIVE_BATCH_SIZE)
+                stats["archived"] += archived
+                stats["batches"] += 1
+                metrics.archived_commandes.inc(amount=archived)
+                if selected < ARCHIVE_BATCH_SIZE:
+                    break
+            else:
+                # Lots épuisés : il en reste peut-être pour le passage suivant
+                stats["remaining"] = True
+            if not background:
+                await _follow_up(stats)
+        except Exception as e:
+            stats["error"] = str(e)
+            metrics.archive_runs.inc(trigger, "error")
+            raise
+        finally:
+            stats["duration_ms"] = round((time.perf_counter() - start) * 1000, 1)
+            stats["finished_at"] = datetime.utcnow().isoformat(timespec="seconds")
+            _state["runs"] += 1
+            _state["last_run"] = stats
+            lock.write(json.dumps(stats))
+        metrics.archive_runs.inc(trigger, "ok")
+        logger.info(
+            "trigger=%s cutoff_date=%s archived=%s batches=%s remaining=%s duration_ms=%s",
+            trigger, stats["cutoff_date"], stats["archived"], stats["batches"],
+            stats["remaining"], stats["duration_ms"],
+        )
+    if background:
+        _start_follow_up(stats)
+    return stats
+
+def _start_follow_up(stats: Dict[str, Any]):
+    global _follow_up_task
+    # Une suite déjà en attente traitera aussi les commandes de ce passage
+    if _follow_up_task is not None and not _follow_up_task.done():
+        return
+    _follow_up_task = asyncio.create_task(_run_follow_up(stats), name="auto-archive-follow-up")
+
+async def _run_follow_up(stats: Dict[str, Any]):
+    try:
+        async with exclusive(stats["trigger"]) as lock:
+            try:
+                await _follow_up(stats)
+            except Exception as e:
+                stats["error"] = str(e)
+                logger.exception("échec de la suite de l'archivage (cumuls, export)")
+            finally:
+                stats["finished_at"] = datetime.utcnow().isoformat(timespec="seconds")
+                lock.write(json.dumps(stats))
+    except ArchiveBusy:
+        logger.info("archivage en cours ailleurs : cumuls et export repris au passage suivant")
+
+def _last_run() -> Optional[Dict[str, Any]]:
+    """Stats of the latest run of any worker (lock file), else of this worker"""
+    try:
+        with open(ARCHIVE_LOCK_FILE, encoding="utf-8") as f:
+            return json.loads(f.read())
+    except (OSError, ValueError):
+        # Pas encore de passage, ou fichier en cours d'écriture
+        return _state["last_run"]
+
+def status() -> Dict[str, Any]:
+    return {
+        "enabled": ARCHIVE_SCHEDULER,
+        "running": _running.locked(),
+        "next_run": _state["next_run"],
+        "interval_minutes": ARCHIVE_INTERVAL_MINUTES,
+        "hours": ARCHIVE_HOURS,
+        "after_days": ARCHIVE_AFTER_DAYS,
+        "batch_size": ARCHIVE_BATCH_SIZE,
+        "max_batches": ARCHIVE_MAX_BATCHES,
+        "runs": _state["runs"],
+        "skipped": _state["skipped"],
+        "last_run": _last_run(),
+    }
+
+async def _loop(hours: Tuple[int, int]):
+    while True:
+        next_run = next_run_at(datetime.now(), max(1, ARCHIVE_INTERVAL_MINUTES), hours)
+        _state["next_run"] = next_run.isoformat(timespec="seconds")
+        await asyncio.sleep(max(0.0, (next_run - datetime.now()).total_seconds()))
+        try:
+            await run("scheduler", pause=_BATCH_PAUSE)
+        except ArchiveBusy:
+            logger.info("archivage déjà en cours dans un autre worker, passage ignoré")
+        except Exception:
+            logger.exception("échec de l'archivage planifié")
+
+def start():
+    """Start the background scheduler (application startup)"""
+    global _task
+    if not ARCHIVE_SCHEDULER or _task is not None:
+        return
+    _task = asyncio.create_task(_loop(parse_hours(ARCHIVE_HOURS)), name="auto-archive")
+    logger.info("archivage planifié : toutes les %s min, heures %s", ARCHIVE_INTERVAL_MINUTES, ARCHIVE_HOURS)
+
+async def stop():
+    """Stop the scheduler and a pending follow-up (application shutdown); a run in progress is interrupted between two writes"""
+    global _task, _follow_up_task
+    for task in (_task, _follow_up_task):
+        if task is None:
+            continue
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    _task = _follow_up_task = None
+    _state["next_run"] = None
@@ -0,0 +1,305 @@
+"""
+Benchmark : agrégation du planning, boucles Python vs tableaux NumPy.
+
+Génère des commandes synthétiques (produits directs, formules, exclusions)
+et compare l'étape 5 du planning :
+  - l'ancien calcul : la boucle d'origine de routes/planning.py, recopiée
+    (détail de la commande et totaux du jour mis à jour ligne par ligne)
+  - le nouveau calcul : aggregate_commandes(), commande_details(), daily_totals()
+
+Vérifie que les deux produisent exactement le même JSON. Les quantités
+(0.1, 0.33, 0.05...) ne sont pas exactes en binaire : un ordre de sommation
+différent changerait les derniers chiffres.
+
+Lancement (depuis backend/) :
+    python -m benchmarks.bench_aggregation --commandes 5000
+"""
+import argparse
+import json
+import os
+import random
+import time
+import uuid
+from collections import defaultdict
+from datetime import date, timedelta
+
+# Aucun appel réseau n'est effectué : le client Supabase est seulement instancié
+os.environ.setdefault("SUPABASE_URL", "http://localhost:54321")
+os.environ.setdefault("SUPABASE_KEY", "bench.bench.bench")
+
+import numpy as np
+import planning_engine
+
+
+def generate(nb_commandes: int, seed: int = 1):
+    rnd = random.Random(seed)
+    produits = [str(uuid.UUID(int=i)) for i in range(1, 301)]
+    formules = [str(uuid.UUID(int=10000 + i)) for i in range(1, 41)]
+    compositions_index = {
+        formule_id: tuple(
+            (produit_id, rnd.choice([1, 2, 0.1, 0.33, 0.05]), rnd.choice(["pièces", "kg"]))
+            for produit_id in rnd.sample(produits, 12)
+        )
+        for formule_id in formules
+    }
+
+    commandes, commande_produits, commande_formules, exclusions = [], [], [], {}
+    for i in range(nb_commandes):
+        commande_id = str(uuid.UUID(int=10**6 + i))
+        commandes.append({
+            "id": commande_id,
+            "delivery_date": (date(2026, 1, 1) + timedelta(days=rnd.randint(0, 89))).isoformat(),
+        })
+        for formule_id in rnd.sample(formules, rnd.randint(1, 3)):
+            cf_id = len(commande_formules) + 1
+            commande_formules.append({
+                "id": cf_id, "commande_id": commande_id, "formule_id": formule_id,
+                "quantite_finale": rnd.randint(1, 80),
+            })
+            if rnd.random() < 0.3:
+                exclusions[cf_id] = frozenset(p for p, _, _ in rnd.sample(compositions_index[formule_id], 2))
+        for produit_id in rnd.sample(produits, rnd.randint(0, 6)):
+            commande_produits.append({
+                "commande_id": commande_id, "produit_id": produit_id,
+                "quantite": rnd.choice([1, 2, 0.1, 0.33]), "unite": "pièces",
+            })
+
+    commandes.sort(key=lambda c: c["delivery_date"])
+    produits_infos = {
+        produit_id: {"name": f"P{i}", "categorie": f"Cat{i % 7}", "type": rnd.choice(["Sucré", "Salé"])}
+        for i, produit_id in enumerate(produits)
+    }
+    # Lignes de formule_produits, comme les lisait la boucle d'origine
+    formule_produits_map = {
+        formule_id: [{"produit_id": p, "quantite": q, "unite": u} for p, q, u in items]
+        for formule_id, items in compositions_index.items()
+    }
+    return (
+        commandes,
+        planning_engine.group_by_commande(commande_produits),
+        planning_engine.group_by_commande(commande_formules),
+        formule_produits_map,
+        compositions_index,
+        exclusions,
+        produits_infos,
+    )
+
+
+def loops(commandes_filtrees, commande_produits_map, commande_formules_map, formule_produits_map, _compositions_index, exclusions, produits_infos):
+    """Étape 5 d'origine (routes/planning.py avant NumPy), recopiée ; seul ajout : les exclusions"""
+    categorie = "tous"
+    planning = defaultdict(lambda: {
+        "commandes": [],
+        "totaux": defaultdict(lambda: {
+            "quantite": 0,
+            "unite": "",
+            "nom": "",
+            "categorie": "",
+            "type": ""
+        })
+    })
+
+    for commande in commandes_filtrees:
+        commande_id = commande["id"]
+        delivery_date = commande["delivery_date"]
+        
+        commande_data = {
+            "id": commande_id,
+            "client": commande.get('nom_client', ''),
+            "heure": commande.get("delivery_hour", ""),
+            "couverts": commande.get("nombre_couverts", 0),
+            "notes": commande.get("notes", ""),
+            "produits": {}
+        }
+        
+        # ----------------------------------------
+        # 5a. PRODUITS DIRECTS
+        # ----------------------------------------
+        
+        produits_directs = commande_produits_map.get(commande_id, [])
+        
+        for cp in produits_directs:
+            produit_id = cp["produit_id"]
+            quantite = cp["quantite"]
+            unite = cp["unite"]
+            
+            prod_info = produits_infos.get(produit_id)
+            if not prod_info:
+                print(f"      ⚠️ Produit {produit_id} non trouvé")
+                continue
+
+            if categorie != "tous":
+                if prod_info["type"].lower() != categorie.lower():
+                    continue
+            
+            # Ajouter au dictionnaire de la commande
+            if produit_id in commande_data["produits"]:
+                commande_data["produits"][produit_id]["quantite"] += quantite
+                commande_data["produits"][produit_id]["source"] = "mixte"
+            else:
+                commande_data["produits"][produit_id] = {
+                    "nom": prod_info["name"],
+                    "quantite": quantite,
+                    "unite": unite,
+                    "categorie": prod_info["categorie"],
+                    "type": prod_info["type"],
+                    "source": "suppl"
+                }
+            
+            # Mettre à jour les totaux du jour
+            planning[delivery_date]["totaux"][produit_id]["quantite"] += quantite
+            planning[delivery_date]["totaux"][produit_id]["unite"] = unite
+            planning[delivery_date]["totaux"][produit_id]["nom"] = prod_info["name"]
+            planning[delivery_date]["totaux"][produit_id]["categorie"] = prod_info["categorie"]
+            planning[delivery_date]["totaux"][produit_id]["type"] = prod_info["type"]
+        
+        # ----------------------------------------
+        # 5b. PRODUITS VIA FORMULES
+        # ----------------------------------------
+        
+        formules_commande = commande_formules_map.get(commande_id, [])
+        
+        for cf in formules_commande:
+            formule_id = cf["formule_id"]
+            quantite_finale = cf["quantite_finale"]
+            
+            # Récupérer les produits de cette formule
+            formule_produits = formule_produits_map.get(formule_id, [])
+            
+            for fp in formule_produits:
+                produit_id = fp["produit_id"]
+                quantite_par_personne = fp["quantite"]
+                unite = fp["unite"]
+                quantite_totale = quantite_par_personne * quantite_finale
+                
+                # Seul ajout : les exclusions, apparues après cette version
+                if produit_id in exclusions.get(cf["id"], ()):
+                    continue
+                
+                prod_info = produits_infos.get(produit_id)
+                if not prod_info:
+                    print(f"      ⚠️ Produit {produit_id} non trouvé")
+                    continue
+
+                if categorie != "tous":
+                    if prod_info["type"].lower() != categorie.lower():
+                        continue
+                
+                # Ajouter au dictionnaire de la commande
+                if produit_id in commande_data["produits"]:
+                    commande_data["produits"][produit_id]["quantite"] += quantite_totale
+                    commande_data["produits"][produit_id]["source"] = "mixte"
+                else:
+                    commande_data["produits"][produit_id] = {
+                        "nom": prod_info["name"],
+                        "quantite": quantite_totale,
+                        "unite": unite,
+                        "categorie": prod_info["categorie"],
+                        "type": prod_info["type"],
+                        "source": "formule"
+                    }
+                
+                # Mettre à jour les totaux du jour
+                planning[delivery_date]["totaux"][produit_id]["quantite"] += quantite_totale
+                planning[delivery_date]["totaux"][produit_id]["unite"] = unite
+                planning[delivery_date]["totaux"][produit_id]["nom"] = prod_info["name"]
+                planning[delivery_date]["totaux"][produit_id]["categorie"] = prod_info["categorie"]
+                planning[delivery_date]["totaux"][produit_id]["type"] = prod_info["type"]
+        
+        # Ajouter la commande au planning
+        planning[delivery_date]["commandes"].append(commande_data)
+
+    details = [c["produits"] for jour in planning.values() for c in jour["commandes"]]
+    return details, {day: dict(jour["totaux"]) for day, jour in planning.items()}
+
+
+def vectorized(commandes, commande_produits_map, commande_formules_map, _formule_produits_map, compositions_index, exclusions, produits_infos):
+    """Étape 5 avec aggregate_commandes() et daily_totals()"""
+    aggregation = planning_engine.aggregate_commandes(
+        commandes, commande_produits_map, commande_formules_map, compositions_index, exclusions
+    )
+    retenu = planning_engine.produits_retenus(aggregation, produits_infos, "tous")
+    details = planning_engine.commande_details(aggregation, len(commandes), produits_infos, retenu)
+    totaux = {}
+    for day, produits in planning_engine.daily_totals(
+        aggregation, [c["delivery_date"] for c in commandes], retenu
+    ).items():
+        totaux[day] = {}
+        for produit_id, (quantite, unite) in produits.items():
+            prod_info = produits_infos[produit_id]
+            totaux[day][produit_id] = {
+                "quantite": quantite,
+                "unite": unite,
+                "nom": prod_info["name"],
+                "categorie": prod_info["categorie"],
+                "type": prod_info["type"]
+            }
+    return details, totaux
+
+
+def loops_totals(commandes_filtrees, commande_produits_map, commande_formules_map, formule_produits_map, _compositions_index, exclusions, produits_infos):
+    """Agrégation seule, avant : la boucle d'origine réduite aux totaux du jour"""
+    totaux = defaultdict(lambda: defaultdict(lambda: [0, ""]))
+    for commande in commandes_filtrees:
+        commande_id = commande["id"]
+        delivery_date = commande["delivery_date"]
+        for cp in commande_produits_map.get(commande_id, []):
+            total = totaux[delivery_date][cp["produit_id"]]
+            total[0] += cp["quantite"]
+            total[1] = cp["unite"]
+        for cf in commande_formules_map.get(commande_id, []):
+            for fp in formule_produits_map.get(cf["formule_id"], []):
+                if fp["produit_id"] in exclusions.get(cf["id"], ()):
+                    continue
+                total = totaux[delivery_date][fp["produit_id"]]
+                total[0] += fp["quantite"] * cf["quantite_finale"]
+                total[1] = fp["unite"]
+    return {day: {p: tuple(t) for p, t in produits.items()} for day, produits in totaux.items()}
+
+
+def vectorized_totals(commandes, commande_produits_map, commande_formules_map, _formule_produits_map, compositions_index, exclusions, produits_infos):
+    """Agrégation seule, après : index compilé, aggregate_commandes() et daily_totals()"""
+    aggregation = planning_engine.aggregate_commandes(
+        commandes, commande_produits_map, commande_formules_map, compositions_index, exclusions
+    )
+    keep = np.ones(len(aggregation["sums"]), dtype=bool)
+    return planning_engine.daily_totals(aggregation, [c["delivery_date"] for c in commandes], keep)
+
+
+def best_of(function, data, repeat: int):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(*data)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--commandes", type=int, default=5000, help="Nombre de commandes générées")
+    parser.add_argument("--repeat", type=int, default=5, help="Mesures par variante (meilleure gardée)")
+    args = parser.parse_args()
+
+    data = generate(args.commandes)
+    lignes = sum(len(v) for v in data[1].values()) + sum(
+        len(data[4][cf["formule_id"]]) for cfs in data[2].values() for cf in cfs
+    )
+    print(f"{args.commandes} commandes, {lignes} lignes produit")
+
+    for label, avant, apres in (
+        ("agrégation (totaux du jour)", loops_totals, vectorized_totals),
+        ("étape 5 complète (détail + totaux)", loops, vectorized),
+    ):
+        temps_boucles, resultat_boucles = best_of(avant, data, args.repeat)
+        temps_vectorise, resultat_vectorise = best_of(apres, data, args.repeat)
+        # Mêmes valeurs, mêmes types (int / float) et même ordre des clés : même JSON
+        identique = json.dumps(resultat_boucles) == json.dumps(resultat_vectorise)
+        print(f"  {label}")
+        print(f"    boucles Python  {temps_boucles * 1000:8.1f} ms")
+        print(f"    NumPy           {temps_vectorise * 1000:8.1f} ms | x{temps_boucles / temps_vectorise:.1f}")
+        print(f"    résultats identiques : {'oui' if identique else 'NON'}")
+
+
+if __name__ == "__main__":
+    main()
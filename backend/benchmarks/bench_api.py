@@ -0,0 +1,206 @@
+"""
+Benchmark : planning, listes et détail de commande, de bout en bout.
+
+Charge un jeu de données synthétique (benchmarks/dataset.py) dans la base en
+mémoire (DB_BACKEND=memory) et appelle les endpoints en processus, à travers
+toute l'application (middlewares, routes, caches, sérialisation). Pour chaque
+scénario :
+  - latence p50 / p95 / p99 et moyenne
+  - appels à la base par requête
+  - pic d'allocations mémoire par requête (tracemalloc, mesuré à part)
+  - taille de la réponse
+
+Les résultats sont comparés à une référence enregistrée (baseline.json, par
+échelle) : écart de latence au-delà de --tolerance ou appels à la base en
+plus → régression signalée (code de sortie 1 avec --check).
+
+Lancement (depuis backend/) :
+    python -m benchmarks.bench_api --scale medium
+    python -m benchmarks.bench_api --scale medium --save-baseline
+    python -m benchmarks.bench_api --scale large --iterations 10
+
+La référence enregistrée dépend de la machine : la régénérer (--save-baseline)
+avant de comparer sur une autre machine.
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+# Jamais de Supabase ici : la base en mémoire est imposée avant tout import de l'API
+os.environ["DB_BACKEND"] = "memory"
+
+from fastapi.testclient import TestClient
+from benchmarks.dataset import generate, scale_size
+from cache import cache
+import compositions
+import database
+import main
+import metrics
+import totals
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# Mesure de l'application, pas de la compression (voir compression.py)
+HEADERS = {"Accept-Encoding": "identity"}
+
+
+def cold_caches():
+    """Catalogue, compositions, exclusions et totaux matérialisés vidés"""
+    cache.clear()
+    compositions.invalidate_index()
+    compositions.invalidate_exclusions(*list(compositions._masks))
+    totals.invalidate_all()
+
+
+def scenarios(tables, today: date):
+    """(nom, fonction (itération) → (url, paramètres), caches vidés avant chaque appel)"""
+    semaine = {"date_debut": today.isoformat(), "date_fin": (today + timedelta(days=6)).isoformat()}
+    mois = {"date_debut": (today - timedelta(days=14)).isoformat(), "date_fin": (today + timedelta(days=14)).isoformat()}
+    actives = [c["id"] for c in tables["carnet_commande"] if not c["archived"]] or [tables["carnet_commande"][0]["id"]]
+    return [
+        ("planning semaine", lambda i: ("/planning/production", semaine), False),
+        ("planning 4 semaines, caches froids", lambda i: ("/planning/production", mois), True),
+        ("liste commandes, page par défaut", lambda i: ("/commandes/", {}), False),
+        ("liste commandes, page de 50", lambda i: ("/commandes/", {"limit": 50}), False),
+        ("archives, page de 50 + composition", lambda i: ("/commandes/archived", {"limit": 50, "include": "composition"}), False),
+        ("détail commande", lambda i: (f"/commandes/{actives[i % len(actives)]}/full", {}), False),
+    ]
+
+
+def percentile(values, p: float) -> float:
+    """Nearest-rank percentile of sorted values"""
+    index = max(0, min(len(values) - 1, round(p / 100 * len(values) + 0.5) - 1))
+    return values[index]
+
+
+def run_scenario(client: TestClient, request, cold: bool, iterations: int, warmup: int, alloc_runs: int):
+    def call(i):
+        url, params = request(i)
+        if cold:
+            cold_caches()
+        response = client.get(url, params=params, headers=HEADERS)
+        response.raise_for_status()
+        return response
+
+    for i in range(warmup):
+        call(i)
+
+    latencies, calls_before = [], metrics.backend_calls.total()
+    size = 0
+    for i in range(iterations):
+        start = time.perf_counter()
+        response = call(i)
+        latencies.append((time.perf_counter() - start) * 1000)
+        size = len(response.content)
+    backend_calls = (metrics.backend_calls.total() - calls_before) / iterations
+
+    peaks = []
+    tracemalloc.start()
+    try:
+        for i in range(alloc_runs):
+            tracemalloc.reset_peak()
+            current, _ = tracemalloc.get_traced_memory()
+            call(i)
+            peaks.append(tracemalloc.get_traced_memory()[1] - current)
+    finally:
+        tracemalloc.stop()
+
+    latencies.sort()
+    return {
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+        "mean_ms": round(statistics.fmean(latencies), 2),
+        "backend_calls": round(backend_calls, 2),
+        "alloc_peak_kb": round(max(peaks) / 1024, 1) if peaks else None,
+        "response_kb": round(size / 1024, 1),
+    }
+
+
+def compare(result, reference, tolerance: float):
+    """Regressions of one scenario against its reference"""
+    regressions = []
+    for key in ("p50_ms", "p95_ms"):
+        if reference.get(key) and result[key] > reference[key] * (1 + tolerance):
+            regressions.append(f"{key} {reference[key]} → {result[key]}")
+    if reference.get("backend_calls") is not None and result["backend_calls"] > reference["backend_calls"]:
+        regressions.append(f"appels base {reference['backend_calls']} → {result['backend_calls']}")
+    return regressions
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", default="medium", help="small, medium, large ou un nombre de commandes")
+    parser.add_argument("--seed", type=int, default=1, help="Graine du jeu de données")
+    parser.add_argument("--iterations", type=int, default=30, help="Requêtes mesurées par scénario")
+    parser.add_argument("--warmup", type=int, default=3, help="Requêtes de mise en route (non mesurées)")
+    parser.add_argument("--alloc-runs", type=int, default=3, help="Requêtes mesurées sous tracemalloc")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Écart de latence toléré (0.25 = +25 %%)")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="Fichier de référence")
+    parser.add_argument("--save-baseline", action="store_true", help="Enregistrer les résultats comme référence")
+    parser.add_argument("--check", action="store_true", help="Code de sortie 1 en cas de régression")
+    args = parser.parse_args()
+
+    # Une ligne de log par requête fausserait les mesures
+    logging.getLogger("omb").setLevel(logging.WARNING)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    # Données générées autour d'aujourd'hui : les plages mesurées gardent le même contenu
+    today = date.today()
+    tables = generate(scale_size(args.scale), seed=args.seed, today=today)
+    database.get_supabase_client().reset(tables)
+    cold_caches()
+    print(f"échelle {args.scale} : {len(tables['carnet_commande'])} commandes, "
+          f"{len(tables['commande_formules'])} formules commandées, {len(tables['produits'])} produits")
+
+    baselines = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baselines = json.load(f)
+    reference = baselines.get(args.scale, {}).get("scenarios", {})
+
+    results, regressions = {}, []
+    with TestClient(main.app) as client:
+        for name, request, cold in scenarios(tables, today):
+            result = results[name] = run_scenario(client, request, cold, args.iterations, args.warmup, args.alloc_runs)
+            print(f"  {name}")
+            print(f"    p50 {result['p50_ms']:8.2f} ms | p95 {result['p95_ms']:8.2f} ms | p99 {result['p99_ms']:8.2f} ms"
+                  f" | {result['backend_calls']:g} appels base | pic alloc {result['alloc_peak_kb']} Ko"
+                  f" | réponse {result['response_kb']} Ko")
+            if name in reference:
+                ref = reference[name]
+                found = compare(result, ref, args.tolerance)
+                delta = (result["p50_ms"] / ref["p50_ms"] - 1) * 100 if ref.get("p50_ms") else 0
+                print(f"    référence p50 {ref['p50_ms']:.2f} ms ({delta:+.0f} %)"
+                      + (f" | RÉGRESSION : {', '.join(found)}" if found else ""))
+                regressions += [f"{name} : {item}" for item in found]
+
+    if args.save_baseline:
+        baselines[args.scale] = {
+            "recorded": date.today().isoformat(),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "iterations": args.iterations,
+            "scenarios": results,
+        }
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baselines, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+        print(f"référence enregistrée : {args.baseline} ({args.scale})")
+    elif not reference:
+        print("aucune référence pour cette échelle (--save-baseline pour l'enregistrer)")
+
+    if regressions:
+        print(f"{len(regressions)} régression(s)")
+        if args.check:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main_cli()
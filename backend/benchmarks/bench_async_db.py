@@ -0,0 +1,77 @@
+"""
+Benchmark : appels Supabase bloquants vs déportés dans le pool de threads.
+
+Simule des requêtes PostgREST lentes (latence réseau fixe) et compare :
+  - l'ancien comportement : `query.execute()` appelé directement dans un handler async
+  - le nouveau comportement : `await execute(query)` (pool de threads borné)
+
+Mesure le débit des requêtes lentes et la latence d'une requête "légère"
+(type /health) lancée pendant la charge, qui révèle le blocage de la boucle.
+
+Lancement (depuis backend/) :
+    python -m benchmarks.bench_async_db --requests 64 --latency 0.05
+"""
+import argparse
+import asyncio
+import os
+import time
+
+# Aucun appel réseau n'est effectué : le client Supabase est seulement instancié
+os.environ.setdefault("SUPABASE_URL", "http://localhost:54321")
+os.environ.setdefault("SUPABASE_KEY", "bench.bench.bench")
+
+from config import DB_MAX_WORKERS
+from database import execute
+
+
+class SlowQuery:
+    """Imite un query builder Supabase dont l'exécution bloque sur le réseau."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def execute(self):
+        time.sleep(self.latency)
+        return []
+
+
+async def blocking_handler(latency: float):
+    return SlowQuery(latency).execute()
+
+
+async def offloaded_handler(latency: float):
+    return await execute(SlowQuery(latency))
+
+
+async def probe_latency(delay: float) -> float:
+    """Retard subi par un handler trivial qui devait s'exécuter pendant la charge."""
+    expected = time.perf_counter() + delay
+    await asyncio.sleep(delay)
+    return time.perf_counter() - expected
+
+
+async def run(handler, requests: int, latency: float):
+    start = time.perf_counter()
+    probe = asyncio.create_task(probe_latency(latency / 2))
+    await asyncio.gather(*(handler(latency) for _ in range(requests)))
+    elapsed = time.perf_counter() - start
+    return elapsed, await probe
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=64, help="Requêtes simultanées")
+    parser.add_argument("--latency", type=float, default=0.05, help="Latence simulée d'un appel (s)")
+    args = parser.parse_args()
+
+    print(f"{args.requests} requêtes simultanées, latence {args.latency * 1000:.0f} ms, DB_MAX_WORKERS={DB_MAX_WORKERS}")
+    for label, handler in (("bloquant", blocking_handler), ("pool de threads", offloaded_handler)):
+        elapsed, probe = asyncio.run(run(handler, args.requests, args.latency))
+        print(
+            f"  {label:<16} {elapsed:7.3f} s | {args.requests / elapsed:8.1f} req/s "
+            f"| latence /health pendant la charge : {probe * 1000:8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""
+Benchmark : sérialisation des réponses JSON, trois passes Python vs orjson.
+
+Construit des réponses volumineuses (planning de production, liste de
+commandes avec composition) et compare le temps CPU par réponse :
+  - l'ancien chemin : serialize_commande() sur chaque ligne (listes), puis
+    jsonable_encoder() appliqué par FastAPI, puis CustomJSONResponse.render()
+    (jsonable_encoder() à nouveau et json.dumps() avec UUIDEncoder)
+  - le chemin par défaut : jsonable_encoder() appliqué par FastAPI, puis
+    ORJSONResponse.render()
+  - le chemin rapide : json_response() (orjson seul, planning et listes)
+
+Vérifie que les trois produisent le même JSON.
+
+Lancement (depuis backend/) :
+    python -m benchmarks.bench_json --commandes 5000
+"""
+import argparse
+import json
+import os
+import random
+import time
+import uuid
+from datetime import date, datetime, timedelta
+from uuid import UUID
+
+# Aucun appel réseau n'est effectué : le client Supabase est seulement instancié
+os.environ.setdefault("SUPABASE_URL", "http://localhost:54321")
+os.environ.setdefault("SUPABASE_KEY", "bench.bench.bench")
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from benchmarks.bench_aggregation import generate, vectorized
+from responses import ORJSONResponse, json_response
+
+
+# ============================================
+# ANCIEN CHEMIN (main.py et routes/commandes.py avant orjson)
+# ============================================
+
+class UUIDEncoder(json.JSONEncoder):
+    def default(self, obj):
+        if isinstance(obj, UUID):
+            return str(obj)
+        if isinstance(obj, (date, datetime)):
+            return obj.isoformat()
+        return json.JSONEncoder.default(self, obj)
+
+class CustomJSONResponse(JSONResponse):
+    def render(self, content) -> bytes:
+        return json.dumps(
+            jsonable_encoder(content),
+            cls=UUIDEncoder,
+            ensure_ascii=False,
+        ).encode("utf-8")
+
+def serialize_commande(commande):
+    if isinstance(commande, dict):
+        result = {}
+        for key, value in commande.items():
+            if isinstance(value, (date, datetime)):
+                result[key] = value.isoformat()
+            elif isinstance(value, UUID):
+                result[key] = str(value)
+            else:
+                result[key] = value
+        return result
+    return commande
+
+
+def old_list(rows):
+    content = [serialize_commande(row) for row in rows]
+    return CustomJSONResponse(jsonable_encoder(content)).body
+
+def old_planning(result):
+    return CustomJSONResponse(jsonable_encoder(result)).body
+
+def default_path(content):
+    return ORJSONResponse(jsonable_encoder(content)).body
+
+def fast_path(content):
+    return json_response(content).body
+
+
+# ============================================
+# RÉPONSES SYNTHÉTIQUES
+# ============================================
+
+def planning_payload(nb_commandes: int):
+    """Même forme que GET /planning/production"""
+    data = generate(nb_commandes)
+    commandes, produits_infos = data[0], data[5]
+    details, totaux = vectorized(*data)
+    rnd = random.Random(2)
+    planning = {}
+    for commande, produits in zip(commandes, details):
+        jour = planning.setdefault(commande["delivery_date"], {"commandes": [], "totaux": totaux[commande["delivery_date"]]})
+        jour["commandes"].append({
+            "id": commande["id"],
+            "client": f"Client {rnd.randint(1, 500)}",
+            "heure": f"{rnd.randint(7, 14):02d}:{rnd.choice(['00', '30'])}:00",
+            "couverts": rnd.randint(2, 80),
+            "notes": rnd.choice(["", "Sans gluten", "Livraison côté cour"]),
+            "produits": produits,
+        })
+    return {
+        "periode": {"debut": commandes[0]["delivery_date"], "fin": commandes[-1]["delivery_date"]},
+        "commandes_count": len(commandes),
+        "planning": planning,
+        "commandes_non_validees": [],
+    }
+
+def list_payload(nb_commandes: int):
+    """Même forme que GET /commandes/?include=composition (lignes PostgREST)"""
+    rnd = random.Random(3)
+    rows = []
+    for i in range(nb_commandes):
+        commande_id = str(uuid.UUID(int=10**6 + i))
+        rows.append({
+            "id": commande_id,
+            "nom_client": f"Client {rnd.randint(1, 500)}",
+            "nombre_couverts": rnd.randint(2, 80),
+            "service": rnd.random() < 0.2,
+            "delivery_date": (date(2026, 1, 1) + timedelta(days=rnd.randint(0, 89))).isoformat(),
+            "delivery_hour": "10:30:00",
+            "notes": None,
+            "avec_service": True,
+            "validated": True,
+            "archived": False,
+            "archived_at": None,
+            "formules": [
+                {
+                    "id": i * 3 + k, "commande_id": commande_id,
+                    "formule_id": str(uuid.UUID(int=10000 + rnd.randint(1, 40))),
+                    "quantite_recommandee": 0, "quantite_finale": rnd.randint(1, 80),
+                    "formule_name": "Brunch Salé", "type_formule": "Brunch",
+                    "produits_exclus": [],
+                    "composition": [
+                        {"produit_id": str(uuid.UUID(int=p)), "produit_name": f"P{p}",
+                         "quantite": 1.5, "unite": "pièces", "quantite_totale": 30.0}
+                        for p in rnd.sample(range(1, 301), 12)
+                    ],
+                }
+                for k in range(rnd.randint(1, 3))
+            ],
+            "produits": [],
+        })
+    return rows
+
+
+def cpu_per_response(function, content, repeat: int):
+    """Meilleur temps CPU (process_time) d'une sérialisation, et le JSON produit"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.process_time()
+        body = function(content)
+        best = min(best, time.process_time() - start)
+    return best, body
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--commandes", type=int, default=5000, help="Nombre de commandes générées")
+    parser.add_argument("--repeat", type=int, default=5, help="Mesures par variante (meilleure gardée)")
+    args = parser.parse_args()
+
+    for label, content, ancien in (
+        ("planning de production", planning_payload(args.commandes), old_planning),
+        ("liste de commandes (include=composition)", list_payload(args.commandes), old_list),
+    ):
+        temps_ancien, json_ancien = cpu_per_response(ancien, content, args.repeat)
+        temps_defaut, json_defaut = cpu_per_response(default_path, content, args.repeat)
+        temps_rapide, json_rapide = cpu_per_response(fast_path, content, args.repeat)
+        identique = json.loads(json_ancien) == json.loads(json_defaut) == json.loads(json_rapide)
+        print(f"  {label} ({len(json_rapide) / 1e6:.1f} Mo)")
+        print(f"    trois passes               {temps_ancien * 1000:8.1f} ms CPU")
+        print(f"    jsonable_encoder + orjson  {temps_defaut * 1000:8.1f} ms CPU | x{temps_ancien / temps_defaut:.1f}")
+        print(f"    json_response (orjson)     {temps_rapide * 1000:8.1f} ms CPU | x{temps_ancien / temps_rapide:.1f}")
+        print(f"    JSON identique : {'oui' if identique else 'NON'}")
+
+
+if __name__ == "__main__":
+    main()
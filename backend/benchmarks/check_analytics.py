@@ -0,0 +1,139 @@
+"""
+Vérification : cumuls d'analyse incrémentaux = reconstruction complète.
+
+Charge un jeu de données synthétique (benchmarks/dataset.py) dans la base en
+mémoire (DB_BACKEND=memory), remet une partie des archives en commandes non
+archivées (un arriéré), puis enchaîne des passages d'archivage complets
+(archiver.run : lots, mise à jour incrémentale des cumuls, export en stockage
+froid si pyarrow est installé). Les commandes archivées pendant un passage
+sont plus récentes que ses cumuls : elles ne comptent qu'au passage suivant
+et ne doivent partir en Parquet qu'après. À la fin, les cumuls obtenus
+passage après passage sont comparés à ceux de analytics.rebuild() :
+commandes, couverts et quantités de chaque semaine et de chaque mois.
+
+Lancement (depuis backend/) :
+    python -m benchmarks.check_analytics
+    python -m benchmarks.check_analytics --scale 2000 --passes 8
+
+Code de sortie 1 en cas d'écart.
+"""
+import argparse
+import asyncio
+import copy
+import logging
+import os
+import random
+import tempfile
+import time
+from datetime import date
+
+# Jamais de Supabase ici : base en mémoire et fichiers temporaires imposés avant
+# tout import de l'API. Un lot par passage pour étaler l'arriéré ; un délai
+# d'une seconde avant de compter une archive (au lieu de 60) pour enchaîner.
+_WORKDIR = tempfile.mkdtemp(prefix="omb-check-analytics-")
+os.environ.update({
+    "DB_BACKEND": "memory",
+    "ARCHIVE_SCHEDULER": "false",
+    "ARCHIVE_LOCK_FILE": os.path.join(_WORKDIR, "archive.lock"),
+    "ARCHIVE_BATCH_SIZE": "100",
+    "ARCHIVE_MAX_BATCHES": "1",
+    "ANALYTICS_FILE": os.path.join(_WORKDIR, "analytics.json"),
+    "ANALYTICS_LAG_SECONDS": "1",
+    "VERSIONS_FILE": os.path.join(_WORKDIR, "versions.json"),
+    "COLD_STORAGE_AFTER_DAYS": "3",
+    "COLD_STORAGE_BATCH_SIZE": "100",
+})
+try:
+    import pyarrow  # noqa: F401
+    os.environ["COLD_STORAGE_DIR"] = os.path.join(_WORKDIR, "cold")
+except ImportError:
+    pass
+
+from benchmarks.dataset import generate, scale_size
+from config import ARCHIVE_AFTER_DAYS, ANALYTICS_LAG_SECONDS
+import analytics
+import archiver
+import cold_storage
+import database
+
+
+def backlog(tables, share: float, seed: int) -> int:
+    """Unarchive `share` of the archived commandes: delivered, waiting for a run"""
+    rnd = random.Random(seed)
+    count = 0
+    for commande in tables["carnet_commande"]:
+        if commande["archived"] and rnd.random() < share:
+            commande["archived"] = False
+            commande["archived_at"] = None
+            count += 1
+    return count
+
+
+def compare(incremental, rebuilt, tolerance: float = 1e-6):
+    """
+    Differences between two rollups. The unite kept for a produit is the one
+    of the last commande read, which depends on the reading order: not compared.
+    """
+    ecarts = []
+    for kind in analytics.PERIODS:
+        for key in sorted(set(incremental[kind]) | set(rebuilt[kind])):
+            obtenu, attendu = incremental[kind].get(key), rebuilt[kind].get(key)
+            if obtenu is None or attendu is None:
+                ecarts.append(f"{kind} {key} : {'absent' if obtenu is None else 'en trop'} dans les cumuls incrémentaux")
+                continue
+            for field in ("commandes", "couverts"):
+                if obtenu[field] != attendu[field]:
+                    ecarts.append(f"{kind} {key} {field} : {obtenu[field]} au lieu de {attendu[field]}")
+            for line in set(obtenu["produits"]) | set(attendu["produits"]):
+                got, expected = obtenu["produits"].get(line), attendu["produits"].get(line)
+                if got is None or expected is None or abs(got[0] - expected[0]) > tolerance or got[2] != expected[2]:
+                    ecarts.append(f"{kind} {key} {line} : {got and got[0]} au lieu de {expected and expected[0]}")
+    return ecarts
+
+
+async def check(commandes: int, passes: int, seed: int) -> int:
+    tables = generate(commandes, seed=seed, today=date.today())
+    pending = backlog(tables, 0.5, seed)
+    database.get_supabase_client().reset(tables)
+    print(f"{len(tables['carnet_commande'])} commandes, {pending} à archiver (livrées depuis plus de {ARCHIVE_AFTER_DAYS} jours)")
+    if not cold_storage.ENABLED:
+        print("pyarrow absent : passages sans export en stockage froid")
+
+    for run in range(1, passes + 1):
+        stats = await archiver.run("check")
+        print(
+            f"passage {run} : {stats['archived']} archivée(s), "
+            f"{stats['analytics']['commandes']} ajoutée(s) aux cumuls ({stats['analytics']['mode']}), "
+            f"{stats.get('cold_storage', {}).get('exported', 0)} exportée(s)"
+        )
+        # Les archives de ce passage deviennent visibles pour le suivant
+        time.sleep(ANALYTICS_LAG_SECONDS + 0.1)
+    await analytics.update()
+
+    incremental = copy.deepcopy(analytics._load())
+    await analytics.rebuild()
+    rebuilt = analytics._load()
+    total = sum(period["commandes"] for period in rebuilt["month"].values())
+    ecarts = compare(incremental, rebuilt)
+    if ecarts:
+        print(f"{len(ecarts)} écart(s) entre les cumuls incrémentaux et la reconstruction :")
+        for ecart in ecarts[:20]:
+            print(f"  {ecart}")
+        return 1
+    print(f"Cumuls incrémentaux identiques à la reconstruction ({total} commandes comptées)")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", default="medium", help="small, medium, large ou un nombre de commandes")
+    parser.add_argument("--passes", type=int, default=6, help="Passages d'archivage")
+    parser.add_argument("--seed", type=int, default=1, help="Graine du générateur")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    raise SystemExit(asyncio.run(check(scale_size(args.scale), args.passes, args.seed)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+Jeu de données synthétique pour les benchmarks (base en mémoire).
+
+Génère, à partir d'une graine, un catalogue (catégories, types, unités,
+produits), des formules et leurs compositions, et des commandes réparties
+autour d'aujourd'hui avec leurs formules, exclusions et produits directs.
+Même graine et même échelle → mêmes données.
+
+Échelles prédéfinies : small (10 commandes), medium (1 000), large (50 000).
+
+Écrire un fichier de fixtures utilisable avec DB_BACKEND=memory (depuis backend/) :
+    python -m benchmarks.dataset --scale medium --output /tmp/omb-medium.json
+    DB_BACKEND=memory DB_FIXTURES=/tmp/omb-medium.json python main.py
+"""
+import argparse
+import json
+import random
+import uuid
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional
+
+SCALES = {"small": 10, "medium": 1000, "large": 50000}
+
+# Les commandes sont réparties sur [aujourd'hui - PAST_DAYS, aujourd'hui + FUTURE_DAYS]
+PAST_DAYS = 60
+FUTURE_DAYS = 30
+
+_CATEGORIES = ["Boissons", "Fruits", "Salé", "Viennoiseries", "Pâtisseries", "Pains", "Crèmerie"]
+_TYPES = ["Sucré", "Salé", "Boisson"]
+_UNITES = ["pièces", "kg", "L", "portions"]
+_QUANTITES = {"pièces": [1, 2, 3], "kg": [0.05, 0.08, 0.1, 0.15], "L": [0.2, 0.25, 0.33], "portions": [1, 2]}
+_CLIENTS = [
+    "Agence", "Cabinet", "Studio", "Mairie", "Famille", "Atelier", "Galerie",
+    "Start-up", "École", "Hôtel", "Banque", "Association",
+]
+_NOTES = [None, None, None, "Sans gluten pour 2 personnes", "Livraison par l'entrée de service", "Allergie fruits à coque"]
+
+def _uuid(rnd: random.Random) -> str:
+    return str(uuid.UUID(int=rnd.getrandbits(128), version=4))
+
+def generate(
+    commandes: int,
+    seed: int = 1,
+    today: Optional[date] = None,
+    produits: int = 120,
+    formules: int = 24,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Tables of the synthetic dataset, as memory_db.MemoryClient takes them"""
+    rnd = random.Random(seed)
+    today = today or date.today()
+
+    categories = [{"id": i, "name": name} for i, name in enumerate(_CATEGORIES, 1)]
+    types = [{"id": i, "name": name} for i, name in enumerate(_TYPES, 1)]
+    unite = [{"id": i, "nom": name} for i, name in enumerate(_UNITES, 1)]
+
+    produits_rows, unites = [], {}
+    for i in range(produits):
+        produit_id = _uuid(rnd)
+        unites[produit_id] = rnd.choice(_UNITES)
+        produits_rows.append({
+            "id": produit_id,
+            "name": f"Produit {i + 1:03d}",
+            "categorie_id": rnd.choice([*range(1, len(categories) + 1), None]),
+            "type_id": rnd.randint(1, len(types)),
+        })
+
+    formules_rows, formule_produits, compositions = [], [], {}
+    for i in range(formules):
+        formule_id = _uuid(rnd)
+        formules_rows.append({
+            "id": formule_id,
+            "name": f"Formule {i + 1:02d}",
+            "nombre_couverts": 1,
+            "type_formule": rnd.choice(["Brunch", "Brunch", "Non-Brunch"]),
+        })
+        compositions[formule_id] = []
+        for produit in rnd.sample(produits_rows, rnd.randint(6, 14)):
+            unite_produit = unites[produit["id"]]
+            formule_produits.append({
+                "id": len(formule_produits) + 1,
+                "formule_id": formule_id,
+                "produit_id": produit["id"],
+                "quantite": rnd.choice(_QUANTITES[unite_produit]),
+                "unite": unite_produit,
+            })
+            compositions[formule_id].append(produit["id"])
+
+    carnet_commande, commande_formules, commande_produits, exclusions = [], [], [], []
+    archive_before = today - timedelta(days=2)
+    for _ in range(commandes):
+        commande_id = _uuid(rnd)
+        delivery_date = today + timedelta(days=rnd.randint(-PAST_DAYS, FUTURE_DAYS))
+        archived = delivery_date < archive_before
+        couverts = rnd.choice([6, 8, 10, 12, 15, 20, 25, 30, 40, 60, 80])
+        carnet_commande.append({
+            "id": commande_id,
+            "nom_client": f"{rnd.choice(_CLIENTS)} {rnd.randint(1, 400)}",
+            "nombre_couverts": couverts,
+            "service": rnd.random() < 0.2,
+            "delivery_date": delivery_date.isoformat(),
+            "delivery_hour": f"{rnd.randint(7, 13):02d}:{rnd.choice(['00', '15', '30', '45'])}:00",
+            "notes": rnd.choice(_NOTES),
+            "avec_service": rnd.random() < 0.7,
+            "validated": rnd.random() < 0.9,
+            "archived": archived,
+            "archived_at": f"{(delivery_date + timedelta(days=2)).isoformat()}T06:00:00" if archived else None,
+        })
+        for formule in rnd.sample(formules_rows, rnd.choice([1, 1, 1, 2, 2, 3])):
+            commande_formule_id = len(commande_formules) + 1
+            commande_formules.append({
+                "id": commande_formule_id,
+                "commande_id": commande_id,
+                "formule_id": formule["id"],
+                "quantite_recommandee": couverts,
+                "quantite_finale": max(1, couverts + rnd.choice([0, 0, 0, 2, -2, 5])),
+            })
+            if rnd.random() < 0.2:
+                for produit_id in rnd.sample(compositions[formule["id"]], rnd.randint(1, 2)):
+                    exclusions.append({
+                        "id": len(exclusions) + 1,
+                        "commande_formule_id": commande_formule_id,
+                        "produit_id": produit_id,
+                    })
+        for produit in rnd.sample(produits_rows, rnd.choice([0, 0, 0, 1, 2, 4])):
+            unite_produit = unites[produit["id"]]
+            commande_produits.append({
+                "id": len(commande_produits) + 1,
+                "commande_id": commande_id,
+                "produit_id": produit["id"],
+                "quantite": rnd.choice(_QUANTITES[unite_produit]) * rnd.choice([5, 10, 20]),
+                "unite": unite_produit,
+            })
+
+    return {
+        "categories": categories,
+        "types": types,
+        "unite": unite,
+        "produits": produits_rows,
+        "formules": formules_rows,
+        "formule_produits": formule_produits,
+        "carnet_commande": carnet_commande,
+        "commande_formules": commande_formules,
+        "commande_produits": commande_produits,
+        "commande_formule_exclusions": exclusions,
+    }
+
+def scale_size(value: str) -> int:
+    """"medium" or "1000" → number of commandes"""
+    return SCALES[value] if value in SCALES else int(value)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", default="medium", help="small, medium, large ou un nombre de commandes")
+    parser.add_argument("--seed", type=int, default=1, help="Graine du générateur")
+    parser.add_argument("--output", required=True, help="Fichier de fixtures à écrire")
+    args = parser.parse_args()
+
+    today = date.today()
+    tables = generate(scale_size(args.scale), seed=args.seed, today=today)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({"anchor": today.isoformat(), "tables": tables}, f, ensure_ascii=False)
+    print(", ".join(f"{name}: {len(rows)}" for name, rows in tables.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+"""
+Test de charge : N tablettes simultanées sur un worker de l'API.
+
+Chaque tablette est une tâche asyncio qui enchaîne, avec un temps de
+réflexion aléatoire, les actions d'une journée de service :
+  - rafraîchir la liste des commandes (l'essentiel du trafic)
+  - ouvrir le détail d'une commande
+  - créer une commande avec sa composition
+  - modifier une commande (détail puis enregistrement de la composition)
+  - consulter les archives ou le catalogue
+  - générer le planning de la semaine (rare)
+
+Deux modes :
+  - en processus (défaut) : l'application tourne dans la boucle du test, sur
+    la base en mémoire chargée avec benchmarks/dataset.py ; mesure le débit
+    d'un worker sans réseau ni serveur à lancer
+  - --url : requêtes HTTP vers un serveur déjà lancé (uvicorn), par exemple
+    sur un jeu de données généré :
+        python -m benchmarks.dataset --scale medium --output /tmp/omb.json
+        DB_BACKEND=memory DB_FIXTURES=/tmp/omb.json uvicorn main:app --port 8000
+        python -m benchmarks.load_test --url http://127.0.0.1:8000 --tablets 40
+
+Rapport par route : nombre de requêtes, débit, latence p50 / p95 / p99 et
+taux d'erreurs (statut >= 400 ou exception).
+
+Lancement (depuis backend/) :
+    python -m benchmarks.load_test --tablets 20 --duration 30
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import time
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional
+
+# En processus, jamais de Supabase : la base en mémoire est imposée avant tout import de l'API
+os.environ.setdefault("DB_BACKEND", "memory")
+
+import httpx
+
+# Répartition des actions (poids relatifs)
+MIX = {
+    "liste": 50,
+    "detail": 18,
+    "creation": 6,
+    "modification": 8,
+    "archives": 5,
+    "catalogue": 10,
+    "planning": 3,
+}
+
+
+def percentile(values: List[float], p: float) -> float:
+    """Nearest-rank percentile of sorted values"""
+    index = max(0, min(len(values) - 1, round(p / 100 * len(values) + 0.5) - 1))
+    return values[index]
+
+
+class Stats:
+    """Latencies and errors per route template"""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+
+    def record(self, route: str, seconds: float, ok: bool):
+        self.latencies[route].append(seconds * 1000)
+        if not ok:
+            self.errors[route] += 1
+
+    def report(self, elapsed: float) -> Dict[str, Dict[str, Any]]:
+        report = {}
+        for route, latencies in sorted(self.latencies.items(), key=lambda item: -len(item[1])):
+            latencies = sorted(latencies)
+            report[route] = {
+                "requetes": len(latencies),
+                "rps": round(len(latencies) / elapsed, 1),
+                "p50_ms": round(percentile(latencies, 50), 1),
+                "p95_ms": round(percentile(latencies, 95), 1),
+                "p99_ms": round(percentile(latencies, 99), 1),
+                "erreurs_pct": round(100 * self.errors[route] / len(latencies), 2),
+            }
+        return report
+
+
+class Tablet:
+    """One simulated tablet: a loop of weighted actions with think time"""
+
+    def __init__(self, client: httpx.AsyncClient, stats: Stats, data: Dict[str, List[Any]], rnd: random.Random, think: float):
+        self.client = client
+        self.stats = stats
+        self.data = data
+        self.rnd = rnd
+        self.think = think
+
+    async def request(self, route: str, method: str, url: str, **kwargs) -> Optional[httpx.Response]:
+        start = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, **kwargs)
+        except Exception:
+            self.stats.record(route, time.perf_counter() - start, False)
+            return None
+        self.stats.record(route, time.perf_counter() - start, response.status_code < 400)
+        return response
+
+    async def run(self, deadline: float):
+        actions, weights = zip(*MIX.items())
+        while time.perf_counter() < deadline:
+            action = self.rnd.choices(actions, weights)[0]
+            await getattr(self, action)()
+            await asyncio.sleep(self.rnd.expovariate(1 / self.think) if self.think > 0 else 0)
+
+    # Actions
+    async def liste(self):
+        await self.request("GET /commandes/?limit=50", "GET", "/commandes/", params={"limit": 50})
+
+    async def detail(self):
+        commande_id = self.rnd.choice(self.data["commandes"])
+        await self.request("GET /commandes/{id}/full", "GET", f"/commandes/{commande_id}/full")
+
+    async def creation(self):
+        today = date.today()
+        body = {
+            "nom_client": f"Client {self.rnd.randint(1, 9999)}",
+            "nombre_couverts": self.rnd.choice([8, 12, 20, 30]),
+            "delivery_date": (today + timedelta(days=self.rnd.randint(1, 20))).isoformat(),
+            "delivery_hour": f"{self.rnd.randint(7, 13):02d}:30:00",
+            "formules": [
+                {"formule_id": formule_id, "quantite_finale": self.rnd.randint(5, 40)}
+                for formule_id in self.rnd.sample(self.data["formules"], self.rnd.randint(1, 2))
+            ],
+            "produits": [
+                {"produit_id": produit_id, "quantite": self.rnd.randint(1, 10), "unite": "pièces"}
+                for produit_id in self.rnd.sample(self.data["produits"], self.rnd.randint(0, 2))
+            ],
+        }
+        response = await self.request("POST /commandes/with-composition", "POST", "/commandes/with-composition", json=body)
+        if response is not None and response.status_code < 400:
+            self.data["commandes"].append(response.json()["id"])
+
+    async def modification(self):
+        commande_id = self.rnd.choice(self.data["commandes"])
+        response = await self.request("GET /commandes/{id}/full", "GET", f"/commandes/{commande_id}/full")
+        if response is None or response.status_code >= 400:
+            return
+        commande = response.json()
+        body = {
+            "formules": [
+                {"id": cf["id"], "formule_id": cf["formule_id"], "quantite_finale": max(1, cf["quantite_finale"] + self.rnd.choice([-2, 2, 5]))}
+                for cf in commande["formules"]
+            ],
+            "produits": [{"id": cp["id"], "produit_id": cp["produit_id"], "quantite": cp["quantite"]} for cp in commande["produits"]],
+        }
+        await self.request("PATCH /commandes/{id}/composition", "PATCH", f"/commandes/{commande_id}/composition", json=body)
+
+    async def archives(self):
+        await self.request("GET /commandes/archived?limit=50", "GET", "/commandes/archived", params={"limit": 50})
+
+    async def catalogue(self):
+        url = self.rnd.choice(["/produits/", "/formules/"])
+        await self.request(f"GET {url}", "GET", url)
+
+    async def planning(self):
+        today = date.today()
+        params = {"date_debut": today.isoformat(), "date_fin": (today + timedelta(days=6)).isoformat()}
+        await self.request("GET /planning/production", "GET", "/planning/production", params=params)
+
+
+async def load_ids(client: httpx.AsyncClient) -> Dict[str, List[Any]]:
+    """Ids the tablets work on, read through the API"""
+    commandes, formules, produits = await asyncio.gather(
+        client.get("/commandes/", params={"fields": "id"}),
+        client.get("/formules/"),
+        client.get("/produits/"),
+    )
+    data = {
+        "commandes": [row["id"] for row in commandes.json()],
+        "formules": [row["id"] for row in formules.json()],
+        "produits": [row["id"] for row in produits.json()],
+    }
+    if not all(data.values()):
+        raise SystemExit("Jeu de données vide : commandes, formules et produits sont nécessaires")
+    return data
+
+
+async def run(client: httpx.AsyncClient, tablets: int, duration: float, ramp: float, think: float, seed: int):
+    data = await load_ids(client)
+    stats = Stats()
+    rnd = random.Random(seed)
+
+    async def tablet(i: int):
+        # Démarrages étalés sur `ramp` secondes
+        await asyncio.sleep(ramp * i / tablets)
+        await Tablet(client, stats, data, random.Random(rnd.random()), think).run(deadline)
+
+    start = time.perf_counter()
+    deadline = start + ramp + duration
+    await asyncio.gather(*(tablet(i) for i in range(tablets)))
+    return stats.report(time.perf_counter() - start)
+
+
+def print_report(report: Dict[str, Dict[str, Any]], tablets: int):
+    total = sum(route["requetes"] for route in report.values())
+    rps = sum(route["rps"] for route in report.values())
+    errors = sum(route["requetes"] * route["erreurs_pct"] / 100 for route in report.values())
+    print(f"{tablets} tablettes : {total} requêtes, {rps:.1f} req/s, {100 * errors / max(total, 1):.2f} % d'erreurs")
+    print(f"  {'route':40} {'req':>6} {'req/s':>7} {'p50':>8} {'p95':>8} {'p99':>8} {'erreurs':>8}")
+    for route, row in report.items():
+        print(f"  {route:40} {row['requetes']:6d} {row['rps']:7.1f} {row['p50_ms']:6.1f}ms {row['p95_ms']:6.1f}ms"
+              f" {row['p99_ms']:6.1f}ms {row['erreurs_pct']:7.2f}%")
+
+
+async def main_async(args):
+    timeout = httpx.Timeout(30.0)
+    headers = {"Accept-Encoding": "gzip"}
+    if args.url:
+        async with httpx.AsyncClient(base_url=args.url, timeout=timeout, headers=headers) as client:
+            return await run(client, args.tablets, args.duration, args.ramp, args.think, args.seed)
+
+    from benchmarks.dataset import generate, scale_size
+    import database
+    import main
+
+    database.get_supabase_client().reset(generate(scale_size(args.scale), seed=args.seed))
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://omb.test", timeout=timeout, headers=headers) as client:
+        return await run(client, args.tablets, args.duration, args.ramp, args.think, args.seed)
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tablets", type=int, default=20, help="Tablettes simultanées")
+    parser.add_argument("--duration", type=float, default=30, help="Durée de la mesure (secondes, après la montée en charge)")
+    parser.add_argument("--ramp", type=float, default=5, help="Montée en charge (secondes)")
+    parser.add_argument("--think", type=float, default=1.0, help="Temps de réflexion moyen entre deux actions (secondes, 0 = aucun)")
+    parser.add_argument("--url", help="Serveur à tester (ex: http://127.0.0.1:8000) ; sinon en processus")
+    parser.add_argument("--scale", default="medium", help="Jeu de données en processus : small, medium, large ou un nombre")
+    parser.add_argument("--seed", type=int, default=1, help="Graine (jeu de données et actions)")
+    parser.add_argument("--json", help="Écrire le rapport dans ce fichier")
+    args = parser.parse_args()
+
+    # Une ligne de log par requête fausserait les mesures
+    logging.getLogger("omb").setLevel(logging.WARNING)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    report = asyncio.run(main_async(args))
+    print_report(report, args.tablets)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"tablettes": args.tablets, "duree": args.duration, "routes": report}, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main_cli()
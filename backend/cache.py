@@ -0,0 +1,60 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Tuple
+from config import CACHE_TTL_SECONDS
+
+# ============================================
+# CACHE EN MÉMOIRE AVEC TTL
+# ============================================
+
+class TTLCache:
+    """
+    In-process cache with a time-to-live and explicit invalidation.
+
+    Values are shared between requests: callers must treat them as read-only.
+    Concurrent misses on the same key trigger a single load.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._generations: Dict[str, int] = {}
+
+    def _get_fresh(self, key: str):
+        entry = self._entries.get(key)
+        if entry and entry[0] > time.monotonic():
+            return True, entry[1]
+        return False, None
+
+    async def get_or_load(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached value for `key`, calling `loader` on a miss"""
+        hit, value = self._get_fresh(key)
+        if hit:
+            return value
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            hit, value = self._get_fresh(key)
+            if hit:
+                return value
+
+            generation = self._generations.get(key, 0)
+            value = await loader()
+            # Ne pas mémoriser une valeur invalidée pendant son chargement
+            if self._generations.get(key, 0) == generation:
+                self._entries[key] = (time.monotonic() + self.ttl, value)
+            return value
+
+    def invalidate(self, *keys: str):
+        """Drop the given keys"""
+        for key in keys:
+            self._entries.pop(key, None)
+            self._generations[key] = self._generations.get(key, 0) + 1
+
+    def clear(self):
+        """Drop every key"""
+        self.invalidate(*list(self._entries))
+
+
+cache = TTLCache(CACHE_TTL_SECONDS)
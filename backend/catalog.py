@@ -0,0 +1,72 @@
+from typing import Any, Dict, List
+from cache import cache
+from database import get_supabase_client, execute
+import versions
+
+# ============================================
+# DONNÉES DE RÉFÉRENCE (CATALOGUE)
+# ============================================
+# Produits, catégories, types et unités changent rarement : ils sont lus
+# depuis le cache partagé et rechargés après une écriture ou à expiration.
+
+supabase = get_supabase_client()
+
+# Clés dérivées à invalider en même temps que la table source
+_DEPENDENTS = {
+    "produits": ("produits_infos",),
+    "categories": ("produits_infos",),
+    "types": ("produits_infos",),
+    "unite": (),
+}
+
+def _loader(table: str, order_by: str):
+    async def load() -> List[Dict[str, Any]]:
+        response = await execute(supabase.table(table).select("*").order(order_by))
+        return response.data
+    return load
+
+async def get_produits() -> List[Dict[str, Any]]:
+    """All produits, ordered by name"""
+    return await cache.get_or_load("produits", _loader("produits", "name"))
+
+async def get_categories() -> List[Dict[str, Any]]:
+    """All categories, ordered by name"""
+    return await cache.get_or_load("categories", _loader("categories", "name"))
+
+async def get_types() -> List[Dict[str, Any]]:
+    """All types, ordered by name"""
+    return await cache.get_or_load("types", _loader("types", "name"))
+
+async def get_unite() -> List[Dict[str, Any]]:
+    """All unite, ordered by nom"""
+    return await cache.get_or_load("unite", _loader("unite", "nom"))
+
+async def get_produits_infos() -> Dict[str, Dict[str, str]]:
+    """
+    Produits joined with their categorie and type names, keyed by produit id.
+    Used by the planning engine.
+    """
+    async def load():
+        produits = await get_produits()
+        categories_map = {cat["id"]: cat["name"] for cat in await get_categories()}
+        types_map = {typ["id"]: typ["name"] for typ in await get_types()}
+        return {
+            prod["id"]: {
+                "name": prod["name"],
+                "categorie": categories_map.get(prod.get("categorie_id"), "Autre"),
+                "type": types_map.get(prod.get("type_id"), "Autre")
+            }
+            for prod in produits
+        }
+    return await cache.get_or_load("produits_infos", load)
+
+def invalidate(table: str):
+    """Invalidate a catalog table and the keys derived from it"""
+    cache.invalidate(table, *_DEPENDENTS.get(table, ()))
+
+def _on_version_change(table: str):
+    # Écriture faite par un autre worker (versions.py)
+    if table in _DEPENDENTS:
+        invalidate(table)
+
+versions.on_change(_on_version_change)
@@ -0,0 +1,42 @@
+import argparse
+import json
+import urllib.parse
+import urllib.request
+from config import API_HOST, API_PORT
+
+# Vérifie (ou reconstruit) les totaux journaliers matérialisés d'une API en cours d'exécution.
+#
+#   python3 check_totals.py 2026-03-01 2026-03-31
+#   python3 check_totals.py 2026-03-01 2026-03-31 --rebuild
+#   python3 check_totals.py 2026-03-01 2026-03-31 --api https://omb-backend.onrender.com
+
+parser = argparse.ArgumentParser(description="Vérification des totaux de production matérialisés")
+parser.add_argument("date_debut")
+parser.add_argument("date_fin")
+parser.add_argument("--api", default=f"http://{API_HOST}:{API_PORT}", help="URL de l'API")
+parser.add_argument("--rebuild", action="store_true", help="Reconstruire les totaux de la période")
+args = parser.parse_args()
+
+params = urllib.parse.urlencode({"date_debut": args.date_debut, "date_fin": args.date_fin})
+
+try:
+    if args.rebuild:
+        request = urllib.request.Request(f"{args.api}/planning/totaux/rebuild?{params}", method="POST")
+        with urllib.request.urlopen(request) as response:
+            result = json.load(response)
+        print(f"Totaux reconstruits : {result['jours']} jour(s), {result['produits']} total(aux) produit")
+    else:
+        with urllib.request.urlopen(f"{args.api}/planning/totaux/verification?{params}") as response:
+            result = json.load(response)
+        if result["coherent"]:
+            print("Totaux cohérents avec un recalcul complet")
+        else:
+            print(f"{len(result['ecarts'])} écart(s) trouvé(s) :")
+            for ecart in result["ecarts"]:
+                print(f"  {ecart['date']} | {ecart['produit_id']} | {ecart['champ']} : attendu {ecart['attendu']} | stocké {ecart['stocke']}")
+            print("Relancer avec --rebuild pour reconstruire la période")
+            raise SystemExit(1)
+
+except OSError as e:
+    print("Erreur lors de l'appel à l'API :", str(e))
+    raise SystemExit(2)
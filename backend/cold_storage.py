@@ -0,0 +1,319 @@
+import asyncio
+import logging
+import os
+import uuid
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from config import COLD_STORAGE_DIR, COLD_STORAGE_AFTER_DAYS, COLD_STORAGE_BATCH_SIZE, COLD_STORAGE_MAX_BATCHES
+from database import get_supabase_client, execute, fetch_in
+import catalog
+import commande_details
+import compositions
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow est optionnel : sans lui, les archives restent dans Supabase
+    pa = None
+
+# ============================================
+# STOCKAGE FROID DES COMMANDES ARCHIVÉES (PARQUET)
+# ============================================
+# Les commandes archivées restent sinon dans carnet_commande : chaque requête
+# sur les commandes en cours filtre une table qui grossit sans fin. Au-delà de
+# COLD_STORAGE_AFTER_DAYS jours, elles sont déplacées (avec formules,
+# exclusions et produits directs) dans des fichiers Parquet compressés (zstd),
+# un dossier par table et par mois de livraison :
+#
+#   COLD_STORAGE_DIR/carnet_commande/month=2026-01/part-20260415T030000-1a2b3c4d.parquet
+#   COLD_STORAGE_DIR/commande_formules/month=2026-01/part-...parquet
+#   ...
+#
+# - Export : pendant l'archivage automatique (archiver.py, sous son verrou),
+#   par lots, des seules commandes déjà comptées dans les cumuls d'analyse
+#   (archived_at au plus tard au dernier passage d'analytics.py). Un lot est
+#   écrit (fichier temporaire puis renommage) avant d'être supprimé de
+#   Supabase (commande supprimée, relations en cascade). Si la suppression
+#   échoue, les lignes sont aux deux endroits : à la lecture, Supabase
+#   l'emporte et les doublons des fichiers sont ignorés.
+# - Lecture : /commandes/archived et le planning (planning_engine.py : planning,
+#   export Excel, totaux) fusionnent Supabase et les fichiers. Seuls les
+#   mois de la période demandée sont ouverts, du plus récent au plus ancien,
+#   jusqu'à remplir la page ; dans un mois, le filtre sur delivery_date est
+#   poussé au lecteur Parquet (statistiques des row groups).
+# - Les compositions des commandes exportées viennent des fichiers, formules et
+#   catalogue restent ceux de Supabase (comme pour les archives non exportées).
+
+logger = logging.getLogger("omb.cold_storage")
+supabase = get_supabase_client()
+
+ENABLED = bool(COLD_STORAGE_DIR)
+if ENABLED and pa is None:
+    # Pas de repli silencieux : les commandes déjà exportées disparaîtraient
+    # des archives, du planning et des totaux
+    logger.error("COLD_STORAGE_DIR=%s mais pyarrow n'est pas installé (pip install pyarrow)", COLD_STORAGE_DIR)
+    raise ValueError("COLD_STORAGE_DIR is set but pyarrow is not installed (pip install pyarrow)")
+
+COMPRESSION = "zstd"
+
+# Colonnes connues, typées ; une colonne inconnue (ajoutée dans Supabase) est gardée en texte
+if pa is not None:
+    _SCHEMAS = {
+        "carnet_commande": pa.schema([
+            ("id", pa.string()), ("nom_client", pa.string()), ("nombre_couverts", pa.int64()),
+            ("service", pa.bool_()), ("delivery_date", pa.string()), ("delivery_hour", pa.string()),
+            ("notes", pa.string()), ("avec_service", pa.bool_()), ("validated", pa.bool_()),
+            ("archived", pa.bool_()), ("archived_at", pa.string()),
+        ]),
+        "commande_formules": pa.schema([
+            ("id", pa.int64()), ("commande_id", pa.string()), ("formule_id", pa.string()),
+            ("quantite_recommandee", pa.float64()), ("quantite_finale", pa.float64()),
+        ]),
+        "commande_produits": pa.schema([
+            ("id", pa.int64()), ("commande_id", pa.string()), ("produit_id", pa.string()),
+            ("quantite", pa.float64()), ("unite", pa.string()),
+        ]),
+        # commande_id ajouté à l'export pour ranger les exclusions avec leur commande
+        "commande_formule_exclusions": pa.schema([
+            ("id", pa.int64()), ("commande_formule_id", pa.int64()), ("produit_id", pa.string()),
+            ("commande_id", pa.string()),
+        ]),
+    }
+
+# ============================================
+# ÉCRITURE
+# ============================================
+
+def _arrow_table(table: str, rows: List[Dict[str, Any]]) -> "pa.Table":
+    schema = _SCHEMAS[table]
+    extra = sorted({key for row in rows for key in row} - set(schema.names))
+    fields = list(schema) + [pa.field(name, pa.string()) for name in extra]
+    columns = {name: [row.get(name) for row in rows] for name in schema.names}
+    for name in extra:
+        columns[name] = [None if row.get(name) is None else str(row[name]) for row in rows]
+    return pa.table(columns, schema=pa.schema(fields))
+
+def _write(tables: Dict[str, List[Dict[str, Any]]], month_of: Dict[str, str]):
+    """One part file per table and month, written then renamed (never read half-written)"""
+    part = f"part-{datetime.utcnow():%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:8]}.parquet"
+    for table, rows in tables.items():
+        key = "id" if table == "carnet_commande" else "commande_id"
+        by_month: Dict[str, List[Dict[str, Any]]] = {}
+        for row in rows:
+            by_month.setdefault(month_of[row[key]], []).append(row)
+        for month, month_rows in by_month.items():
+            if table == "carnet_commande":
+                # Row groups triés : statistiques min / max serrées sur delivery_date
+                month_rows.sort(key=lambda row: (row["delivery_date"], row["id"]))
+            directory = os.path.join(COLD_STORAGE_DIR, table, f"month={month}")
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, part)
+            pq.write_table(_arrow_table(table, month_rows), path + ".tmp", compression=COMPRESSION)
+            os.replace(path + ".tmp", path)
+
+async def _export_batch(commandes: List[Dict[str, Any]]):
+    ids = [commande["id"] for commande in commandes]
+    commande_formules, commande_produits = await asyncio.gather(
+        fetch_in(lambda: supabase.table("commande_formules").select("*"), "commande_id", ids),
+        fetch_in(lambda: supabase.table("commande_produits").select("*"), "commande_id", ids),
+    )
+    commande_of = {cf["id"]: cf["commande_id"] for cf in commande_formules}
+    exclusions = await fetch_in(
+        lambda: supabase.table("commande_formule_exclusions").select("*"), "commande_formule_id", list(commande_of)
+    )
+    exclusions = [{**exclusion, "commande_id": commande_of[exclusion["commande_formule_id"]]} for exclusion in exclusions]
+
+    month_of = {commande["id"]: commande["delivery_date"][:7] for commande in commandes}
+    await asyncio.to_thread(_write, {
+        "carnet_commande": commandes,
+        "commande_formules": commande_formules,
+        "commande_produits": commande_produits,
+        "commande_formule_exclusions": exclusions,
+    }, month_of)
+
+    # Fichiers en place : les commandes quittent Supabase, leurs formules,
+    # exclusions et produits avec elles (ON DELETE CASCADE, comme DELETE
+    # /commandes/{id}). Une commande part entière ou reste entière : jamais de
+    # copie Supabase incomplète préférée à celle des fichiers
+    await fetch_in(lambda: supabase.table("carnet_commande").delete(), "id", ids)
+    # Totaux du planning inchangés : les commandes exportées y comptent toujours
+    compositions.invalidate_exclusions(*commande_of)
+
+async def export(archived_before: str, max_batches: int = COLD_STORAGE_MAX_BATCHES) -> Dict[str, Any]:
+    """
+    Move archived commandes delivered before the cutoff to the Parquet files,
+    in batches. Only those archived at `archived_before` or earlier (or with
+    no archived_at) leave Supabase: the rollup watermark, the incremental
+    analytics update only reads Supabase.
+    """
+    cutoff_date = (date.today() - timedelta(days=COLD_STORAGE_AFTER_DAYS)).isoformat()
+    exported = batches = 0
+    for _ in range(max_batches):
+        response = await execute(
+            supabase.table("carnet_commande").select("*")
+            .eq("archived", True).lt("delivery_date", cutoff_date)
+            .or_(f"archived_at.is.null,archived_at.lte.{archived_before}")
+            .order("delivery_date").order("id").limit(COLD_STORAGE_BATCH_SIZE)
+        )
+        if not response.data:
+            break
+        await _export_batch(response.data)
+        exported += len(response.data)
+        batches += 1
+        if len(response.data) < COLD_STORAGE_BATCH_SIZE:
+            break
+    if exported:
+        logger.info("cutoff_date=%s exported=%s batches=%s", cutoff_date, exported, batches)
+    return {"cutoff_date": cutoff_date, "exported": exported, "batches": batches}
+
+# ============================================
+# LECTURE
+# ============================================
+
+def _months(table: str) -> List[str]:
+    """Months stored for `table`, most recent first"""
+    root = os.path.join(COLD_STORAGE_DIR, table)
+    if not os.path.isdir(root):
+        return []
+    return sorted(
+        (entry.name[len("month="):] for entry in os.scandir(root) if entry.is_dir() and entry.name.startswith("month=")),
+        reverse=True,
+    )
+
+def _read_month(table: str, month: str, columns: Optional[List[str]], filter=None) -> Optional["pa.Table"]:
+    directory = os.path.join(COLD_STORAGE_DIR, table, f"month={month}")
+    files = sorted(os.path.join(directory, name) for name in os.listdir(directory) if name.endswith(".parquet"))
+    if not files:
+        return None
+    # Les fichiers d'un mois peuvent différer d'une colonne ajoutée entre deux exports
+    schema = pa.unify_schemas([pq.read_schema(path) for path in files])
+    if columns is not None:
+        columns = [column for column in columns if column in schema.names]
+    return ds.dataset(files, schema=schema, format="parquet").to_table(columns=columns, filter=filter)
+
+def _json_number(value: Any) -> Any:
+    """Whole floats as PostgREST serializes them (2, not 2.0): same JSON and planning types as Supabase rows"""
+    return int(value) if type(value) is float and value.is_integer() else value
+
+def _rows(tables: Iterable[Optional["pa.Table"]]) -> List[Dict[str, Any]]:
+    """Rows of the tables, first occurrence of each id only (re-exported duplicates)"""
+    seen, rows = set(), []
+    for table in tables:
+        if table is None:
+            continue
+        floats = [field.name for field in table.schema if pa.types.is_floating(field.type)]
+        for row in table.to_pylist():
+            if row["id"] not in seen:
+                seen.add(row["id"])
+                for column in floats:
+                    row[column] = _json_number(row[column])
+                rows.append(row)
+    return rows
+
+def read_commandes(
+    select: str,
+    date_debut: Optional[str] = None,
+    date_fin: Optional[str] = None,
+    after: Optional[Tuple[str, str]] = None,
+    limit: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Exported commandes, ordered like the lists (delivery_date then id, most
+    recent first): `select` as in routes.commandes.parse_fields, optional
+    delivery_date range, `after` = (delivery_date, id) of the previous page,
+    at most `limit` rows. Blocking: call from a thread.
+    """
+    columns = None if select == "*" else [column.strip() for column in select.split(",")]
+    field = ds.field("delivery_date")
+    conditions = []
+    if date_debut:
+        conditions.append(field >= date_debut)
+    if date_fin:
+        conditions.append(field <= date_fin)
+    if after:
+        last_date, last_id = after
+        conditions.append((field < last_date) | ((field == last_date) & (ds.field("id") < last_id)))
+    condition = None
+    for item in conditions:
+        condition = item if condition is None else condition & item
+
+    tables, count = [], 0
+    for month in _months("carnet_commande"):
+        # Dossiers hors de la période : pas ouverts
+        if date_fin and month > date_fin[:7] or after and month > after[0][:7]:
+            continue
+        if date_debut and month < date_debut[:7]:
+            break
+        table = _read_month("carnet_commande", month, columns, condition)
+        if table is None or not table.num_rows:
+            continue
+        tables.append(table.sort_by([("delivery_date", "descending"), ("id", "descending")]))
+        count += table.num_rows
+        # Mois parcourus du plus récent au plus ancien : la page est complète
+        if limit is not None and count >= limit:
+            break
+    rows = _rows(tables)
+    return rows[:limit] if limit is not None else rows
+
+def read_month(month: str, columns: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """Exported commandes of one month (see months()). Blocking: call from a thread."""
+    return _rows([_read_month("carnet_commande", month, columns)])
+
+def months() -> List[str]:
+    """Months with exported commandes, most recent first"""
+    return _months("carnet_commande")
+
+def find_commande(commande_id: str) -> Optional[Dict[str, Any]]:
+    """An exported commande by id, None if absent. Blocking: call from a thread."""
+    for month in _months("carnet_commande"):
+        table = _read_month("carnet_commande", month, None, ds.field("id") == commande_id)
+        if table is not None and table.num_rows:
+            return _rows([table])[0]
+    return None
+
+def merge(hot: List[Dict[str, Any]], cold: List[Dict[str, Any]], limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Supabase rows and exported rows in list order; Supabase wins on a duplicate id"""
+    if not cold:
+        return hot
+    hot_ids = {row["id"] for row in hot}
+    rows = hot + [row for row in cold if row["id"] not in hot_ids]
+    rows.sort(key=lambda row: (row["delivery_date"], row["id"]), reverse=True)
+    return rows[:limit] if limit is not None else rows
+
+def _read_relations(commandes: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    ids = list({commande["id"] for commande in commandes})
+    months = {commande["delivery_date"][:7] for commande in commandes}
+    condition = ds.field("commande_id").isin(ids)
+    relations = {}
+    for table in ("commande_formules", "commande_produits", "commande_formule_exclusions"):
+        stored = set(_months(table))
+        relations[table] = _rows(_read_month(table, month, None, condition) for month in months & stored)
+    return relations
+
+async def load_details(commandes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """commande_details.load_details() for exported commandes (relations read from the files)"""
+    if not commandes:
+        return []
+    return commande_details.build_details(commandes, await load_relations(commandes))
+
+async def load_relations(commandes: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """planning_engine.prefetch_relations() for exported commandes"""
+    stored = await asyncio.to_thread(_read_relations, commandes)
+    formule_ids = list({cf["formule_id"] for cf in stored["commande_formules"]})
+    formules, produits_infos, compositions_index = await asyncio.gather(
+        fetch_in(lambda: supabase.table("formules").select("id, name, type_formule"), "id", formule_ids),
+        catalog.get_produits_infos(),
+        compositions.get_index(),
+    )
+    exclusions: Dict[Any, set] = {}
+    for exclusion in stored["commande_formule_exclusions"]:
+        exclusions.setdefault(exclusion["commande_formule_id"], set()).add(exclusion["produit_id"])
+    return {
+        "commande_formules": stored["commande_formules"],
+        "formules": formules,
+        "commande_produits": stored["commande_produits"],
+        "exclusions": {cf_id: frozenset(produit_ids) for cf_id, produit_ids in exclusions.items()},
+        "compositions": compositions_index,
+        "produits_infos": produits_infos,
+    }
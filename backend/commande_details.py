@@ -0,0 +1,69 @@
+from typing import Any, Dict, List
+import compositions
+import planning_engine
+
+# ============================================
+# DÉTAIL DES COMMANDES (COMPOSITION COMPLÈTE)
+# ============================================
+# Formules (avec leur composition et leurs exclusions) et produits directs de
+# plusieurs commandes à la fois : les relations sont chargées en masse par
+# planning_engine.prefetch_relations (nombre de requêtes fixe, quel que soit
+# le nombre de commandes), compositions et catalogue venant des caches.
+
+def _produit_name(produits_infos: Dict[str, Dict[str, str]], produit_id: str) -> str:
+    produit = produits_infos.get(produit_id)
+    return produit["name"] if produit else "Produit inconnu"
+
+async def load_details(commandes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Each commande with two extra keys:
+      - "formules": commande_formules rows + formule_name, type_formule,
+        produits_exclus and composition (produits not excluded, with
+        quantite per person and quantite_totale for the commande)
+      - "produits": commande_produits rows + produit_name
+    """
+    if not commandes:
+        return []
+
+    relations = await planning_engine.prefetch_relations([c["id"] for c in commandes], {})
+    return build_details(commandes, relations)
+
+def build_details(commandes: List[Dict[str, Any]], relations: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """load_details() from relations already loaded (planning_engine.prefetch_relations shape)"""
+    commande_formules_map = planning_engine.group_by_commande(relations["commande_formules"])
+    commande_produits_map = planning_engine.group_by_commande(relations["commande_produits"])
+    formules_info_map = {f["id"]: f for f in relations["formules"]}
+    compositions_index = relations["compositions"]
+    exclusions_masks = relations["exclusions"]
+    produits_infos = relations["produits_infos"]
+
+    result = []
+    for commande in commandes:
+        formules = []
+        for cf in commande_formules_map.get(commande["id"], ()):
+            formule_info = formules_info_map.get(cf["formule_id"], {})
+            excluded = exclusions_masks.get(cf["id"], compositions.NO_EXCLUSIONS)
+            formules.append({
+                **cf,
+                "formule_name": formule_info.get("name", "Formule inconnue"),
+                "type_formule": formule_info.get("type_formule", ""),
+                "produits_exclus": sorted(excluded),
+                "composition": [
+                    {
+                        "produit_id": produit_id,
+                        "produit_name": _produit_name(produits_infos, produit_id),
+                        "quantite": quantite,
+                        "unite": unite,
+                        "quantite_totale": quantite * cf["quantite_finale"],
+                    }
+                    for produit_id, quantite, unite in compositions.expand(compositions_index, cf["formule_id"], excluded)
+                ],
+            })
+
+        produits = [
+            {**cp, "produit_name": _produit_name(produits_infos, cp["produit_id"])}
+            for cp in commande_produits_map.get(commande["id"], ())
+        ]
+
+        result.append({**commande, "formules": formules, "produits": produits})
+    return result
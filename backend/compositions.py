@@ -0,0 +1,173 @@
+import asyncio
+import time
+from collections import defaultdict
+from typing import Any, Dict, FrozenSet, Iterable, List, Tuple
+from cache import cache
+from config import CACHE_TTL_SECONDS
+from database import get_supabase_client, execute, fetch_in
+import versions
+
+# ============================================
+# INDEX DES COMPOSITIONS DE FORMULES
+# ============================================
+# formule_id → tuple plat de (produit_id, quantite, unite), compilé depuis
+# formule_produits et gardé en cache. Les exclusions d'une commande_formule
+# sont un masque (frozenset des produits exclus) appliqué à l'expansion.
+
+supabase = get_supabase_client()
+
+CompositionItem = Tuple[str, float, str]
+
+NO_EXCLUSIONS: FrozenSet[str] = frozenset()
+
+# Lignes de formule_produits par requête (max-rows de PostgREST : 1000 par défaut)
+_PAGE_SIZE = 1000
+
+async def _load_index() -> Dict[str, Tuple[CompositionItem, ...]]:
+    index = defaultdict(list)
+    last_id = None
+    # Pagination par id jusqu'à une page vide : une page tronquée par un
+    # max-rows plus bas que _PAGE_SIZE ne coupe pas la table
+    while True:
+        query = supabase.table("formule_produits").select("id, formule_id, produit_id, quantite, unite")
+        if last_id is not None:
+            query = query.gt("id", last_id)
+        response = await execute(query.order("id").limit(_PAGE_SIZE))
+        if not response.data:
+            break
+        for fp in response.data:
+            index[fp["formule_id"]].append((fp["produit_id"], fp["quantite"], fp["unite"]))
+        last_id = response.data[-1]["id"]
+    return {formule_id: tuple(items) for formule_id, items in index.items()}
+
+async def get_index() -> Dict[str, Tuple[CompositionItem, ...]]:
+    """Compiled composition of every formule, keyed by formule id"""
+    return await cache.get_or_load("compositions", _load_index)
+
+def invalidate_index():
+    """Invalidate the compiled index (formule_produits changed)"""
+    cache.invalidate("compositions")
+
+def expand(
+    index: Dict[str, Tuple[CompositionItem, ...]],
+    formule_id: str,
+    excluded: FrozenSet[str] = NO_EXCLUSIONS,
+) -> List[CompositionItem]:
+    """Items of a formule, without the produits masked by `excluded`"""
+    items = index.get(formule_id, ())
+    if not excluded:
+        return list(items)
+    return [item for item in items if item[0] not in excluded]
+
+# ============================================
+# MASQUES D'EXCLUSION PAR COMMANDE_FORMULE
+# ============================================
+
+# commande_formule_id → (expiration, produits exclus)
+_masks: Dict[Any, Tuple[float, FrozenSet[str]]] = {}
+_masks_generation = 0
+_MASKS_SWEEP_SIZE = 10000
+
+async def get_exclusion_masks(commande_formule_ids: Iterable[Any]) -> Dict[Any, FrozenSet[str]]:
+    """
+    Excluded produit ids for each commande_formule.
+    Cached masks are reused; the missing ones are loaded in bulk.
+    """
+    now = time.monotonic()
+    masks = {}
+    missing = []
+    for commande_formule_id in commande_formule_ids:
+        entry = _masks.get(commande_formule_id)
+        if entry and entry[0] > now:
+            masks[commande_formule_id] = entry[1]
+        else:
+            missing.append(commande_formule_id)
+
+    if not missing:
+        return masks
+
+    generation = _masks_generation
+    rows = await fetch_in(
+        lambda: supabase.table("commande_formule_exclusions").select("commande_formule_id, produit_id"),
+        "commande_formule_id", missing
+    )
+    loaded = {commande_formule_id: set() for commande_formule_id in missing}
+    for row in rows:
+        loaded.setdefault(row["commande_formule_id"], set()).add(row["produit_id"])
+
+    # Ne pas mémoriser des masques invalidés pendant le chargement
+    store = generation == _masks_generation
+    if store and len(_masks) > _MASKS_SWEEP_SIZE:
+        for key in [key for key, entry in _masks.items() if entry[0] <= now]:
+            del _masks[key]
+
+    expires = now + CACHE_TTL_SECONDS
+    for commande_formule_id, excluded in loaded.items():
+        mask = frozenset(excluded) if excluded else NO_EXCLUSIONS
+        masks[commande_formule_id] = mask
+        if store:
+            _masks[commande_formule_id] = (expires, mask)
+    return masks
+
+def invalidate_exclusions(*commande_formule_ids: Any):
+    """Invalidate the masks of the given commande_formules"""
+    global _masks_generation
+    _masks_generation += 1
+    for commande_formule_id in commande_formule_ids:
+        _masks.pop(commande_formule_id, None)
+
+async def update_exclusions(desired: Dict[Any, Iterable[str]]) -> Dict[Any, List[str]]:
+    """
+    Set the excluded produits of each commande_formule in `desired` by
+    applying the difference with the stored rows: one bulk read, one delete
+    per commande_formule that loses exclusions, one bulk insert. Nothing is
+    written when the exclusions are unchanged.
+
+    Returns the exclusions of each commande_formule, in the given order.
+    """
+    desired = {cf_id: list(dict.fromkeys(map(str, produit_ids))) for cf_id, produit_ids in desired.items()}
+    if not desired:
+        return {}
+
+    rows = await fetch_in(
+        lambda: supabase.table("commande_formule_exclusions").select("commande_formule_id, produit_id"),
+        "commande_formule_id", list(desired)
+    )
+    stored = defaultdict(set)
+    for row in rows:
+        stored[row["commande_formule_id"]].add(str(row["produit_id"]))
+
+    writes = []
+    inserts = []
+    for cf_id, produit_ids in desired.items():
+        removed = stored[cf_id] - set(produit_ids)
+        if removed:
+            writes.append(execute(
+                supabase.table("commande_formule_exclusions")
+                .delete()
+                .eq("commande_formule_id", cf_id)
+                .in_("produit_id", sorted(removed))
+            ))
+        inserts.extend(
+            {"commande_formule_id": cf_id, "produit_id": produit_id}
+            for produit_id in produit_ids if produit_id not in stored[cf_id]
+        )
+    if inserts:
+        writes.append(execute(supabase.table("commande_formule_exclusions").insert(inserts)))
+
+    # Toutes les écritures se terminent avant d'invalider les masques
+    results = await asyncio.gather(*writes, return_exceptions=True)
+    invalidate_exclusions(*desired)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return desired
+
+def _on_version_change(table: str):
+    # Table modifiée par un autre worker (versions.py)
+    if table == "formule_produits":
+        invalidate_index()
+    elif table == "commande_formule_exclusions":
+        invalidate_exclusions(*list(_masks))
+
+versions.on_change(_on_version_change)
@@ -0,0 +1,234 @@
+import asyncio
+import gzip
+import zlib
+from collections import OrderedDict
+from typing import Optional, Tuple
+from starlette.datastructures import Headers, MutableHeaders
+from config import COMPRESSION_MIN_SIZE, COMPRESSION_CACHE_MB
+import metrics
+import versions
+
+try:
+    import brotli
+except ImportError:  # brotli est optionnel : gzip seul
+    brotli = None
+
+# ============================================
+# COMPRESSION DES RÉPONSES (GZIP / BROTLI)
+# ============================================
+# Le planning et les listes de commandes pèsent plusieurs centaines de Ko de
+# JSON, envoyés à des tablettes sur des Wi-Fi faibles. Les réponses texte
+# (JSON, CSV, texte) d'au moins COMPRESSION_MIN_SIZE octets sont compressées
+# selon Accept-Encoding : brotli si disponible et accepté, sinon gzip.
+#
+# - Réponses en un bloc : compressées d'un coup (dans un thread au-delà de
+#   _THREAD_THRESHOLD octets, pour ne pas bloquer la boucle d'événements).
+#   Celles qui portent un ETag (voir versions.py) sont gardées compressées :
+#   même URL, même ETag, même encodage → même corps, sans recompresser.
+#   L'ETag envoyé est suffixé par l'encodage ("…-gzip") : un ETag fort
+#   désigne un seul corps, octet pour octet.
+# - Réponses en streaming : chaque morceau est compressé et vidé aussitôt,
+#   le client reçoit les données au fil de l'eau.
+# Les formats déjà compressés (XLSX, images) ne sont pas touchés.
+
+GZIP_LEVEL = 6
+# Qualité 4-5 : proche de gzip 9 en taille, pour un coût CPU de gzip 6
+BROTLI_QUALITY = 5
+
+_COMPRESSIBLE_TYPES = ("application/json", "text/", "application/javascript")
+_THREAD_THRESHOLD = 256 * 1024
+
+def _accepted(accept_encoding: str) -> dict:
+    """Accept-Encoding → {encoding: q}"""
+    accepted = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[name] = q
+    return accepted
+
+def negotiate(accept_encoding: str) -> Optional[str]:
+    """Encoding to use ("br" or "gzip"), None to send the response as is"""
+    accepted = _accepted(accept_encoding)
+    wildcard = accepted.get("*", 0.0)
+    candidates = (["br"] if brotli is not None else []) + ["gzip"]
+    best, best_q = None, 0.0
+    for encoding in candidates:
+        q = accepted.get(encoding, wildcard)
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+class _StreamCompressor:
+    """Incremental compression; every chunk is flushed so the client can decode it"""
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+        else:
+            self._compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+
+    def chunk(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.process(data) + self._compressor.flush()
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.finish()
+        return self._compressor.flush()
+
+class CompressedCache:
+    """LRU of compressed bodies, bounded by their total size"""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: "OrderedDict[Tuple[str, str, str], bytes]" = OrderedDict()
+
+    def get(self, key: Tuple[str, str, str]) -> Optional[bytes]:
+        body = self._entries.get(key)
+        if body is not None:
+            self._entries.move_to_end(key)
+        return body
+
+    def put(self, key: Tuple[str, str, str], body: bytes):
+        if len(body) > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.size -= len(previous)
+        self._entries[key] = body
+        self.size += len(body)
+        while self.size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.size -= len(evicted)
+
+    def clear(self):
+        self._entries.clear()
+        self.size = 0
+
+class CompressionMiddleware:
+    """
+    ASGI middleware compressing text responses (see the section above).
+    Vary: Accept-Encoding is set on every compressible response, compressed or not.
+    """
+
+    def __init__(self, app, minimum_size: int = COMPRESSION_MIN_SIZE, cache_bytes: int = COMPRESSION_CACHE_MB * 1024 * 1024):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.cache = CompressedCache(cache_bytes)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        await self.app(scope, receive, _Responder(self, scope, encoding, send).send)
+
+class _Responder:
+    def __init__(self, middleware: CompressionMiddleware, scope, encoding: str, send):
+        self.middleware = middleware
+        self.scope = scope
+        self.encoding = encoding
+        self._send = send
+        self.start = None
+        # None : pas encore décidé, "identity" : transmis tel quel, "stream" : compressé au fil de l'eau
+        self.mode = None
+        self.compressor = None
+
+    def _compressible(self, headers: MutableHeaders) -> bool:
+        if self.start["status"] < 200 or self.start["status"] in (204, 304):
+            return False
+        if "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "")
+        return content_type.startswith(_COMPRESSIBLE_TYPES)
+
+    def _cache_key(self, headers: MutableHeaders) -> Optional[Tuple[str, str, str]]:
+        etag = headers.get("etag")
+        if not etag or etag.startswith("W/"):
+            return None
+        url = self.scope["path"] + "?" + self.scope.get("query_string", b"").decode("latin-1")
+        return (url, etag, self.encoding)
+
+    async def send(self, message):
+        if message["type"] == "http.response.start":
+            self.start = message
+            return
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        if self.mode == "identity":
+            await self._send(message)
+            return
+        if self.mode == "stream":
+            body = self.compressor.chunk(message.get("body", b""))
+            if not message.get("more_body", False):
+                body += self.compressor.finish()
+            await self._send({"type": "http.response.body", "body": body, "more_body": message.get("more_body", False)})
+            return
+
+        # Premier morceau du corps : décider de la compression
+        headers = MutableHeaders(raw=list(self.start["headers"]))
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if not self._compressible(headers) or (not more_body and len(body) < self.middleware.minimum_size):
+            self.mode = "identity"
+            if self._compressible(headers):
+                headers.add_vary_header("Accept-Encoding")
+            await self._send({**self.start, "headers": headers.raw})
+            await self._send(message)
+            return
+
+        headers.add_vary_header("Accept-Encoding")
+        headers["Content-Encoding"] = self.encoding
+        # Le cache est indexé par l'ETag de la version non compressée
+        key = self._cache_key(headers)
+        if "etag" in headers:
+            headers["ETag"] = versions.encoded(headers["etag"], self.encoding)
+
+        if more_body:
+            self.mode = "stream"
+            self.compressor = _StreamCompressor(self.encoding)
+            del headers["Content-Length"]
+            await self._send({**self.start, "headers": headers.raw})
+            await self._send({"type": "http.response.body", "body": self.compressor.chunk(body), "more_body": True})
+            return
+
+        self.mode = "identity"
+        compressed = self.middleware.cache.get(key) if key else None
+        if compressed is None:
+            if len(body) > _THREAD_THRESHOLD:
+                compressed = await asyncio.to_thread(compress, body, self.encoding)
+            else:
+                compressed = compress(body, self.encoding)
+            if key:
+                self.middleware.cache.put(key, compressed)
+                metrics.compression_cache.inc("miss")
+        else:
+            metrics.compression_cache.inc("hit")
+        headers["Content-Length"] = str(len(compressed))
+        await self._send({**self.start, "headers": headers.raw})
+        await self._send({"type": "http.response.body", "body": compressed})
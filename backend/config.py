@@ -1,4 +1,5 @@
 import os
+import tempfile
 from dotenv import load_dotenv
 
 # Load environment variables from a .env file
@@ -22,4 +23,94 @@ if IS_PRODUCTION:
     CORS_ORIGINS = ["https://omb-frontend.onrender.com"]
 else:
     # En développement : autoriser uniquement le frontend local
-    CORS_ORIGINS = ["http://localhost:8080"]
\ No newline at end of file
+    CORS_ORIGINS = ["http://localhost:8080"]
+
+# Logging Configuration
+# LOG_LEVEL=DEBUG détaille chaque étape du planning (durée, lignes, appels
+# Supabase) ; INFO n'écrit qu'une ligne de résumé par génération.
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+
+# Database Backend Configuration
+# DB_BACKEND=supabase (défaut) : base Supabase distante (SUPABASE_URL / SUPABASE_KEY)
+# DB_BACKEND=memory : base en mémoire chargée depuis DB_FIXTURES, pour faire
+# tourner l'API hors ligne (tests de charge, profilage, démo), voir memory_db.py
+DB_BACKEND = os.getenv("DB_BACKEND", "supabase").lower()
+DB_FIXTURES = os.getenv(
+    "DB_FIXTURES", os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "demo.json")
+)
+
+# Database Access Configuration
+# Le client Supabase est synchrone : chaque requête est exécutée dans un pool
+# de threads dédié pour ne pas bloquer la boucle d'événements.
+# DB_MAX_WORKERS borne le nombre de requêtes Supabase simultanées par worker.
+DB_MAX_WORKERS = int(os.getenv("DB_MAX_WORKERS", "16"))
+
+# Les filtres `in_` sur de longues listes d'ids sont découpés en paquets pour
+# garder des URLs PostgREST courtes (un UUID ≈ 37 caractères dans l'URL).
+# DB_IN_CHUNK_SIZE : ids par requête ; DB_IN_CONCURRENCY : paquets simultanés.
+DB_IN_CHUNK_SIZE = int(os.getenv("DB_IN_CHUNK_SIZE", "100"))
+DB_IN_CONCURRENCY = int(os.getenv("DB_IN_CONCURRENCY", "4"))
+
+# Pagination Configuration
+# Taille de page par défaut et maximale des listes de commandes (paramètre `limit`)
+COMMANDES_PAGE_MAX = int(os.getenv("COMMANDES_PAGE_MAX", "200"))
+
+# Cache Configuration
+# Durée de vie (secondes) des données de référence gardées en mémoire
+# (produits, catégories, types, unités). Les écritures via l'API invalident
+# le cache immédiatement ; le TTL couvre les modifications faites ailleurs.
+CACHE_TTL_SECONDS = int(os.getenv("CACHE_TTL_SECONDS", "300"))
+
+# Versions des tables (ETag, voir versions.py), partagées par les workers de la
+# machine dans VERSIONS_FILE. Plusieurs machines : VERSIONS_FILE sur un disque
+# partagé qui gère flock, sinon ETAG_ENABLED=false.
+VERSIONS_FILE = os.getenv("VERSIONS_FILE", os.path.join(tempfile.gettempdir(), "omb-versions.json"))
+ETAG_ENABLED = os.getenv("ETAG_ENABLED", "true").lower() == "true"
+
+# Compression Configuration
+# Réponses compressées (brotli si le paquet `brotli` est installé, sinon gzip)
+# à partir de COMPRESSION_MIN_SIZE octets. Les réponses portant un ETag sont
+# gardées compressées en mémoire, dans la limite de COMPRESSION_CACHE_MB.
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+COMPRESSION_CACHE_MB = int(os.getenv("COMPRESSION_CACHE_MB", "32"))
+
+# Auto-Archive Configuration
+# Les commandes livrées depuis plus de ARCHIVE_AFTER_DAYS jours sont archivées
+# en tâche de fond (voir archiver.py), par lots de ARCHIVE_BATCH_SIZE, toutes
+# les ARCHIVE_INTERVAL_MINUTES minutes pendant les heures creuses ARCHIVE_HOURS
+# ("début-fin", heures locales, fin exclue ; "0-24" = toute la journée).
+# La tâche est désactivée par défaut (POST /commandes/auto-archive reste
+# disponible) : ARCHIVE_SCHEDULER=true l'active. ARCHIVE_LOCK_FILE empêche deux
+# workers d'une même machine d'archiver en même temps ; avec plusieurs
+# machines, ne l'activer que sur une seule.
+ARCHIVE_SCHEDULER = os.getenv("ARCHIVE_SCHEDULER", "false").lower() == "true"
+ARCHIVE_AFTER_DAYS = int(os.getenv("ARCHIVE_AFTER_DAYS", "2"))
+ARCHIVE_BATCH_SIZE = int(os.getenv("ARCHIVE_BATCH_SIZE", "100"))
+ARCHIVE_MAX_BATCHES = int(os.getenv("ARCHIVE_MAX_BATCHES", "50"))
+ARCHIVE_INTERVAL_MINUTES = int(os.getenv("ARCHIVE_INTERVAL_MINUTES", "60"))
+ARCHIVE_HOURS = os.getenv("ARCHIVE_HOURS", "1-6")
+ARCHIVE_LOCK_FILE = os.getenv(
+    "ARCHIVE_LOCK_FILE", os.path.join(tempfile.gettempdir(), "omb-auto-archive.lock")
+)
+
+# Cold Storage Configuration
+# Les commandes archivées depuis plus de COLD_STORAGE_AFTER_DAYS jours (date de
+# livraison) quittent Supabase pour des fichiers Parquet compressés, un
+# dossier par mois, sous COLD_STORAGE_DIR (voir cold_storage.py). Vide (défaut) :
+# désactivé, tout reste dans Supabase. Nécessite le paquet `pyarrow` et un
+# disque persistant. Exportées pendant l'archivage automatique, par lots de
+# COLD_STORAGE_BATCH_SIZE commandes, au plus COLD_STORAGE_MAX_BATCHES par passage.
+COLD_STORAGE_DIR = os.getenv("COLD_STORAGE_DIR", "")
+COLD_STORAGE_AFTER_DAYS = int(os.getenv("COLD_STORAGE_AFTER_DAYS", "90"))
+COLD_STORAGE_BATCH_SIZE = int(os.getenv("COLD_STORAGE_BATCH_SIZE", "200"))
+COLD_STORAGE_MAX_BATCHES = int(os.getenv("COLD_STORAGE_MAX_BATCHES", "20"))
+
+# Analytics Configuration
+# Cumuls de consommation par produit, par semaine et par mois, sur les
+# commandes archivées (voir analytics.py). Gardés dans ANALYTICS_FILE, partagé
+# par les workers ; reconstruits depuis Supabase et les fichiers Parquet s'il
+# manque (de préférence sur un disque persistant, à côté de COLD_STORAGE_DIR).
+ANALYTICS_FILE = os.getenv("ANALYTICS_FILE", os.path.join(tempfile.gettempdir(), "omb-analytics.json"))
+ANALYTICS_BATCH_SIZE = int(os.getenv("ANALYTICS_BATCH_SIZE", "500"))
+# Archivages des dernières secondes laissés au passage suivant (écriture en cours)
+ANALYTICS_LAG_SECONDS = int(os.getenv("ANALYTICS_LAG_SECONDS", "60"))
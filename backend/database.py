@@ -1,19 +1,113 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List
 from supabase import create_client, Client
-from config import SUPABASE_URL, SUPABASE_KEY
+import metrics
+import tracing
+import versions
+from config import SUPABASE_URL, SUPABASE_KEY, DB_BACKEND, DB_FIXTURES, DB_MAX_WORKERS, DB_IN_CHUNK_SIZE, DB_IN_CONCURRENCY
 
-# Validate environment variables
-if not SUPABASE_URL or not SUPABASE_KEY:
-  raise ValueError("" \
-      "Missing SUPABASE_URL or SUPABASE_KEY environment variables. " 
-      "Please check your .env file."
-  )
+if DB_BACKEND == "memory":
+    # Base locale en mémoire (aucun appel réseau), seedée depuis les fixtures
+    import memory_db
+    supabase = memory_db.MemoryClient.from_fixtures(DB_FIXTURES)
+elif DB_BACKEND == "supabase":
+    # Validate environment variables
+    if not SUPABASE_URL or not SUPABASE_KEY:
+      raise ValueError("" \
+          "Missing SUPABASE_URL or SUPABASE_KEY environment variables. " 
+          "Please check your .env file."
+      )
 
-# Initialize Supabase client
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
+    # Initialize Supabase client
+    supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
+else:
+    raise ValueError(f"Unknown DB_BACKEND {DB_BACKEND!r} (expected 'supabase' or 'memory')")
+
+# Pool de threads dédié aux appels Supabase (borne la concurrence)
+_executor = ThreadPoolExecutor(max_workers=DB_MAX_WORKERS, thread_name_prefix="supabase")
 
 def get_supabase_client() -> Client:
     """
-    Returns the initialized Supabase client.
+    Returns the initialized Supabase client (or the in-memory client when
+    DB_BACKEND=memory, same query builder interface).
     Used for dependency injection if needed.
     """
     return supabase
+
+# Méthode HTTP PostgREST → opération (libellé des métriques)
+_OPERATIONS = {"GET": "select", "HEAD": "select", "POST": "insert", "PATCH": "update", "DELETE": "delete"}
+
+# Opérations qui changent la version de la table (ETags, versions.py)
+_WRITES = {"insert", "update", "delete", "upsert"}
+
+def describe_query(query) -> tuple:
+    """(table, operation) of a PostgREST query builder, for the metrics labels"""
+    request = getattr(query, "request", None)
+    if request is None:
+        return "unknown", "unknown"
+    path = str(request.path).rstrip("/")
+    table = "rpc/" + path.rsplit("/", 1)[-1] if "/rpc/" in path else path.rsplit("/", 1)[-1]
+    operation = _OPERATIONS.get(request.http_method, request.http_method.lower())
+    if operation == "insert" and "resolution=" in request.headers.get("Prefer", ""):
+        operation = "upsert"
+    if table.startswith("rpc/"):
+        operation = "rpc"
+    return table, operation
+
+async def execute(query):
+    """
+    Executes a Supabase query builder without blocking the event loop.
+    The client is synchronous, so `.execute()` runs in the bounded thread pool
+    and the handler awaits its result.
+
+    Each call is counted and timed per table and operation (metrics.py);
+    a completed write bumps the version of its table (versions.py).
+    """
+    tracing.count_supabase_call()
+    table, operation = describe_query(query)
+    loop = asyncio.get_running_loop()
+    start = time.perf_counter()
+    ok = False
+    try:
+        response = await loop.run_in_executor(_executor, query.execute)
+        ok = True
+        if operation in _WRITES:
+            versions.bump(table)
+        return response
+    finally:
+        metrics.observe_backend_call(table, operation, time.perf_counter() - start, ok)
+
+async def fetch_in(
+    build_query: Callable[[], Any],
+    column: str,
+    values: Iterable[Any],
+    chunk_size: int = DB_IN_CHUNK_SIZE,
+    concurrency: int = DB_IN_CONCURRENCY,
+) -> List[Dict[str, Any]]:
+    """
+    Rows matching `column IN values`, fetched in chunks of `chunk_size` ids.
+
+    `build_query` returns a fresh query builder (select and other filters)
+    for each chunk. At most `concurrency` chunks run at once; rows are merged
+    in chunk order, so an `.order()` only holds within a chunk.
+    """
+    values = list(dict.fromkeys(values))
+    if not values:
+        return []
+
+    chunks = [values[i:i + chunk_size] for i in range(0, len(values), chunk_size)]
+    if len(chunks) == 1:
+        response = await execute(build_query().in_(column, chunks[0]))
+        return response.data
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch_chunk(chunk):
+        async with semaphore:
+            response = await execute(build_query().in_(column, chunk))
+            return response.data
+
+    results = await asyncio.gather(*(fetch_chunk(chunk) for chunk in chunks))
+    return [row for rows in results for row in rows]
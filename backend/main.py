@@ -1,22 +1,24 @@
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.exceptions import RequestValidationError
-from uuid import UUID
-import json
+from contextlib import asynccontextmanager
 import os
 import logging
-from config import CORS_ORIGINS
-from routes import produits, commandes, formules, formule_produits, commande_formules, commande_produits, categories, types, unite, planning
-from datetime import date, datetime
+from config import CORS_ORIGINS, LOG_LEVEL
+import archiver
+import metrics
+from compression import CompressionMiddleware
+from responses import ORJSONResponse
+from routes import produits, commandes, formules, formule_produits, commande_formules, commande_produits, categories, types, unite, planning, analytics
+from datetime import datetime
 
 # ============================================
 # CONFIGURATION LOGGING
 # ============================================
 
 logging.basicConfig(
-    level=logging.INFO,
+    level=LOG_LEVEL,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger("omb")
@@ -25,24 +27,15 @@ logger = logging.getLogger("omb")
 DEBUG = os.getenv("DEBUG", "False").lower() == "true"
 
 # ============================================
-# ENCODERS CUSTOM
+# TÂCHES DE FOND
 # ============================================
 
-class UUIDEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, UUID):
-            return str(obj)
-        if isinstance(obj, (date, datetime)):
-            return obj.isoformat()
-        return json.JSONEncoder.default(self, obj)
-    
-class CustomJSONResponse(JSONResponse):
-    def render(self, content) -> bytes:
-        return json.dumps(
-            jsonable_encoder(content),
-            cls=UUIDEncoder,
-            ensure_ascii=False,
-        ).encode("utf-8")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Archivage automatique des anciennes commandes (voir archiver.py)
+    archiver.start()
+    yield
+    await archiver.stop()
 
 # ============================================
 # APPLICATION FASTAPI
@@ -52,7 +45,9 @@ app = FastAPI(
     title="Oh My Brunch API",
     description="API pour gérer les produits, formules et commandes d'Oh My Brunch",
     version="1.0.0",
-    default_response_class=CustomJSONResponse,
+    # UUID et dates sérialisés nativement par orjson (voir responses.py)
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # ============================================
@@ -65,8 +60,16 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Curseur de la page suivante des listes de commandes
+    expose_headers=["X-Next-Cursor"],
 )
 
+# Compression gzip / brotli des réponses texte (voir compression.py)
+app.add_middleware(CompressionMiddleware)
+
+# Compte et chronomètre chaque requête (exposé sur /metrics)
+app.add_middleware(metrics.MetricsMiddleware)
+
 # ============================================
 # GESTIONNAIRES D'ERREURS
 # ============================================
@@ -111,6 +114,7 @@ app.include_router(categories.router)
 app.include_router(types.router)
 app.include_router(unite.router)
 app.include_router(planning.router)
+app.include_router(analytics.router)
 
 # ============================================
 # ROUTES
@@ -132,7 +136,8 @@ async def root():
             "/categories",
             "/types",
             "/unite",
-            "/planning"
+            "/planning",
+            "/analytics"
         ]
     }
 
@@ -144,6 +149,11 @@ async def health_check():
         "timestamp": datetime.now().isoformat()
     }
 
+@app.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    """Métriques au format d'exposition Prometheus"""
+    return PlainTextResponse(metrics.render(), media_type=metrics.CONTENT_TYPE)
+
 # ============================================
 # LANCEMENT
 # ============================================
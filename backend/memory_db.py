@@ -0,0 +1,442 @@
+import json
+import re
+import threading
+import uuid
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# ============================================
+# BASE EN MÉMOIRE (DB_BACKEND=memory)
+# ============================================
+# Remplace le client Supabase pour faire tourner l'API hors ligne (tests de
+# charge, profilage, démo) : les routes gardent leurs requêtes
+# `supabase.table(...).select(...).eq(...)` et database.execute(), seul le
+# client change (voir database.py). Seul le sous-ensemble du query builder
+# PostgREST utilisé par l'API est reproduit :
+#   select (colonnes, relation embarquée "*, produits(name)"), insert, update,
+#   upsert, delete, eq, neq, gt, gte, lt, lte, in_, or_, order, limit.
+#
+# Les lignes sont des dicts de valeurs JSON, comme les réponses PostgREST
+# (UUID et dates en chaînes). Les comparaisons suivent le type de la valeur
+# stockée, et NULL ne correspond à aucun filtre, comme en SQL.
+# Les filtres eq / in_ passent par un index par colonne (construit à la
+# première lecture, reconstruit après une écriture sur la table), comme les
+# index de la base : pas de parcours complet par paquet de fetch_in.
+#
+# Les données de départ viennent d'un fichier de fixtures JSON :
+#   {"anchor": "2026-01-05", "tables": {"produits": [...], ...}}
+# Les dates des commandes sont décalées de (aujourd'hui - anchor) jours au
+# chargement, pour que le planning de la semaine ait toujours des commandes.
+
+# Tables dont la clé primaire est un UUID (les autres : entier auto-incrémenté)
+_UUID_TABLES = {"produits", "formules", "carnet_commande"}
+
+# Valeurs par défaut des colonnes à l'insertion (DEFAULT du schéma)
+_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    "carnet_commande": {"archived": False, "archived_at": None},
+    "commande_formules": {"quantite_recommandee": 0},
+}
+
+# Suppressions en cascade (ON DELETE CASCADE) : table → [(table enfant, clé étrangère)]
+_CASCADES: Dict[str, List[Tuple[str, str]]] = {
+    "carnet_commande": [("commande_formules", "commande_id"), ("commande_produits", "commande_id")],
+    "commande_formules": [("commande_formule_exclusions", "commande_formule_id")],
+    "formules": [("formule_produits", "formule_id")],
+}
+
+# Colonnes de date (ou d'horodatage) décalées au chargement des fixtures
+_DATE_COLUMNS = {"carnet_commande": ("delivery_date", "archived_at")}
+
+_OPERATIONS_HTTP = {"select": "GET", "insert": "POST", "upsert": "POST", "update": "PATCH", "delete": "DELETE"}
+
+@dataclass
+class MemoryResponse:
+    """Same attributes as postgrest's APIResponse"""
+    data: List[Dict[str, Any]]
+    count: Optional[int] = None
+
+@dataclass
+class _Request:
+    """What database.describe_query() reads from a PostgREST builder"""
+    path: str
+    http_method: str
+    headers: Dict[str, str] = field(default_factory=dict)
+
+# ============================================
+# FILTRES
+# ============================================
+
+def _coerce(stored: Any, value: Any) -> Any:
+    """`value` converted to the type of the stored value (PostgREST sends text)"""
+    if isinstance(stored, bool):
+        return value if isinstance(value, bool) else str(value).lower() in ("true", "t", "1")
+    if isinstance(stored, (int, float)):
+        return float(value)
+    return value if isinstance(value, str) else str(value)
+
+_COMPARATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    "eq": lambda a, b: a == b,
+    "neq": lambda a, b: a != b,
+    "gt": lambda a, b: a > b,
+    "gte": lambda a, b: a >= b,
+    "lt": lambda a, b: a < b,
+    "lte": lambda a, b: a <= b,
+}
+
+Filter = Callable[[Dict[str, Any]], bool]
+
+def _index_key(value: Any) -> str:
+    """Key of a value in the column indexes, whatever its type (5, 5.0, "5")"""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).lower() if isinstance(value, str) and value.lower() in ("true", "false") else str(value)
+
+def _compare(column: str, operator: str, value: Any) -> Filter:
+    compare = _COMPARATORS[operator]
+    # Valeur convertie une fois par type stocké, pas à chaque ligne
+    coerced: Dict[type, Any] = {}
+    def test(row):
+        stored = row.get(column)
+        if stored is None:
+            return False
+        kind = type(stored)
+        if kind not in coerced:
+            coerced[kind] = _coerce(stored, value)
+        return compare(stored, coerced[kind])
+    if operator == "eq":
+        test.lookup = (column, [value])
+    return test
+
+def _contains(column: str, values) -> Filter:
+    values = list(values)
+    accepted: Dict[type, set] = {}
+    def test(row):
+        stored = row.get(column)
+        if stored is None:
+            return False
+        kind = type(stored)
+        if kind not in accepted:
+            accepted[kind] = {_coerce(stored, value) for value in values}
+        return stored in accepted[kind]
+    test.lookup = (column, values)
+    return test
+
+def _split_top_level(expression: str) -> List[str]:
+    """Split on the commas that are not inside parentheses"""
+    parts, depth, current = [], 0, ""
+    for char in expression:
+        if char == "," and depth == 0:
+            parts.append(current)
+            current = ""
+            continue
+        depth += (char == "(") - (char == ")")
+        current += char
+    if current:
+        parts.append(current)
+    return [part.strip() for part in parts]
+
+def _parse_logic(expression: str) -> List[Filter]:
+    """PostgREST logic tree: "a.lt.1,and(b.eq.2,c.is.null)" → one filter per term"""
+    filters = []
+    for term in _split_top_level(expression):
+        match = re.fullmatch(r"(and|or)\((.*)\)", term)
+        if match:
+            operator, inner = match.groups()
+            children = _parse_logic(inner)
+            combine = all if operator == "and" else any
+            filters.append(lambda row, children=children, combine=combine: combine(f(row) for f in children))
+            continue
+        column, operator, value = term.split(".", 2)
+        if operator == "is":
+            expected = {"null": None, "true": True, "false": False}[value.lower()]
+            filters.append(lambda row, column=column, expected=expected: row.get(column) is expected)
+        elif operator == "in":
+            filters.append(_contains(column, _split_top_level(value.strip("()"))))
+        else:
+            filters.append(_compare(column, operator, value))
+    return filters
+
+# ============================================
+# PROJECTION (COLONNES ET RELATION EMBARQUÉE)
+# ============================================
+
+def _foreign_key(table: str) -> str:
+    """Column referencing `table` (produits → produit_id)"""
+    return (table[:-1] if table.endswith("s") else table) + "_id"
+
+def _parse_columns(columns: str) -> List[Tuple[str, Optional[List[str]]]]:
+    """"*, produits(name)" → [("*", None), ("produits", ["name"])]"""
+    parsed = []
+    for item in _split_top_level(columns):
+        match = re.fullmatch(r"(\w+)\((.*)\)", item)
+        if match:
+            parsed.append((match.group(1), [column for column, _ in _parse_columns(match.group(2))]))
+        else:
+            parsed.append((item, None))
+    return parsed
+
+# ============================================
+# CLIENT ET QUERY BUILDER
+# ============================================
+
+class MemoryQuery:
+    """One query on one table; chained like the PostgREST builder, run by execute()"""
+
+    def __init__(self, db: "MemoryClient", table: str):
+        self.db = db
+        self.table_name = table
+        self.operation = "select"
+        self.columns = "*"
+        self.payload: Any = None
+        self.on_conflict = "id"
+        self.filters: List[Filter] = []
+        self.orders: List[Tuple[str, bool]] = []
+        self.row_limit: Optional[int] = None
+
+    @property
+    def request(self) -> _Request:
+        headers = {"Prefer": "resolution=merge-duplicates"} if self.operation == "upsert" else {}
+        return _Request(f"/rest/v1/{self.table_name}", _OPERATIONS_HTTP[self.operation], headers)
+
+    # Opérations
+    def select(self, *columns: str, **_):
+        self.columns = ",".join(columns) or "*"
+        return self
+
+    def insert(self, json: Any, **_):
+        self.operation, self.payload = "insert", json
+        return self
+
+    def upsert(self, json: Any, *, on_conflict: str = "", **_):
+        self.operation, self.payload = "upsert", json
+        self.on_conflict = on_conflict or "id"
+        return self
+
+    def update(self, json: Dict[str, Any], **_):
+        self.operation, self.payload = "update", json
+        return self
+
+    def delete(self, **_):
+        self.operation = "delete"
+        return self
+
+    # Filtres et modificateurs
+    def eq(self, column: str, value: Any):
+        self.filters.append(_compare(column, "eq", value))
+        return self
+
+    def neq(self, column: str, value: Any):
+        self.filters.append(_compare(column, "neq", value))
+        return self
+
+    def gt(self, column: str, value: Any):
+        self.filters.append(_compare(column, "gt", value))
+        return self
+
+    def gte(self, column: str, value: Any):
+        self.filters.append(_compare(column, "gte", value))
+        return self
+
+    def lt(self, column: str, value: Any):
+        self.filters.append(_compare(column, "lt", value))
+        return self
+
+    def lte(self, column: str, value: Any):
+        self.filters.append(_compare(column, "lte", value))
+        return self
+
+    def in_(self, column: str, values):
+        self.filters.append(_contains(column, values))
+        return self
+
+    def or_(self, filters: str, **_):
+        children = _parse_logic(filters)
+        self.filters.append(lambda row: any(f(row) for f in children))
+        return self
+
+    def order(self, column: str, *, desc: bool = False, **_):
+        self.orders.append((column, desc))
+        return self
+
+    def limit(self, size: int, **_):
+        self.row_limit = size
+        return self
+
+    def execute(self) -> MemoryResponse:
+        with self.db.lock:
+            data = getattr(self, "_" + self.operation)(self.db.rows(self.table_name))
+            if self.operation != "select":
+                self.db.drop_indexes(self.table_name)
+        # Copies : les appelants peuvent modifier les lignes sans toucher la base
+        # (les valeurs sont des scalaires JSON, une copie superficielle suffit)
+        return MemoryResponse([dict(row) for row in data])
+
+    def _matches(self, row: Dict[str, Any]) -> bool:
+        return all(test(row) for test in self.filters)
+
+    def _candidates(self, rows):
+        """Rows that may match: from a column index when there is an eq / in_ filter"""
+        for test in self.filters:
+            lookup = getattr(test, "lookup", None)
+            if lookup:
+                column, values = lookup
+                index = self.db.index(self.table_name, column)
+                positions = sorted({p for value in values for p in index.get(_index_key(value), ())})
+                return [rows[p] for p in positions]
+        return rows
+
+    def _select(self, rows):
+        selected = [row for row in self._candidates(rows) if self._matches(row)]
+        # Tri stable, clé par clé de la dernière à la première ; NULL en dernier
+        # en ordre croissant, en premier en ordre décroissant (comme Postgres)
+        for column, desc in reversed(self.orders):
+            selected.sort(key=lambda row: (row.get(column) is None, row.get(column)), reverse=desc)
+        if self.row_limit is not None:
+            selected = selected[:self.row_limit]
+        if self.columns.strip() == "*":
+            return selected
+        columns = _parse_columns(self.columns)
+        return [self._project(row, columns) for row in selected]
+
+    def _project(self, row, columns):
+        result = {}
+        for column, embedded in columns:
+            if column == "*":
+                result.update(row)
+            elif embedded is None:
+                result[column] = row.get(column)
+            else:
+                key = row.get(_foreign_key(column))
+                target = self.db.find(column, key)
+                result[column] = None if target is None else (
+                    dict(target) if "*" in embedded else {name: target.get(name) for name in embedded}
+                )
+        return result
+
+    def _new_row(self, values: Dict[str, Any]) -> Dict[str, Any]:
+        row = {**_DEFAULTS.get(self.table_name, {}), **values}
+        if row.get("id") is None:
+            row["id"] = self.db.next_id(self.table_name)
+        return row
+
+    def _insert(self, rows):
+        payload = self.payload if isinstance(self.payload, list) else [self.payload]
+        created = [self._new_row(values) for values in payload]
+        rows.extend(created)
+        return created
+
+    def _upsert(self, rows):
+        payload = self.payload if isinstance(self.payload, list) else [self.payload]
+        keys = [key.strip() for key in self.on_conflict.split(",")]
+        index = {tuple(row.get(key) for key in keys): row for row in rows}
+        result = []
+        for values in payload:
+            existing = index.get(tuple(values.get(key) for key in keys))
+            if existing is not None:
+                existing.update(values)
+                result.append(existing)
+            else:
+                row = self._new_row(values)
+                rows.append(row)
+                index[tuple(row.get(key) for key in keys)] = row
+                result.append(row)
+        return result
+
+    def _update(self, rows):
+        updated = [row for row in self._candidates(rows) if self._matches(row)]
+        for row in updated:
+            row.update(self.payload)
+        return updated
+
+    def _delete(self, rows):
+        deleted = [row for row in self._candidates(rows) if self._matches(row)]
+        if deleted:
+            self.db.remove(self.table_name, deleted)
+        return deleted
+
+def _shift(value: str, shift: timedelta) -> str:
+    parse = date.fromisoformat if len(value) == 10 else datetime.fromisoformat
+    return (parse(value) + shift).isoformat()
+
+class MemoryClient:
+    """Stand-in for the supabase Client: `.table(name)` returns a MemoryQuery"""
+
+    def __init__(self, tables: Optional[Dict[str, List[Dict[str, Any]]]] = None):
+        self.lock = threading.RLock()
+        self.reset(tables or {})
+
+    def reset(self, tables: Dict[str, List[Dict[str, Any]]]):
+        """Replace the whole content (ex: a generated benchmark dataset)"""
+        with self.lock:
+            self.tables: Dict[str, List[Dict[str, Any]]] = {
+                name: [dict(row) for row in rows] for name, rows in tables.items()
+            }
+            self._sequences = {
+                name: max((row["id"] for row in rows if isinstance(row.get("id"), int)), default=0)
+                for name, rows in self.tables.items()
+            }
+            # (table, colonne) → {clé : positions des lignes}
+            self._indexes: Dict[Tuple[str, str], Dict[str, List[int]]] = {}
+
+    @classmethod
+    def from_fixtures(cls, path: str, today: Optional[date] = None) -> "MemoryClient":
+        """Client seeded from a fixtures file (see the section above)"""
+        with open(path, encoding="utf-8") as f:
+            fixtures = json.load(f)
+        tables = fixtures["tables"]
+        if fixtures.get("anchor"):
+            shift = (today or date.today()) - date.fromisoformat(fixtures["anchor"])
+            for table, columns in _DATE_COLUMNS.items():
+                for row in tables.get(table, ()):
+                    for column in columns:
+                        if row.get(column):
+                            row[column] = _shift(row[column], shift)
+        return cls(tables)
+
+    def table(self, name: str) -> MemoryQuery:
+        return MemoryQuery(self, name)
+
+    from_ = table
+
+    def rows(self, table: str) -> List[Dict[str, Any]]:
+        return self.tables.setdefault(table, [])
+
+    def find(self, table: str, key: Any) -> Optional[Dict[str, Any]]:
+        if key is None:
+            return None
+        return next((row for row in self.rows(table) if row.get("id") == key), None)
+
+    def next_id(self, table: str):
+        if table in _UUID_TABLES:
+            return str(uuid.uuid4())
+        self._sequences[table] = self._sequences.get(table, 0) + 1
+        return self._sequences[table]
+
+    def index(self, table: str, column: str) -> Dict[str, List[int]]:
+        """Positions of the rows of `table` by value of `column` (built on first use)"""
+        index = self._indexes.get((table, column))
+        if index is None:
+            index = self._indexes[(table, column)] = {}
+            for position, row in enumerate(self.rows(table)):
+                value = row.get(column)
+                if value is not None:
+                    index.setdefault(_index_key(value), []).append(position)
+        return index
+
+    def drop_indexes(self, table: str):
+        for key in [key for key in self._indexes if key[0] == table]:
+            del self._indexes[key]
+
+    def remove(self, table: str, deleted: List[Dict[str, Any]]):
+        """Delete rows of `table`, and their children (ON DELETE CASCADE)"""
+        deleted_ids = {id(row) for row in deleted}
+        self.tables[table] = [row for row in self.rows(table) if id(row) not in deleted_ids]
+        self.drop_indexes(table)
+        keys = {row.get("id") for row in deleted}
+        for child, foreign_key in _CASCADES.get(table, ()):
+            children = [row for row in self.rows(child) if row.get(foreign_key) in keys]
+            if children:
+                self.remove(child, children)
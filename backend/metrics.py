@@ -0,0 +1,181 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, List, Sequence, Tuple
+
+# ============================================
+# MÉTRIQUES (FORMAT D'EXPOSITION PROMETHEUS)
+# ============================================
+# Compteurs, jauges et histogrammes gardés en mémoire dans le processus et
+# rendus en texte sur /metrics : requêtes HTTP par route (gabarit, pas URL),
+# requêtes en cours, appels Supabase par table et opération.
+# Aucun service externe : un Prometheus peut simplement scraper /metrics.
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Bornes (secondes) des histogrammes de latence
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_lock = threading.Lock()
+_registry: List["_Metric"] = []
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+class _Metric(ABC):
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], object] = {}
+        _registry.append(self)
+
+    @abstractmethod
+    def _samples(self) -> List[str]:
+        """Sample lines, rendered under the lock"""
+
+    def render(self) -> str:
+        with _lock:
+            samples = self._samples()
+        return "\n".join([
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+            *samples,
+        ])
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, *labels: str, amount: float = 1):
+        with _lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def total(self) -> float:
+        """Sum over every label set (benchmarks)"""
+        with _lock:
+            return sum(self._values.values())
+
+    def _samples(self) -> List[str]:
+        return [f"{self.name}{_labels(self.labelnames, key)} {_number(value)}" for key, value in self._values.items()]
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1):
+        self.inc(*labels, amount=-amount)
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets=LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+
+    def observe(self, value: float, *labels: str):
+        with _lock:
+            state = self._values.get(labels)
+            if state is None:
+                # [compte par borne (non cumulé), somme]
+                state = self._values[labels] = [[0] * len(self.buckets), 0.0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[0][i] += 1
+                    break
+            state[1] += value
+
+    def _samples(self) -> List[str]:
+        lines = []
+        for key, (counts, total) in self._values.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                le = 'le="' + _number(bound) + '"'
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, key)} {_number(total)}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, key)} {cumulative}")
+        return lines
+
+def render() -> str:
+    """Every registered metric, in the Prometheus text exposition format"""
+    return "\n".join(metric.render() for metric in _registry) + "\n"
+
+# ============================================
+# MÉTRIQUES DE L'API
+# ============================================
+
+http_requests = Counter(
+    "omb_http_requests_total", "Requêtes HTTP traitées", ("method", "route", "status")
+)
+http_latency = Histogram(
+    "omb_http_request_duration_seconds", "Durée des requêtes HTTP, réponse envoyée", ("method", "route")
+)
+http_in_progress = Gauge(
+    "omb_http_requests_in_progress", "Requêtes HTTP en cours", ("method",)
+)
+backend_calls = Counter(
+    "omb_backend_calls_total", "Appels Supabase", ("table", "operation", "status")
+)
+backend_latency = Histogram(
+    "omb_backend_call_duration_seconds", "Durée des appels Supabase", ("table", "operation")
+)
+compression_cache = Counter(
+    "omb_compression_cache_total", "Réponses compressées avec ETag, servies depuis le cache ou non", ("result",)
+)
+archive_runs = Counter(
+    "omb_archive_runs_total", "Passages de l'archivage automatique", ("trigger", "result")
+)
+archived_commandes = Counter(
+    "omb_archived_commandes_total", "Commandes archivées par l'archivage automatique"
+)
+
+def observe_backend_call(table: str, operation: str, seconds: float, ok: bool):
+    backend_calls.inc(table, operation, "ok" if ok else "error")
+    backend_latency.observe(seconds, table, operation)
+
+class MetricsMiddleware:
+    """
+    ASGI middleware counting and timing every HTTP request.
+
+    The route label is the matched path template (ex: /commandes/{commande_id}),
+    so ids do not multiply the series; unmatched paths share "unmatched".
+    The duration runs until the last body chunk, streamed responses included.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = [500]
+        start = time.perf_counter()
+        http_in_progress.inc(method)
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            http_in_progress.dec(method)
+            http_requests.inc(method, route, str(status[0]))
+            http_latency.observe(time.perf_counter() - start, method, route)
@@ -134,8 +134,8 @@ class CarnetCommandeUpdate(BaseModel):
 
 # ================ COMMANDE_FORMULES MODELS ================
 
-class CommandeFormuleBase(UUIDModel):
-    commande_id: UUID
+class CommandeFormuleItem(UUIDModel):
+    """Formule d'une commande, sans commande_id (création avec composition)"""
     formule_id: UUID
     quantite_recommandee: float = Field(default=0, ge=0, le=10000)
     quantite_finale: float = Field(default=0, ge=0, le=10000)
@@ -149,6 +149,9 @@ class CommandeFormuleBase(UUIDModel):
             raise ValueError('Quantité trop élevée (max 10000)')
         return round(v, 2)
 
+class CommandeFormuleBase(CommandeFormuleItem):
+    commande_id: UUID
+
 class CommandeFormuleCreate(CommandeFormuleBase):
     class Config:
         extra = 'forbid'
@@ -163,8 +166,8 @@ class CommandeFormuleUpdate(BaseModel):
 
 # ================ COMMANDE_PRODUITS MODELS ================
 
-class CommandeProduitBase(UUIDModel):
-    commande_id: UUID
+class CommandeProduitItem(UUIDModel):
+    """Produit direct d'une commande, sans commande_id (création avec composition)"""
     produit_id: UUID
     quantite: float = Field(default=0, ge=0, le=10000)
     unite: Optional[constr(max_length=50)] = None
@@ -177,6 +180,9 @@ class CommandeProduitBase(UUIDModel):
             raise ValueError('Quantité trop élevée')
         return round(v, 2)
 
+class CommandeProduitBase(CommandeProduitItem):
+    commande_id: UUID
+
 class CommandeProduitCreate(CommandeProduitBase):
     class Config:
         extra = 'forbid'
@@ -189,10 +195,33 @@ class CommandeProduitUpdate(BaseModel):
         extra = 'forbid'
 
 
+# ================ COMMANDE AVEC COMPOSITION ================
+
+class CommandeWithCompositionCreate(CarnetCommandeBase):
+    formules: List[CommandeFormuleItem] = Field(default_factory=list, max_length=200)
+    produits: List[CommandeProduitItem] = Field(default_factory=list, max_length=500)
+    
+    class Config:
+        extra = 'forbid'
+
+
+class CommandeFormuleState(CommandeFormuleItem):
+    """Formule dans l'état final voulu : id d'une ligne existante, ou None pour l'ajouter"""
+    id: Optional[int] = None
+
+class CommandeProduitState(CommandeProduitItem):
+    """Produit dans l'état final voulu : id d'une ligne existante, ou None pour l'ajouter"""
+    id: Optional[int] = None
+
+class CommandeCompositionUpdate(UUIDModel):
+    formules: List[CommandeFormuleState] = Field(default_factory=list, max_length=200)
+    produits: List[CommandeProduitState] = Field(default_factory=list, max_length=500)
+
+
 # ================ FORMULE_PRODUITS MODELS ================
 
-class FormuleProduitBase(UUIDModel):
-    formule_id: UUID
+class FormuleProduitItem(UUIDModel):
+    """Produit de la composition d'une formule, sans formule_id (remplacement en bloc)"""
     produit_id: UUID
     quantite: float = Field(default=0, ge=0, le=10000)
     unite: Optional[constr(max_length=50)] = None
@@ -203,6 +232,9 @@ class FormuleProduitBase(UUIDModel):
             raise ValueError('La quantité ne peut pas être négative')
         return round(v, 2)
 
+class FormuleProduitBase(FormuleProduitItem):
+    formule_id: UUID
+
 class FormuleProduitCreate(FormuleProduitBase):
     class Config:
         extra = 'forbid'
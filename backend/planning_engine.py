@@ -0,0 +1,474 @@
+import asyncio
+import time
+from collections import defaultdict
+from itertools import chain
+from typing import Any, Awaitable, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from database import get_supabase_client, execute, fetch_in
+import catalog
+import cold_storage
+import compositions
+
+# ============================================
+# MOTEUR DU PLANNING DE PRODUCTION
+# ============================================
+# Récupération des commandes et de leurs relations, puis calcul de la
+# contribution de chaque commande (produits et quantités). Utilisé par
+# routes/planning.py et par le stock de totaux journaliers (totals.py).
+# Avec COLD_STORAGE_DIR, les commandes exportées en Parquet comptent aussi :
+# lues dans les fichiers avec leurs relations (voir cold_storage.py).
+
+supabase = get_supabase_client()
+
+async def _fetch(query) -> List[Dict[str, Any]]:
+    response = await execute(query)
+    return response.data
+
+async def timed(timings: Dict[str, float], stage: str, awaitable: Awaitable) -> Any:
+    """Await `awaitable` and record its duration (ms) under `stage`"""
+    start = time.perf_counter()
+    result = await awaitable
+    timings[stage] = round((time.perf_counter() - start) * 1000, 1)
+    return result
+
+async def fetch_commandes(
+    date_debut: str,
+    date_fin: str,
+    timings: Dict[str, float],
+    exported: Optional[List[Dict[str, Any]]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Commandes delivered between the two dates (inclusive), ordered by delivery
+    date then id (the order totals.py sums a day in).
+    With cold storage, the exported commandes of the range are included
+    (Supabase wins on a duplicate id) and appended to `exported`: pass it on
+    to prefetch_relations(), their relations are in the files.
+    """
+    commandes = await timed(timings, "commandes", _fetch(
+        supabase.table("carnet_commande")
+        .select("*")
+        .gte("delivery_date", date_debut)
+        .lte("delivery_date", date_fin)
+        .order("delivery_date")
+        .order("id")
+    ))
+    if not cold_storage.ENABLED:
+        return commandes
+    # Seuls les mois de la période sont ouverts : rien à lire pour les dates récentes
+    cold = await timed(timings, "commandes_exportees", asyncio.to_thread(
+        cold_storage.read_commandes, "*", date_debut, date_fin
+    ))
+    hot_ids = {commande["id"] for commande in commandes}
+    cold = [commande for commande in cold if commande["id"] not in hot_ids]
+    if not cold:
+        return commandes
+    if exported is not None:
+        exported.extend(cold)
+    return sorted(commandes + cold, key=lambda commande: (commande["delivery_date"], commande["id"]))
+
+async def prefetch_relations(
+    commande_ids: List[str],
+    timings: Dict[str, float],
+    exported: Sequence[Dict[str, Any]] = (),
+) -> Dict[str, Any]:
+    """
+    Fetch the relations and produits needed by the planning of `commande_ids`.
+    Those of the `exported` commandes (see fetch_commandes()) among them are
+    read from cold storage, alongside the Supabase queries.
+
+    Each query starts as soon as its inputs are known, so the latency follows
+    the longest dependency chain instead of the sum of all round-trips:
+
+        commande_ids ─┬─→ commande_formules ─┬─→ formule_ids ─→ formules
+                      │                      └─→ exclusions (masques)
+                      └─→ commande_produits
+
+    Id lists are sent in bounded chunks (database.fetch_in), so long
+    periods do not produce oversized PostgREST URLs.
+
+    Produits (with categorie and type) and the compiled formule compositions
+    come from the caches (no round-trip when warm) and are loaded alongside
+    the relations otherwise.
+    """
+    start = time.perf_counter()
+
+    requested = set(commande_ids)
+    exported = [commande for commande in exported if commande["id"] in requested]
+    if exported:
+        exported_ids = {commande["id"] for commande in exported}
+        commande_ids = [commande_id for commande_id in commande_ids if commande_id not in exported_ids]
+
+    commande_formules_task = asyncio.create_task(timed(timings, "commande_formules", fetch_in(
+        lambda: supabase.table("commande_formules").select("*"), "commande_id", commande_ids
+    )))
+    commande_produits_task = asyncio.create_task(timed(timings, "commande_produits", fetch_in(
+        lambda: supabase.table("commande_produits").select("*"), "commande_id", commande_ids
+    )))
+    produits_infos_task = asyncio.create_task(timed(timings, "catalogue", catalog.get_produits_infos()))
+    compositions_task = asyncio.create_task(timed(timings, "compositions", compositions.get_index()))
+    tasks = [commande_formules_task, commande_produits_task, produits_infos_task, compositions_task]
+    if exported:
+        exported_task = asyncio.create_task(timed(timings, "relations_exportees", cold_storage.load_relations(exported)))
+        tasks.append(exported_task)
+
+    try:
+        commande_formules = await commande_formules_task
+        formule_ids = list({cf["formule_id"] for cf in commande_formules})
+
+        formules, exclusions = [], {}
+        if formule_ids:
+            formules_task = asyncio.create_task(timed(timings, "formules", fetch_in(
+                lambda: supabase.table("formules").select("id, name, type_formule"), "id", formule_ids
+            )))
+            tasks.append(formules_task)
+            exclusions = await timed(
+                timings, "exclusions",
+                compositions.get_exclusion_masks([cf["id"] for cf in commande_formules])
+            )
+            formules = await formules_task
+
+        commande_produits = await commande_produits_task
+        produits_infos = await produits_infos_task
+        compositions_index = await compositions_task
+
+        if exported:
+            cold = await exported_task
+            commande_formules = commande_formules + cold["commande_formules"]
+            commande_produits = commande_produits + cold["commande_produits"]
+            loaded = {formule["id"] for formule in formules}
+            formules = formules + [formule for formule in cold["formules"] if formule["id"] not in loaded]
+            exclusions = {**exclusions, **cold["exclusions"]}
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+    timings["prefetch"] = round((time.perf_counter() - start) * 1000, 1)
+
+    return {
+        "commande_formules": commande_formules,
+        "formules": formules,
+        "commande_produits": commande_produits,
+        "exclusions": exclusions,
+        "compositions": compositions_index,
+        "produits_infos": produits_infos,
+    }
+
+def group_by_commande(rows: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Group relation rows by their commande_id"""
+    grouped = defaultdict(list)
+    for row in rows:
+        grouped[row["commande_id"]].append(row)
+    return grouped
+
+def commande_contribution(
+    commande_id: str,
+    commande_produits_map: Dict[str, List[Dict[str, Any]]],
+    commande_formules_map: Dict[str, List[Dict[str, Any]]],
+    compositions_index: Dict[str, Any],
+    exclusions_masks: Dict[Any, Any],
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Produits of a commande with their quantities: direct produits first,
+    then the produits of its formules (without the excluded ones).
+
+    Returns {produit_id: {"quantite", "unite", "source", "derniere_unite"}}
+    where source is "suppl", "formule", or "mixte" when the produit appears
+    more than once. unite is the one of the first line (commande detail),
+    derniere_unite the one of the last line (daily totals).
+    Not filtered on the catalog nor on categories.
+    """
+    produits = {}
+
+    # Produits directs
+    for cp in commande_produits_map.get(commande_id, ()):
+        produit_id = cp["produit_id"]
+        ligne = produits.get(produit_id)
+        if ligne:
+            ligne["quantite"] += cp["quantite"]
+            ligne["source"] = "mixte"
+            ligne["derniere_unite"] = cp["unite"]
+        else:
+            produits[produit_id] = {
+                "quantite": cp["quantite"], "unite": cp["unite"], "source": "suppl", "derniere_unite": cp["unite"]
+            }
+
+    # Produits via formules
+    for cf in commande_formules_map.get(commande_id, ()):
+        quantite_finale = cf["quantite_finale"]
+        excluded = exclusions_masks.get(cf["id"], compositions.NO_EXCLUSIONS)
+
+        for produit_id, quantite_par_personne, unite in compositions.expand(compositions_index, cf["formule_id"], excluded):
+            quantite_totale = quantite_par_personne * quantite_finale
+            ligne = produits.get(produit_id)
+            if ligne:
+                ligne["quantite"] += quantite_totale
+                ligne["source"] = "mixte"
+                ligne["derniere_unite"] = unite
+            else:
+                produits[produit_id] = {
+                    "quantite": quantite_totale, "unite": unite, "source": "formule", "derniere_unite": unite
+                }
+
+    return produits
+
+# ============================================
+# AGRÉGATION VECTORISÉE
+# ============================================
+# Les lignes (produits directs puis produits des formules, dans l'ordre des
+# commandes) sont encodées en indices entiers ; quantités, regroupements et
+# sommes sont calculés sur des tableaux NumPy. Les sommes suivent l'ordre des
+# lignes, comme l'accumulation Python : les résultats sont identiques.
+
+def _encode(index: Dict[Any, int], values: List[Any]) -> np.ndarray:
+    return np.fromiter(map(index.__getitem__, values), dtype=np.int64, count=len(values))
+
+def _is_float(values: List[Any]) -> np.ndarray:
+    return np.fromiter((type(value) is float for value in values), dtype=bool, count=len(values))
+
+def _group(keys: np.ndarray):
+    """Groups of equal keys: (first position, last position, inverse) of each group"""
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    starts = np.ones(len(keys), dtype=bool)
+    starts[1:] = sorted_keys[1:] != sorted_keys[:-1]
+    start_positions = np.flatnonzero(starts)
+    end_positions = np.empty_like(start_positions)
+    end_positions[:-1] = start_positions[1:] - 1
+    end_positions[-1:] = len(keys) - 1
+    inverse = np.empty(len(keys), dtype=np.int64)
+    inverse[order] = np.cumsum(starts) - 1
+    return order[start_positions], order[end_positions], inverse
+
+def _to_numbers(sums: np.ndarray, is_float: np.ndarray) -> List[Any]:
+    """Back to the Python types the loop would produce (int unless a float was involved)"""
+    if is_float.all():
+        return sums.tolist()
+    if not is_float.any():
+        return sums.astype(np.int64).tolist()
+    return np.where(is_float, sums.astype(object), sums.astype(np.int64).astype(object)).tolist()
+
+SOURCES = np.array(["formule", "suppl", "mixte"], dtype=object)
+
+def aggregate_commandes(
+    commandes: List[Dict[str, Any]],
+    commande_produits_map: Dict[str, List[Dict[str, Any]]],
+    commande_formules_map: Dict[str, List[Dict[str, Any]]],
+    compositions_index: Dict[str, Any],
+    exclusions_masks: Dict[Any, Any],
+) -> Dict[str, Any]:
+    """
+    commande_contribution() for a whole list of commandes at once.
+
+    Returns arrays over the (commande, produit) groups, in the order
+    commande_contribution() would list them: "commande" (position in
+    `commandes`), "produit" (index in "produit_ids"), "sums" and "is_float"
+    (quantite), "unite_index" and "derniere_unite_index" (in "unites") and
+    "source" (SOURCES code), plus the line arrays "line_group" (group of
+    each line), "line_quantite", "line_is_float" and "line_unite" in line
+    order. Python values are only built by the readers
+    (commande_details(), commande_contributions(), daily_totals()).
+    """
+    positions = np.arange(len(commandes), dtype=np.int64)
+
+    # Produits directs et commande_formules, dans l'ordre des commandes
+    cps_by_commande = [commande_produits_map.get(c["id"], ()) for c in commandes]
+    cps = list(chain.from_iterable(cps_by_commande))
+    cfs_by_commande = [commande_formules_map.get(c["id"], ()) for c in commandes]
+    cfs = list(chain.from_iterable(cfs_by_commande))
+
+    formule_ids = list(dict.fromkeys(cf["formule_id"] for cf in cfs))
+    formule_items = [compositions.expand(compositions_index, formule_id) for formule_id in formule_ids]
+    items = list(chain.from_iterable(formule_items))
+    cf_positions = {cf["id"]: position for position, cf in enumerate(cfs)}
+    masks = [
+        (cf_positions[cf_id], mask) for cf_id, mask in exclusions_masks.items()
+        if mask and cf_id in cf_positions
+    ]
+
+    # Encodage des produits et unités en indices
+    cp_produits = [cp["produit_id"] for cp in cps]
+    item_produits = [item[0] for item in items]
+    produit_ids = list(dict.fromkeys(chain(
+        cp_produits, item_produits, chain.from_iterable(mask for _, mask in masks)
+    )))
+    produit_index = {produit_id: i for i, produit_id in enumerate(produit_ids)}
+    cp_unites = [cp["unite"] for cp in cps]
+    item_unites = [item[2] for item in items]
+    unites = list(dict.fromkeys(chain(cp_unites, item_unites)))
+    unite_index = {unite: i for i, unite in enumerate(unites)}
+    nb_produits = max(len(produit_ids), 1)
+
+    # Lignes des produits directs
+    direct_commande = np.repeat(positions, [len(rows) for rows in cps_by_commande])
+    cp_quantites = [cp["quantite"] for cp in cps]
+    direct_quantite = np.array(cp_quantites, dtype=np.float64)
+    direct_is_float = _is_float(cp_quantites)
+
+    # Expansion des formules : une ligne par (commande_formule, item de sa formule)
+    formule_index = {formule_id: i for i, formule_id in enumerate(formule_ids)}
+    formule_lengths = np.array([len(f) for f in formule_items], dtype=np.int64)
+    formule_offsets = np.cumsum(formule_lengths) - formule_lengths
+    cf_formule = _encode(formule_index, [cf["formule_id"] for cf in cfs])
+    cf_quantites = [cf["quantite_finale"] for cf in cfs]
+    counts = formule_lengths[cf_formule]
+    line_cf = np.repeat(np.arange(len(cfs), dtype=np.int64), counts)
+    line_item = np.repeat(formule_offsets[cf_formule] - (np.cumsum(counts) - counts), counts) + np.arange(len(line_cf))
+
+    item_quantites = [item[1] for item in items]
+    formule_produit = _encode(produit_index, item_produits)[line_item]
+    formule_quantite = (
+        np.array(item_quantites, dtype=np.float64)[line_item] * np.array(cf_quantites, dtype=np.float64)[line_cf]
+    )
+    formule_is_float = _is_float(item_quantites)[line_item] | _is_float(cf_quantites)[line_cf]
+    formule_unite = _encode(unite_index, item_unites)[line_item]
+    formule_commande = np.repeat(positions, [len(rows) for rows in cfs_by_commande])[line_cf]
+
+    # Produits exclus des commande_formules
+    keep = slice(None)
+    if masks:
+        excluded = np.sort(np.array(
+            [position * nb_produits + produit_index[produit_id] for position, mask in masks for produit_id in mask],
+            dtype=np.int64,
+        ))
+        line_keys = line_cf * nb_produits + formule_produit
+        found = np.minimum(np.searchsorted(excluded, line_keys), len(excluded) - 1)
+        keep = excluded[found] != line_keys
+
+    # Toutes les lignes, dans l'ordre : par commande, produits directs puis formules
+    commande = np.concatenate([direct_commande, formule_commande[keep]])
+    order = np.argsort(commande, kind="stable")
+    commande = commande[order]
+    produit = np.concatenate([_encode(produit_index, cp_produits), formule_produit[keep]])[order]
+    quantite = np.concatenate([direct_quantite, formule_quantite[keep]])[order]
+    unite = np.concatenate([_encode(unite_index, cp_unites), formule_unite[keep]])[order]
+    is_float = np.concatenate([direct_is_float, formule_is_float[keep]])[order]
+    is_direct = (order < len(cps))
+
+    # Regroupement par (commande, produit), dans l'ordre de première apparition
+    first, last, inverse = _group(commande * nb_produits + produit)
+    nb_groups = len(first)
+    sums = np.bincount(inverse, weights=quantite, minlength=nb_groups)
+    lines = np.bincount(inverse, minlength=nb_groups)
+    any_float = np.bincount(inverse, weights=is_float, minlength=nb_groups) > 0
+
+    group_order = np.argsort(first, kind="stable")
+    group_first = first[group_order]
+    group_last = last[group_order]
+    sums, any_float, lines = sums[group_order], any_float[group_order], lines[group_order]
+    group_rank = np.empty(nb_groups, dtype=np.int64)
+    group_rank[group_order] = np.arange(nb_groups)
+
+    # 0 : formule, 1 : suppl, 2 : mixte
+    source = np.where(lines > 1, 2, is_direct[group_first].astype(np.int64))
+
+    return {
+        "produit_ids": produit_ids,
+        "unites": unites,
+        "commande": commande[group_first],
+        "produit": produit[group_first],
+        "sums": sums,
+        "is_float": any_float,
+        "unite_index": unite[group_first],
+        "derniere_unite_index": unite[group_last],
+        "source": source,
+        # Lignes, dans l'ordre : totaux du jour sommés ligne par ligne
+        "line_group": group_rank[inverse],
+        "line_quantite": quantite,
+        "line_is_float": is_float,
+        "line_unite": unite,
+    }
+
+def produits_retenus(aggregation: Dict[str, Any], produits_infos: Dict[str, Dict[str, Any]], categorie: str) -> np.ndarray:
+    """Groups whose produit is in the catalog and of the requested categorie ("tous" keeps all)"""
+    retenus = np.array([
+        produit_id in produits_infos
+        and (categorie == "tous" or produits_infos[produit_id]["type"].lower() == categorie.lower())
+        for produit_id in aggregation["produit_ids"]
+    ], dtype=bool)
+    return retenus[aggregation["produit"]]
+
+def commande_details(
+    aggregation: Dict[str, Any],
+    nb_commandes: int,
+    produits_infos: Dict[str, Dict[str, Any]],
+    keep: np.ndarray,
+) -> List[Dict[str, Dict[str, Any]]]:
+    """Produits of each commande position as served by the planning (kept groups only)"""
+    produit_ids = aggregation["produit_ids"]
+    infos = [produits_infos.get(produit_id) for produit_id in produit_ids]
+    unite_names = np.array(aggregation["unites"], dtype=object)
+    commande = aggregation["commande"][keep]
+    produits = aggregation["produit"][keep].tolist()
+    quantites = _to_numbers(aggregation["sums"][keep], aggregation["is_float"][keep])
+    unites = unite_names[aggregation["unite_index"][keep]].tolist()
+    sources = SOURCES[aggregation["source"][keep]].tolist()
+
+    # Les groupes sont triés par commande : une tranche par commande
+    bounds = np.searchsorted(commande, np.arange(nb_commandes + 1)).tolist()
+    return [
+        {
+            produit_ids[p]: {
+                "nom": infos[p]["name"],
+                "quantite": quantite,
+                "unite": unite,
+                "categorie": infos[p]["categorie"],
+                "type": infos[p]["type"],
+                "source": source
+            }
+            for p, quantite, unite, source in zip(
+                produits[lo:hi], quantites[lo:hi], unites[lo:hi], sources[lo:hi]
+            )
+        }
+        for lo, hi in zip(bounds, bounds[1:])
+    ]
+
+def commande_contributions(aggregation: Dict[str, Any], commandes: List[Dict[str, Any]]) -> Dict[str, Tuple[str, Dict[str, Tuple[Any, str]]]]:
+    """Contribution of each commande to the daily totals (totals.py seed), unfiltered"""
+    contributions = {str(c["id"]): (c["delivery_date"], {}) for c in commandes}
+    ids = [str(c["id"]) for c in commandes]
+    produit_ids = aggregation["produit_ids"]
+    unite_names = np.array(aggregation["unites"], dtype=object)
+    for position, p, quantite, derniere_unite in zip(
+        aggregation["commande"].tolist(), aggregation["produit"].tolist(),
+        _to_numbers(aggregation["sums"], aggregation["is_float"]),
+        unite_names[aggregation["derniere_unite_index"]].tolist()
+    ):
+        contributions[ids[position]][1][produit_ids[p]] = (quantite, derniere_unite)
+    return contributions
+
+def daily_totals(
+    aggregation: Dict[str, Any],
+    commande_days: List[str],
+    keep: np.ndarray,
+) -> Dict[str, Dict[str, Tuple[Any, str]]]:
+    """
+    Per-day totals of the kept groups: {date: {produit_id: (quantite, unite)}}.
+    Days and produits come in first-appearance order, unite is the last one.
+    `commande_days` gives the delivery date of each commande position.
+    Summed over the lines, not the per-commande sums: same float rounding as
+    the loop adding each line to the day total.
+    """
+    days = list(dict.fromkeys(commande_days))
+    day_of_commande = _encode({day: i for i, day in enumerate(days)}, commande_days)
+
+    line_keep = keep[aggregation["line_group"]]
+    group = aggregation["line_group"][line_keep]
+    produit = aggregation["produit"][group]
+    day = day_of_commande[aggregation["commande"][group]]
+    first, last, inverse = _group(day * max(len(aggregation["produit_ids"]), 1) + produit)
+    sums = np.bincount(inverse, weights=aggregation["line_quantite"][line_keep], minlength=len(first))
+    any_float = np.bincount(inverse, weights=aggregation["line_is_float"][line_keep], minlength=len(first)) > 0
+    unite = aggregation["line_unite"][line_keep][last]
+
+    group_order = np.argsort(first, kind="stable")
+    group_first = first[group_order]
+    totaux: Dict[str, Dict[str, Tuple[Any, str]]] = {}
+    for d, p, quantite, u in zip(
+        day[group_first].tolist(),
+        produit[group_first].tolist(),
+        _to_numbers(sums[group_order], any_float[group_order]),
+        unite[group_order].tolist(),
+    ):
+        totaux.setdefault(days[d], {})[aggregation["produit_ids"][p]] = (quantite, aggregation["unites"][u])
+    return totaux
@@ -0,0 +1,258 @@
+from datetime import date
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from xlsx_stream import Alignment, Border, Cell, Font, Style, cell_ref, iter_workbook
+
+# ============================================
+# EXPORT EXCEL DU PLANNING DE PRODUCTION
+# ============================================
+# Même feuille que l'export ExcelJS de frontend/js/planning.js (titre,
+# en-têtes par date et par commande, produits groupés par type puis
+# catégorie, totaux du jour et total général), écrite ligne par ligne.
+
+SHEET_NAME = "Planning Production"
+
+JOURS_SEMAINE = ["Lun", "Mar", "Mer", "Jeu", "Ven", "Sam", "Dim"]
+
+COLUMN_WIDTHS = {1: 15, 2: 20, 3: 30, **{col: 12 for col in range(4, 51)}}
+
+# Couleurs (ARGB)
+BLEU = "FF4472C4"
+BLEU_DATE = "FF5B9BD5"
+BLEU_CLAIR = "FFD9E1F2"
+ORANGE_TOTAL = "FFED7D31"
+SAUMON = "FFF4B084"
+SUCRE = "FFF4A460"
+SALE = "FFFF8C42"
+CHOCOLAT = "FF6B4233"
+JAUNE_CATEGORIE = "FFF5C842"
+CREME = "FFFFF2CC"
+VERT_FORMULE = "FFE8F5E9"
+ORANGE_SUPPL = "FFFFF3E0"
+GRIS_VIDE = "FFF9F9F9"
+JAUNE_TOTAL = "FFFFE699"
+PECHE = "FFF8CBAD"
+BLANC = "FFFFFFFF"
+
+CENTRE = Alignment(horizontal="center", vertical="center")
+CENTRE_WRAP = Alignment(horizontal="center", vertical="center", wrap=True)
+
+ENTETE = Style(Font(bold=True, color=BLANC), BLEU, alignment=CENTRE)
+FOND_ENTETE = Style(fill=BLEU_CLAIR)
+FOND_TOTAL = Style(fill=SAUMON)
+
+def format_number(value: float):
+    """Integer when whole, otherwise rounded to one decimal (formatNumber in the frontend)"""
+    if float(value).is_integer():
+        return int(value)
+    return float(Decimal(repr(value)).quantize(Decimal("0.1"), rounding=ROUND_HALF_UP))
+
+def format_date_long(value: str) -> str:
+    return date.fromisoformat(value).strftime("%d/%m/%Y")
+
+def jour_nom(value: str) -> str:
+    return JOURS_SEMAINE[date.fromisoformat(value).weekday()]
+
+def export_filename(date_debut: str, date_fin: str, categorie: str = "tous") -> str:
+    filename = f"planning_production_{date_debut}_to_{date_fin}"
+    if categorie:
+        filename += f"_{categorie}"
+    return f"{filename}.xlsx"
+
+def organize_produits_by_type(planning: Dict[str, Any]) -> Dict[str, Dict[str, Dict[str, Dict[str, Any]]]]:
+    """Groupe (Sucré / Salé / Autre) → catégorie → produit_id → infos, from the daily totals"""
+    result = {"Sucré": {}, "Salé": {}}
+    for jour in planning.values():
+        for produit_id, produit in jour["totaux"].items():
+            categorie = produit.get("categorie") or "Autre"
+            type_produit = (produit.get("type") or "Autre").lower()
+
+            groupe = "Autre"
+            if "sucr" in type_produit:
+                groupe = "Sucré"
+            elif "sal" in type_produit:
+                groupe = "Salé"
+
+            produits = result.setdefault(groupe, {}).setdefault(categorie, {})
+            if produit_id not in produits:
+                produits[produit_id] = {"nom": produit.get("nom", ""), "unite": produit.get("unite")}
+    return result
+
+def _bordure(premiere: bool, left: str = "thin", right: str = "thin") -> Border:
+    return Border(top="thick" if premiere else "thin", left=left, bottom="thin", right=right)
+
+def _en_tete_commandes(
+    libelle: Cell,
+    dates: List[str],
+    planning: Dict[str, Any],
+    afficher_totaux: bool,
+    commande_cell,
+    total_jour_cell=None,
+) -> List[Cell]:
+    """One header row below the dates: a cell per commande, then the day total column"""
+    cells: List[Cell] = [("", FOND_ENTETE), ("", FOND_ENTETE), libelle]
+    for jour in dates:
+        commandes = planning[jour]["commandes"]
+        if commandes:
+            cells.extend(commande_cell(commande) for commande in commandes)
+            if afficher_totaux:
+                cells.append(total_jour_cell(jour) if total_jour_cell else ("", FOND_TOTAL))
+        else:
+            cells.append(("-", FOND_ENTETE))
+            if afficher_totaux:
+                cells.append(("-" if total_jour_cell else "", FOND_TOTAL))
+    if afficher_totaux:
+        cells.append(("", FOND_TOTAL))
+    return cells
+
+def _rows(planning_data: Dict[str, Any], afficher_totaux: bool, merges: List[str]) -> Iterator[Tuple[Optional[float], List[Cell]]]:
+    planning = planning_data.get("planning", {})
+    periode = planning_data["periode"]
+    dates = sorted(planning)
+    produits_by_type = organize_produits_by_type(planning)
+
+    # Titre et statistiques
+    titre = f"Planning de Production du {format_date_long(periode['debut'])} au {format_date_long(periode['fin'])}"
+    yield 30, [(titre, Style(Font(bold=True, size=16, color=BLANC), BLEU, alignment=CENTRE))]
+    merges.append("A1:J1")
+    yield None, []
+    yield None, [(f"{planning_data.get('commandes_count', 0)} commande(s)", Style())]
+    yield None, []
+    row = 5
+
+    # En-tête : dates
+    cells: List[Cell] = [("Type", ENTETE), ("Catégorie", ENTETE), ("Produit", ENTETE)]
+    for jour in dates:
+        nb_cols = len(planning[jour]["commandes"]) + (1 if afficher_totaux else 0)
+        jour_mois = date.fromisoformat(jour).strftime("%d/%m")
+        cells.append((f"{jour_mois}\n{jour_nom(jour)}", Style(Font(bold=True, color=BLANC), BLEU_DATE, alignment=CENTRE_WRAP)))
+        if nb_cols > 1:
+            merges.append(f"{cell_ref(row, len(cells))}:{cell_ref(row, len(cells) + nb_cols - 1)}")
+            cells.extend([None] * (nb_cols - 1))
+    if afficher_totaux:
+        cells.append(("TOTAL\nGÉNÉRAL", Style(Font(bold=True, color=BLANC), ORANGE_TOTAL, alignment=CENTRE_WRAP)))
+    yield None, cells
+
+    # En-têtes : client, couverts, heure, service, notes
+    libelle_style = Style(Font(italic=True, size=10), BLEU_CLAIR, alignment=CENTRE)
+    petit = Style(Font(size=9), BLEU_CLAIR, alignment=CENTRE)
+    yield None, _en_tete_commandes(
+        ("Client", Style(Font(bold=True, italic=True, size=10), BLEU_CLAIR, alignment=CENTRE)),
+        dates, planning, afficher_totaux,
+        lambda c: (c.get("client") or "", Style(Font(bold=True, size=9), BLEU_CLAIR, alignment=CENTRE_WRAP)),
+        lambda jour: (f"TOTAL {jour_nom(jour)}", Style(Font(bold=True, size=9), SAUMON, alignment=CENTRE_WRAP)),
+    )
+    yield None, _en_tete_commandes(
+        ("Nombre de couverts", libelle_style), dates, planning, afficher_totaux,
+        lambda c: (c.get("couverts") or "", petit),
+    )
+    yield None, _en_tete_commandes(
+        ("Heure de livraison", libelle_style), dates, planning, afficher_totaux,
+        lambda c: (c.get("heure") or "", petit),
+    )
+    yield None, _en_tete_commandes(
+        ("Service", libelle_style), dates, planning, afficher_totaux,
+        lambda c: (c.get("service") or "Sans", petit),
+    )
+    yield None, _en_tete_commandes(
+        ("Notes", libelle_style), dates, planning, afficher_totaux,
+        lambda c: ("Voir notes" if (c.get("notes") or "").strip() else "", petit),
+    )
+    row = 11
+
+    # Lignes de produits, par type puis catégorie
+    vide_font = Font(color="FF999999")
+    for groupe, categories in produits_by_type.items():
+        total_produits_type = sum(len(produits) for produits in categories.values())
+        if not total_produits_type:
+            continue
+        start_row_type = row
+        last_row_type = row + total_produits_type - 1
+        if total_produits_type > 1:
+            merges.append(f"{cell_ref(row, 1)}:{cell_ref(last_row_type, 1)}")
+
+        for categorie, produits in categories.items():
+            if not produits:
+                continue
+            if len(produits) > 1:
+                merges.append(f"{cell_ref(row, 2)}:{cell_ref(row + len(produits) - 1, 2)}")
+            premiere_categorie = True
+
+            for produit_id, produit in produits.items():
+                premiere = row == start_row_type
+                cells = []
+
+                # Type (fusionné verticalement)
+                if premiere:
+                    cells.append((groupe.upper(), Style(
+                        Font(bold=True, size=12, color=BLANC), SUCRE if groupe == "Sucré" else SALE,
+                        Border(top="thick", left="thick", bottom="thick", right="medium"), CENTRE,
+                    )))
+                else:
+                    cells.append(None)
+
+                # Catégorie (fusionnée verticalement)
+                if premiere_categorie:
+                    cells.append((categorie, Style(
+                        Font(bold=True, color=JAUNE_CATEGORIE), CHOCOLAT,
+                        Border(top="thick" if premiere else "thin", left="medium", bottom="medium", right="medium"), CENTRE,
+                    )))
+                    premiere_categorie = False
+                else:
+                    cells.append(None)
+
+                cells.append((produit["nom"], Style(
+                    Font(bold=True), CREME, _bordure(premiere, left="medium"),
+                    Alignment(horizontal="left", vertical="center", wrap=True),
+                )))
+
+                total_general = 0
+                for jour in dates:
+                    commandes = planning[jour]["commandes"]
+                    if not commandes:
+                        cells.append(("-", Style(vide_font, GRIS_VIDE, _bordure(premiere), CENTRE)))
+                        if afficher_totaux:
+                            cells.append(("-", Style(fill=GRIS_VIDE, border=_bordure(premiere, left="medium"))))
+                        continue
+
+                    total_jour = 0
+                    for commande in commandes:
+                        produit_data = commande["produits"].get(produit_id)
+                        if produit_data:
+                            quantite = produit_data.get("quantite") or 0
+                            total_jour += quantite
+                            fill = VERT_FORMULE if produit_data.get("source") == "formule" else ORANGE_SUPPL
+                            cells.append((format_number(quantite), Style(Font(bold=True), fill, _bordure(premiere), CENTRE)))
+                        else:
+                            cells.append(("-", Style(vide_font, GRIS_VIDE, _bordure(premiere), CENTRE)))
+                    total_general += total_jour
+
+                    if afficher_totaux:
+                        cells.append((
+                            format_number(total_jour) if total_jour > 0 else "-",
+                            Style(Font(bold=True), JAUNE_TOTAL, _bordure(premiere, left="medium"), CENTRE),
+                        ))
+
+                if afficher_totaux:
+                    cells.append((
+                        f"{format_number(total_general)} {produit.get('unite') or ''}" if total_general > 0 else "-",
+                        Style(Font(bold=True), PECHE, _bordure(premiere, left="medium", right="thick"), CENTRE),
+                    ))
+
+                # Bordure épaisse en bas de la dernière ligne du type
+                if row == last_row_type:
+                    cells = [_bas_epais(cell) for cell in cells]
+                    if not afficher_totaux:
+                        cells.append(_bas_epais(None))
+
+                yield None, cells
+                row += 1
+
+def _bas_epais(cell: Cell) -> Cell:
+    value, style = cell if cell is not None else ("", Style())
+    return value, style._replace(border=style.border._replace(bottom="thick"))
+
+def iter_planning_xlsx(planning_data: Dict[str, Any], afficher_totaux: bool = True) -> Iterator[bytes]:
+    """Bytes of the production planning workbook, for a planning_production() result"""
+    merges: List[str] = []
+    return iter_workbook(SHEET_NAME, _rows(planning_data, afficher_totaux, merges), merges, COLUMN_WIDTHS)
@@ -0,0 +1,52 @@
+from decimal import Decimal
+from typing import Any, Optional
+import orjson
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+# ============================================
+# SÉRIALISATION JSON (ORJSON)
+# ============================================
+# Un seul passage sur les données : orjson sérialise nativement UUID, date,
+# datetime et time (ISO 8601), ce que faisaient auparavant trois passes
+# Python (serialize_* dans les routes, jsonable_encoder, puis json.dumps avec
+# un encodeur personnalisé).
+#
+# FastAPI applique encore jsonable_encoder au contenu renvoyé par une route
+# avant de le passer à la classe de réponse. Les routes à gros volume
+# (planning, listes de commandes) renvoient donc json_response(), qui évite
+# ce passage.
+
+_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+def _default(obj: Any) -> Any:
+    """Types qu'orjson ne connaît pas nativement"""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Type {type(obj).__name__} non sérialisable en JSON")
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=_default, option=_OPTIONS)
+
+class ORJSONResponse(JSONResponse):
+    """Default response class of the API (see main.py)"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+def json_response(content: Any, response: Optional[Response] = None, status_code: int = 200) -> ORJSONResponse:
+    """
+    Serialize `content` once, skipping FastAPI's jsonable_encoder pass.
+    Headers already set on the route's `response` parameter (ETag,
+    X-Next-Cursor...) are carried over, since FastAPI does not merge them
+    into a response returned by the route.
+    """
+    headers = None
+    if response is not None:
+        headers = {key: value for key, value in response.headers.items() if key != "content-length"}
+    return ORJSONResponse(content, status_code=status_code, headers=headers)
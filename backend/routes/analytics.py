@@ -0,0 +1,58 @@
+from fastapi import APIRouter, HTTPException
+from datetime import date
+from typing import Optional
+import analytics
+import archiver
+import catalog
+
+router = APIRouter(prefix="/analytics", tags=["analytics"])
+
+# Valeurs de type_formule qui ne sont pas un type de formule
+TYPES_FORMULE = {"toutes": analytics.ALL, "aucune": analytics.DIRECT}
+
+@router.get("/consommation")
+async def get_consommation(
+    date_debut: str,
+    date_fin: str,
+    periode: str = "week",
+    categorie: Optional[str] = None,
+    type: Optional[str] = None,
+    type_formule: str = "toutes",
+    produit_id: Optional[str] = None,
+):
+    """
+    Quantities consumed per produit and per week (periode=week) or month
+    (periode=month), from the precomputed rollups of the archived commandes.
+    Filters: categorie and type of the produit, type_formule ("toutes" by
+    default, "aucune" for the produits ordered outside a formule), produit_id.
+    """
+    if periode not in analytics.PERIODS:
+        raise HTTPException(status_code=400, detail="periode invalide (valeurs possibles: week, month)")
+    try:
+        debut, fin = date.fromisoformat(date_debut), date.fromisoformat(date_fin)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Dates invalides (format attendu: AAAA-MM-JJ)")
+    if debut > fin:
+        raise HTTPException(status_code=400, detail="date_debut doit précéder date_fin")
+
+    result = analytics.consumption(
+        periode, date_debut, date_fin, await catalog.get_produits_infos(),
+        categorie=categorie, type_produit=type,
+        type_formule=TYPES_FORMULE.get(type_formule, type_formule), produit_id=produit_id,
+    )
+    return {
+        "periode": periode,
+        "debut": date_debut,
+        "fin": date_fin,
+        "filtres": {"categorie": categorie, "type": type, "type_formule": type_formule, "produit_id": produit_id},
+        **result,
+    }
+
+@router.post("/rebuild")
+async def rebuild_analytics():
+    """Recompute the rollups from every archived commande (409 while an archive run is in progress)"""
+    try:
+        async with archiver.exclusive("analytics"):
+            return await analytics.rebuild()
+    except archiver.ArchiveBusy:
+        raise HTTPException(status_code=409, detail="Archivage en cours, réessayer plus tard")
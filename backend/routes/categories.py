@@ -1,10 +1,12 @@
-from fastapi import APIRouter, HTTPException
-from database import get_supabase_client
+from fastapi import APIRouter, HTTPException, Request, Response
+import catalog
+import versions
 
 router = APIRouter(prefix="/categories", tags=["categories"])
-supabase = get_supabase_client()
 
 @router.get("/")
-async def get_categories():
-    response = supabase.table("categories").select("*").order("name").execute()
-    return response.data
+async def get_categories(request: Request, response: Response):
+    not_modified = versions.conditional(request, response, "categories")
+    if not_modified:
+        return not_modified
+    return await catalog.get_categories()
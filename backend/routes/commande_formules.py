@@ -1,41 +1,29 @@
 from fastapi import APIRouter, HTTPException
-from database import get_supabase_client
+from database import get_supabase_client, execute
 from models import CommandeFormuleCreate, CommandeFormuleUpdate
-from datetime import date, datetime, time
-from uuid import UUID
+import compositions
+import totals
+import logging
 
 router = APIRouter(prefix="/commande-formules", tags=["commande-formules"])
 supabase = get_supabase_client()
-
-def serialize_date(data):
-    """Serialize date, converting UUIDs and dates to strings"""
-    if isinstance(data, dict):
-        result = {}
-        for key, value in data.items():
-            if isinstance(value, (date, datetime, time)):
-                result[key] = value.isoformat()
-            elif isinstance(value, UUID):
-                result[key] = str(value)
-            else:
-                result[key] = value
-        return result
-    return data
+logger = logging.getLogger("omb.commande_formules")
 
 @router.get("/commande/{commande_id}")
 async def get_formules_by_commande(commande_id: str):
     """Get all formules for a commande"""
-    response = supabase.table("commande_formules").select("*").eq("commande_id", commande_id).execute()
-    return [serialize_date(commande_formule) for commande_formule in response.data]
+    response = await execute(supabase.table("commande_formules").select("*").eq("commande_id", commande_id))
+    return response.data
 
 @router.post("/")
 async def create_commande_formule(commande_formule: CommandeFormuleCreate):
     """Add a formule to a commande"""
     produits_exclus = commande_formule.produits_exclus
 
-    formule_data = serialize_date(commande_formule.model_dump(exclude={'produits_exclus'}))
+    formule_data = commande_formule.model_dump(mode="json", exclude={'produits_exclus'})
 
     # Insérer la commande_formule
-    response = supabase.table("commande_formules").insert(formule_data).execute()
+    response = await execute(supabase.table("commande_formules").insert(formule_data))
     commande_formule_data = response.data[0]
     commande_formule_id = commande_formule_data['id']
 
@@ -48,25 +36,30 @@ async def create_commande_formule(commande_formule: CommandeFormuleCreate):
             }
             for produit_id in produits_exclus
         ]
-        supabase.table("commande_formule_exclusions").insert(exclusions_data).execute()
+        await execute(supabase.table("commande_formule_exclusions").insert(exclusions_data))
 
-        return serialize_date(commande_formule_data)
+    compositions.invalidate_exclusions(commande_formule_id)
+    totals.mark_dirty(commande_formule_data["commande_id"])
+    return commande_formule_data
 
 @router.delete("/{commande_formule_id}")
 async def delete_commande_formule(commande_formule_id: int):
     """Remove a formule from a commande"""
-    response = supabase.table("commande_formules").delete().eq("id", commande_formule_id).execute()
+    response = await execute(supabase.table("commande_formules").delete().eq("id", commande_formule_id))
     if not response.data:
         raise HTTPException(status_code=404, detail="Commande-Formule not found")
+    compositions.invalidate_exclusions(commande_formule_id)
+    totals.mark_dirty(response.data[0]["commande_id"])
     return {"message": "Commande-Formule deleted successfully"}
 
 @router.get("/{commande_formule_id}/exclusions")
 async def get_formule_exclusions(commande_formule_id: int):
     """Get excluded products for a commande-formule"""
-    response = supabase.table("commande_formule_exclusions")\
-        .select("produit_id")\
-        .eq("commande_formule_id", commande_formule_id)\
-        .execute()
+    response = await execute(
+        supabase.table("commande_formule_exclusions")
+        .select("produit_id")
+        .eq("commande_formule_id", commande_formule_id)
+    )
     
     # Retourner uniquement la liste des IDs des produits exclus
     return [row["produit_id"] for row in response.data]
@@ -76,28 +69,22 @@ async def update_commande_formule_exclusions(commande_formule_id: int, update_da
     """Update exclusions for a commande-formule"""
     produits_exclus = update_data.get("produits_exclus", [])
     
-    print(f"📝 Mise à jour exclusions pour commande_formule {commande_formule_id}")
-    print(f"🚫 Nouveaux produits exclus : {produits_exclus}")
+    logger.debug(
+        "commande_formule_id=%s produits_exclus=%s", commande_formule_id, ",".join(map(str, produits_exclus))
+    )
     
-    # 1. Supprimer toutes les exclusions existantes
-    supabase.table("commande_formule_exclusions")\
-        .delete()\
-        .eq("commande_formule_id", commande_formule_id)\
-        .execute()
+    # Seules les exclusions ajoutées ou retirées sont écrites
+    await compositions.update_exclusions({commande_formule_id: produits_exclus})
     
-    # 2. Insérer les nouvelles exclusions
-    if produits_exclus:
-        exclusions_data = [
-            {
-                "commande_formule_id": commande_formule_id,
-                "produit_id": produit_id
-            }
-            for produit_id in produits_exclus
-        ]
-        supabase.table("commande_formule_exclusions").insert(exclusions_data).execute()
-        print(f"✅ {len(produits_exclus)} exclusion(s) ajoutée(s)")
-    else:
-        print("✅ Toutes les exclusions ont été supprimées")
+    logger.info("commande_formule_id=%s exclusions=%s", commande_formule_id, len(produits_exclus))
+    
+    # Les totaux de la commande concernée doivent être mis à jour
+    commande_formule = await execute(
+        supabase.table("commande_formules")
+        .select("commande_id")
+        .eq("id", commande_formule_id)
+    )
+    totals.mark_dirty(*(row["commande_id"] for row in commande_formule.data))
     
     return {
         "message": "Exclusions mises à jour avec succès", 
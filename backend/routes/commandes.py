@@ -1,114 +1,577 @@
-from fastapi import APIRouter, HTTPException
-from database import get_supabase_client
-from models import CarnetCommandeCreate, CarnetCommandeUpdate
-from datetime import datetime, date, time, timedelta
+from fastapi import APIRouter, HTTPException, Query, Response
+from database import get_supabase_client, execute
+from models import (
+    CarnetCommandeBase, CarnetCommandeCreate, CarnetCommandeUpdate,
+    CommandeWithCompositionCreate, CommandeCompositionUpdate
+)
+from config import COMMANDES_PAGE_MAX
+import totals
+import archiver
+import cold_storage
+import commande_details
+import compositions
+from responses import json_response
+from datetime import datetime, date
 from uuid import UUID
+from typing import Optional
+from collections import Counter
+import asyncio
+import base64
+import json
+import logging
 
 router = APIRouter(prefix="/commandes", tags=["commandes"])
 supabase = get_supabase_client()
+logger = logging.getLogger("omb.commandes")
 
-def serialize_commande(commande):
-    """Serialize commande data, converting UUIDs and dates to strings"""
-    if isinstance(commande, dict):
-        result = {}
-        for key, value in commande.items():
-            if isinstance(value, (date, datetime, time)):
-                result[key] = value.isoformat()
-            elif isinstance(value, UUID):
-                result[key] = str(value)
-            else:
-                result[key] = value
-        return result
-    return commande
+# Valeurs acceptées par le paramètre `include` des listes
+INCLUDES = {"composition"}
+
+def parse_include(include: Optional[str]) -> set:
+    """`include=composition` → {"composition"}; 400 on an unknown value"""
+    requested = {value.strip() for value in (include or "").split(",") if value.strip()}
+    unknown = requested - INCLUDES
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"include invalide: {', '.join(sorted(unknown))} (valeurs possibles: {', '.join(sorted(INCLUDES))})"
+        )
+    return requested
+
+async def with_includes(commandes: list, include: Optional[str], cold_ids: frozenset = frozenset()) -> list:
+    """
+    The commandes, with their formules and produits when include=composition
+    (loaded in bulk for the whole list, see commande_details). `cold_ids`:
+    commandes read from the Parquet files, whose relations are there too.
+    """
+    requested = parse_include(include)
+    if "composition" not in requested:
+        return commandes
+    if not cold_ids:
+        return await commande_details.load_details(commandes)
+    hot, cold = await asyncio.gather(
+        commande_details.load_details([c for c in commandes if c["id"] not in cold_ids]),
+        cold_storage.load_details([c for c in commandes if c["id"] in cold_ids]),
+    )
+    details = {commande["id"]: commande for commande in hot + cold}
+    return [details[commande["id"]] for commande in commandes]
+
+# ============================================
+# LISTES PAGINÉES (KEYSET SUR delivery_date, id)
+# ============================================
+# Chaque réponse est une page d'au plus `limit` commandes (COMMANDES_PAGE_MAX
+# par défaut et au maximum), lue à partir du curseur (dernière commande de la
+# page précédente) : le coût ne dépend pas de la taille de l'historique. Le
+# curseur suivant est renvoyé dans l'en-tête X-Next-Cursor (absent sur la
+# dernière page) ; les listes du frontend le suivent jusqu'au bout.
+
+# Colonnes acceptées par `fields` ; id et delivery_date sont toujours renvoyés
+COMMANDE_FIELDS = {"id", "archived", "archived_at", *CarnetCommandeBase.model_fields}
+
+def parse_fields(fields: Optional[str]) -> str:
+    """`fields=nom_client,delivery_hour` → select clause; 400 on an unknown column"""
+    if not fields:
+        return "*"
+    requested = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = set(requested) - COMMANDE_FIELDS
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"fields invalide: {', '.join(sorted(unknown))}")
+    return ", ".join(dict.fromkeys(["id", "delivery_date", *requested]))
+
+def encode_cursor(commande: dict) -> str:
+    raw = json.dumps([commande["delivery_date"], commande["id"]]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> tuple:
+    """(delivery_date, id) of the last commande of the previous page; 400 if malformed"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        delivery_date, commande_id = json.loads(raw)
+        return date.fromisoformat(delivery_date).isoformat(), str(UUID(commande_id))
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Curseur invalide")
+
+def parse_date(value: Optional[str], name: str) -> Optional[str]:
+    if value is None:
+        return None
+    try:
+        return date.fromisoformat(value).isoformat()
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"{name} invalide (format attendu: AAAA-MM-JJ)")
+
+async def list_commandes(
+    archived: bool,
+    response: Response,
+    include: Optional[str],
+    limit: Optional[int],
+    cursor: Optional[str],
+    fields: Optional[str],
+    date_debut: Optional[str],
+    date_fin: Optional[str],
+) -> list:
+    """Commandes ordered by delivery_date then id (most recent first), see the section above"""
+    parse_include(include)
+    query = supabase.table("carnet_commande").select(parse_fields(fields)).eq("archived", archived)
+
+    date_debut = parse_date(date_debut, "date_debut")
+    date_fin = parse_date(date_fin, "date_fin")
+    if date_debut:
+        query = query.gte("delivery_date", date_debut)
+    if date_fin:
+        query = query.lte("delivery_date", date_fin)
+
+    after = decode_cursor(cursor) if cursor else None
+    if after:
+        last_date, last_id = after
+        query = query.or_(f"delivery_date.lt.{last_date},and(delivery_date.eq.{last_date},id.lt.{last_id})")
+
+    query = query.order("delivery_date", desc=True).order("id", desc=True)
+
+    page_size = min(limit or COMMANDES_PAGE_MAX, COMMANDES_PAGE_MAX)
+    # Une ligne de plus pour savoir s'il reste une page
+    query = query.limit(page_size + 1)
+
+    result = await execute(query)
+    commandes = result.data
+
+    cold_ids = frozenset()
+    if archived and cold_storage.ENABLED:
+        # Archives exportées en Parquet (voir cold_storage.py), même filtre et même ordre
+        cold = await asyncio.to_thread(
+            cold_storage.read_commandes, parse_fields(fields), date_debut, date_fin, after, page_size + 1
+        )
+        commandes = cold_storage.merge(commandes, cold, page_size + 1)
+        hot_ids = {commande["id"] for commande in result.data}
+        cold_ids = frozenset(commande["id"] for commande in commandes if commande["id"] not in hot_ids)
+
+    if len(commandes) > page_size:
+        commandes = commandes[:page_size]
+        response.headers["X-Next-Cursor"] = encode_cursor(commandes[-1])
+
+    return await with_includes(commandes, include, cold_ids)
 
 @router.get("/")
-async def get_commandes():
-    """Get all commandes"""
-    response = supabase.table("carnet_commande").select("*").eq("archived", False).order("delivery_date", desc=True).execute()
-    return [serialize_commande(commande) for commande in response.data]
+async def get_commandes(
+    response: Response,
+    include: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    date_debut: Optional[str] = None,
+    date_fin: Optional[str] = None
+):
+    """
+    Get all commandes (include=composition adds formules and produits).
+    Paginated with limit / cursor, projected with fields, filtered on delivery_date.
+    """
+    # Listes potentiellement longues : sérialisées en un seul passage
+    return json_response(await list_commandes(False, response, include, limit, cursor, fields, date_debut, date_fin), response)
 
 @router.get("/archived")
-async def get_archived_commandes():
-    """Get all archived commandes"""
-    response = supabase.table("carnet_commande").select("*").eq("archived", True).order("delivery_date", desc=True).execute()
-    return [serialize_commande(commande) for commande in response.data]
+async def get_archived_commandes(
+    response: Response,
+    include: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    date_debut: Optional[str] = None,
+    date_fin: Optional[str] = None
+):
+    """
+    Get all archived commandes (include=composition adds formules and produits).
+    Paginated with limit / cursor, projected with fields, filtered on delivery_date.
+    """
+    # Listes potentiellement longues : sérialisées en un seul passage
+    return json_response(await list_commandes(True, response, include, limit, cursor, fields, date_debut, date_fin), response)
 
 @router.get("/archived/{commande_id}")
 async def get_archived_commande(commande_id: str):
     """Get a single archived commande by ID"""
-    response = supabase.table("carnet_commande").select("*").eq("id", commande_id).eq("archived", True).execute()
-    if not response.data:
-        raise HTTPException(status_code=404, detail="Archived commande not found")
-    return serialize_commande(response.data[0])
+    response = await execute(supabase.table("carnet_commande").select("*").eq("id", commande_id).eq("archived", True))
+    if response.data:
+        return response.data[0]
+    if cold_storage.ENABLED:
+        commande = await asyncio.to_thread(cold_storage.find_commande, commande_id)
+        if commande:
+            return commande
+    raise HTTPException(status_code=404, detail="Archived commande not found")
 
 
+@router.get("/{commande_id}/full")
+async def get_commande_full(commande_id: str):
+    """
+    Get a commande (archived or not) with its formules, their composition and
+    exclusions, and its direct produits, in a fixed number of queries
+    """
+    response = await execute(supabase.table("carnet_commande").select("*").eq("id", commande_id))
+    if response.data:
+        details = await commande_details.load_details([response.data[0]])
+        return details[0]
+    if cold_storage.ENABLED:
+        commande = await asyncio.to_thread(cold_storage.find_commande, commande_id)
+        if commande:
+            details = await cold_storage.load_details([commande])
+            return details[0]
+    raise HTTPException(status_code=404, detail="Commande not found")
+
 @router.get("/{commande_id}")
 async def get_commande(commande_id: str):
     """Get a single Non-archived commande by ID"""
-    response = supabase.table("carnet_commande").select("*").eq("id", commande_id).eq("archived", False).execute()
+    response = await execute(supabase.table("carnet_commande").select("*").eq("id", commande_id).eq("archived", False))
     if not response.data:
         raise HTTPException(status_code=404, detail="Commande not found")
-    return serialize_commande(response.data[0])
+    return response.data[0]
 
 @router.post("/")
 async def create_commande(commande: CarnetCommandeCreate):
     """Create a new commande"""
-    commande_data = serialize_commande(commande.model_dump())
-    response = supabase.table("carnet_commande").insert(commande_data).execute()
-    return serialize_commande(response.data[0])
+    commande_data = commande.model_dump(mode="json")
+    response = await execute(supabase.table("carnet_commande").insert(commande_data))
+    totals.mark_dirty(response.data[0]["id"])
+    return response.data[0]
 
-@router.post("/auto-archive")
-async def auto_archive_old_commandes():
-    """Archive automatiquement les commandes dont la date de livraison est dépassée depuis 2 jours"""
+async def _delete_commande_rows(commande_id: str, commande_formule_ids: list):
+    """
+    Compensation of a failed creation: delete what may have been written,
+    children first. Each delete is attempted even if a previous one failed.
+    """
+    deletes = [
+        supabase.table("commande_produits").delete().eq("commande_id", commande_id),
+        supabase.table("commande_formules").delete().eq("commande_id", commande_id),
+        supabase.table("carnet_commande").delete().eq("id", commande_id),
+    ]
+    if commande_formule_ids:
+        deletes.insert(0, supabase.table("commande_formule_exclusions").delete().in_("commande_formule_id", commande_formule_ids))
+    for query in deletes:
+        try:
+            await execute(query)
+        except Exception:
+            logger.exception("commande_id=%s compensation incomplète", commande_id)
+
+@router.post("/with-composition")
+async def create_commande_with_composition(commande: CommandeWithCompositionCreate):
+    """
+    Create a commande with its formules (and their exclusions) and its direct
+    produits in one request, with bulk inserts:
+    commande → commande_formules → exclusions and commande_produits (together).
+    If a write fails, the rows already written are deleted.
+    """
+    commande_data = commande.model_dump(mode="json", exclude={"formules", "produits"})
+    response = await execute(supabase.table("carnet_commande").insert(commande_data))
+    created = response.data[0]
+    commande_id = created["id"]
+    
+    commande_formules = []
+    try:
+        formules_data = [
+            {**formule.model_dump(mode="json", exclude={"produits_exclus"}), "commande_id": commande_id}
+            for formule in commande.formules
+        ]
+        if formules_data:
+            response = await execute(supabase.table("commande_formules").insert(formules_data))
+            # Lignes renvoyées dans l'ordre d'insertion
+            commande_formules = response.data
+        
+        exclusions_data = [
+            {"commande_formule_id": cf["id"], "produit_id": produit_id}
+            for cf, formule in zip(commande_formules, commande.formules)
+            for produit_id in dict.fromkeys(formule.produits_exclus)
+        ]
+        produits_data = [
+            {**produit.model_dump(mode="json"), "commande_id": commande_id}
+            for produit in commande.produits
+        ]
+        
+        # Exclusions et produits directs sont indépendants : écrits en parallèle
+        writes = {}
+        if exclusions_data:
+            writes["exclusions"] = execute(supabase.table("commande_formule_exclusions").insert(exclusions_data))
+        if produits_data:
+            writes["produits"] = execute(supabase.table("commande_produits").insert(produits_data))
+        results = dict(zip(writes, await asyncio.gather(*writes.values(), return_exceptions=True)))
+        for result in results.values():
+            if isinstance(result, BaseException):
+                raise result
+        commande_produits = results["produits"].data if "produits" in results else []
+    
+    except Exception as e:
+        logger.error("commande_id=%s création annulée: %s", commande_id, e)
+        await _delete_commande_rows(commande_id, [cf["id"] for cf in commande_formules])
+        totals.mark_dirty(commande_id)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Erreur lors de la création de la commande: {str(e)}"
+        )
+    
+    totals.mark_dirty(commande_id)
+    return {
+        **created,
+        "formules": [
+            {**cf, "produits_exclus": list(dict.fromkeys(formule.produits_exclus))}
+            for cf, formule in zip(commande_formules, commande.formules)
+        ],
+        "produits": commande_produits
+    }
 
-    # Calculer la date limite (aujourd'hui - 2 jours)
-    cutoff_date = (datetime.utcnow().date() - timedelta(days=2)).isoformat()
+def _diff_lines(desired: list, stored: dict, commande_id: str, excluded_fields: set):
+    """
+    (new rows, changed rows, removed ids) turning the `stored` lines (id → row)
+    into the `desired` models. Only the fields sent on an existing line are
+    compared; changed rows are complete, for a bulk upsert.
+    """
+    new_rows, changed_rows = [], []
+    for line in desired:
+        if line.id is None:
+            new_rows.append({
+                **line.model_dump(mode="json", exclude={"id", *excluded_fields}), "commande_id": commande_id
+            })
+            continue
+        row = stored[line.id]
+        sent = line.model_dump(mode="json", include=line.model_fields_set - {"id", *excluded_fields})
+        changes = {key: value for key, value in sent.items() if row.get(key) != value}
+        if changes:
+            changed_rows.append({**row, **changes})
+    kept = {line.id for line in desired}
+    removed = [line_id for line_id in stored if line_id not in kept]
+    return new_rows, changed_rows, removed
 
-    # Archiver toutes les commandes concernées
-    response = supabase.table("carnet_commande").update({
-        "archived": True,
-        "archived_at": datetime.utcnow().isoformat()
-    }).lt("delivery_date", cutoff_date).eq("archived", False).execute()
+async def _restore_composition(
+    commande_id: str,
+    inserted: dict,
+    rows: dict,
+    exclusions: dict,
+):
+    """
+    Compensation of a failed composition update: delete the `inserted` lines
+    (table → rows), write back the stored `rows` (table → rows) of the changed
+    and removed lines, then their `exclusions` (commande_formule id → produit
+    ids). Each step is attempted even if a previous one failed.
+    """
+    steps = []
+    if inserted["commande_produits"]:
+        steps.append(execute(
+            supabase.table("commande_produits").delete().in_("id", [row["id"] for row in inserted["commande_produits"]])
+        ))
+    if inserted["commande_formules"]:
+        formule_ids = [row["id"] for row in inserted["commande_formules"]]
+        steps.append(execute(supabase.table("commande_formule_exclusions").delete().in_("commande_formule_id", formule_ids)))
+        steps.append(execute(supabase.table("commande_formules").delete().in_("id", formule_ids)))
+    for table, table_rows in rows.items():
+        if table_rows:
+            steps.append(execute(supabase.table(table).upsert(table_rows)))
+    if exclusions:
+        steps.append(compositions.update_exclusions(exclusions))
+    for step in steps:
+        try:
+            await step
+        except Exception:
+            logger.exception("commande_id=%s restauration de la composition incomplète", commande_id)
 
-    # Compter le nombre de commandes archivées
-    count = len(response.data) if response.data else 0
+@router.patch("/{commande_id}/composition")
+async def update_commande_composition(commande_id: str, composition: CommandeCompositionUpdate):
+    """
+    Set the formules and produits of a commande to the given final state.
+
+    Lines with an id are kept, and updated when a sent field differs; lines
+    without id are added; stored lines missing from the state are removed.
+    Fields left out of an existing line keep their stored value (produits_exclus
+    included). Only the difference is written, with bulk deletes, inserts and
+    upserts; removals come last. If a write fails, the stored composition is
+    restored. Returns the new state (same shape as /commandes/{id}/full).
+    """
+    response = await execute(supabase.table("carnet_commande").select("*").eq("id", commande_id))
+    if not response.data:
+        raise HTTPException(status_code=404, detail="Commande not found")
+    commande = response.data[0]
+    
+    formules_response, produits_response = await asyncio.gather(
+        execute(supabase.table("commande_formules").select("*").eq("commande_id", commande_id)),
+        execute(supabase.table("commande_produits").select("*").eq("commande_id", commande_id)),
+    )
+    stored_formules = {row["id"]: row for row in formules_response.data}
+    stored_produits = {row["id"]: row for row in produits_response.data}
+    
+    inconnues = (
+        [f"formule {f.id}" for f in composition.formules if f.id is not None and f.id not in stored_formules]
+        + [f"produit {p.id}" for p in composition.produits if p.id is not None and p.id not in stored_produits]
+    )
+    if inconnues:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Lignes inconnues pour cette commande: {', '.join(inconnues)}"
+        )
+    doublons = (
+        [f"formule {line_id}" for line_id, n in Counter(f.id for f in composition.formules if f.id is not None).items() if n > 1]
+        + [f"produit {line_id}" for line_id, n in Counter(p.id for p in composition.produits if p.id is not None).items() if n > 1]
+    )
+    if doublons:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Lignes en double: {', '.join(doublons)}"
+        )
+    
+    new_formules, changed_formules, removed_formules = _diff_lines(
+        composition.formules, stored_formules, commande_id, {"produits_exclus"}
+    )
+    new_produits, changed_produits, removed_produits = _diff_lines(
+        composition.produits, stored_produits, commande_id, set()
+    )
+    
+    # Exclusions à restaurer en cas d'échec : formules retirées, et existantes
+    # dont les exclusions sont envoyées
+    touched_formules = [
+        *removed_formules,
+        *(f.id for f in composition.formules if f.id is not None and "produits_exclus" in f.model_fields_set),
+    ]
+    previous_exclusions = {cf_id: [] for cf_id in touched_formules}
+    if touched_formules:
+        response = await execute(
+            supabase.table("commande_formule_exclusions")
+            .select("commande_formule_id, produit_id")
+            .in_("commande_formule_id", touched_formules)
+        )
+        for row in response.data:
+            previous_exclusions[row["commande_formule_id"]].append(row["produit_id"])
+    
+    inserted = {"commande_formules": [], "commande_produits": []}
+    try:
+        # 1. Ajouts et mises à jour, en parallèle
+        writes = {}
+        if new_formules:
+            writes["commande_formules"] = execute(supabase.table("commande_formules").insert(new_formules))
+        if new_produits:
+            writes["commande_produits"] = execute(supabase.table("commande_produits").insert(new_produits))
+        if changed_formules:
+            writes["formules_modifiees"] = execute(supabase.table("commande_formules").upsert(changed_formules))
+        if changed_produits:
+            writes["produits_modifies"] = execute(supabase.table("commande_produits").upsert(changed_produits))
+        results = dict(zip(writes, await asyncio.gather(*writes.values(), return_exceptions=True)))
+        for table in inserted:
+            if table in results and not isinstance(results[table], BaseException):
+                # Lignes renvoyées dans l'ordre d'insertion
+                inserted[table] = results[table].data
+        for result in results.values():
+            if isinstance(result, BaseException):
+                raise result
+        inserted_formules = iter(inserted["commande_formules"])
+        
+        # 2. Exclusions des formules ajoutées, et des existantes quand elles sont envoyées
+        exclusions = {}
+        for formule in composition.formules:
+            if formule.id is None:
+                exclusions[next(inserted_formules)["id"]] = formule.produits_exclus
+            elif "produits_exclus" in formule.model_fields_set:
+                exclusions[formule.id] = formule.produits_exclus
+        await compositions.update_exclusions(exclusions)
+        
+        # 3. Suppressions, une fois le nouvel état écrit (exclusions des formules retirées d'abord)
+        if removed_formules:
+            await execute(
+                supabase.table("commande_formule_exclusions")
+                .delete()
+                .in_("commande_formule_id", removed_formules)
+            )
+        deletes = []
+        if removed_formules:
+            deletes.append(execute(supabase.table("commande_formules").delete().in_("id", removed_formules)))
+        if removed_produits:
+            deletes.append(execute(supabase.table("commande_produits").delete().in_("id", removed_produits)))
+        for result in await asyncio.gather(*deletes, return_exceptions=True):
+            if isinstance(result, BaseException):
+                raise result
+    
+    except Exception as e:
+        logger.error("commande_id=%s mise à jour de la composition annulée: %s", commande_id, e)
+        await _restore_composition(
+            commande_id,
+            inserted,
+            {
+                "commande_formules": [
+                    stored_formules[line_id]
+                    for line_id in [row["id"] for row in changed_formules] + removed_formules
+                ],
+                "commande_produits": [
+                    stored_produits[line_id]
+                    for line_id in [row["id"] for row in changed_produits] + removed_produits
+                ],
+            },
+            previous_exclusions,
+        )
+        raise HTTPException(
+            status_code=500,
+            detail=f"Erreur lors de la mise à jour de la composition: {str(e)}"
+        )
+    
+    finally:
+        compositions.invalidate_exclusions(*removed_formules, *(row["id"] for row in inserted["commande_formules"]))
+        totals.mark_dirty(commande_id)
+    
+    logger.info(
+        "commande_id=%s formules +%s ~%s -%s produits +%s ~%s -%s",
+        commande_id,
+        len(new_formules), len(changed_formules), len(removed_formules),
+        len(new_produits), len(changed_produits), len(removed_produits),
+    )
+    details = await commande_details.load_details([commande])
+    return details[0]
+
+@router.post("/auto-archive")
+async def auto_archive_old_commandes():
+    """
+    Archive now the commandes delivered more than ARCHIVE_AFTER_DAYS days ago,
+    in batches (same run as the background scheduler, see archiver.py).
+    Returns once archived; rollups and cold storage export follow in the background.
+    409 if a run is already in progress.
+    """
+    try:
+        stats = await archiver.run("manual", background=True)
+    except archiver.ArchiveBusy:
+        raise HTTPException(status_code=409, detail="Archivage déjà en cours")
 
     return {
-        "message": f"{count} commande(s) archivée(s) automatiquement",
-        "count": count,
-        "cutoff_date": cutoff_date
+        "message": f"{stats['archived']} commande(s) archivée(s) automatiquement",
+        "count": stats["archived"],
+        "cutoff_date": stats["cutoff_date"],
+        # Lots épuisés : le reste sera archivé au prochain passage
+        "remaining": stats["remaining"],
     }
 
+@router.get("/auto-archive/status")
+async def auto_archive_status():
+    """Scheduler settings, next run and stats of the latest run (any worker)"""
+    return archiver.status()
+
 @router.patch("/{commande_id}/archive")
 async def archive_commande(commande_id: str):
     """Archive une commande manuellement"""
-    response = supabase.table("carnet_commande").update({
+    response = await execute(supabase.table("carnet_commande").update({
         "archived": True,
         "archived_at": datetime.utcnow().isoformat()
-    }).eq("id", commande_id).execute()
+    }).eq("id", commande_id))
 
     if not response.data:
         raise HTTPException(status_code=404, detail="Commande not found")
-    return serialize_commande(response.data[0])
+    totals.mark_dirty(commande_id)
+    return response.data[0]
 
 @router.put("/{commande_id}")
 async def update_commande(commande_id: str, commande: CarnetCommandeUpdate):
     """Update an existing commande"""
-    update_data = {k: v for k, v in commande.model_dump().items() if v is not None}
+    update_data = {k: v for k, v in commande.model_dump(mode="json").items() if v is not None}
 
-    update_data = serialize_commande(update_data)
-
-    response = supabase.table("carnet_commande").update(update_data).eq("id", commande_id).execute()
+    response = await execute(supabase.table("carnet_commande").update(update_data).eq("id", commande_id))
     if not response.data:
         raise HTTPException(status_code=404, detail="Commande not found")
-    return serialize_commande(response.data[0])
+    totals.mark_dirty(commande_id)
+    return response.data[0]
 
 @router.delete("/{commande_id}")
 async def delete_commande(commande_id: str):
     """Delete a commande"""
-    response = supabase.table("carnet_commande").delete().eq("id", commande_id).execute()
+    response = await execute(supabase.table("carnet_commande").delete().eq("id", commande_id))
     if not response.data:
         raise HTTPException(status_code=404, detail="Commande not found")
+    totals.mark_dirty(commande_id)
     return {"message": "Commande deleted successfully"}
 
 @router.patch("/{commande_id}/validate")
@@ -117,14 +580,16 @@ async def validate_commande(commande_id: str):
     Valider une commande (passe validated à True)
     """
     try:
-        response = supabase.table("carnet_commande")\
-            .update({"validated": True})\
-            .eq("id", commande_id)\
-            .execute()
+        response = await execute(
+            supabase.table("carnet_commande")
+            .update({"validated": True})
+            .eq("id", commande_id)
+        )
         
         if not response.data:
             raise HTTPException(status_code=404, detail="Commande not found")
         
+        totals.mark_dirty(commande_id)
         return {"message": "Commande validée avec succès", "commande": response.data[0]}
     
     except Exception as e:
@@ -1,7 +1,10 @@
 from fastapi import APIRouter, HTTPException
-from fastapi.encoders import jsonable_encoder
-from database import get_supabase_client
-from models import FormuleProduitCreate, FormuleProduitUpdate
+from database import get_supabase_client, execute
+from models import FormuleProduitCreate, FormuleProduitUpdate, FormuleProduitItem
+from typing import List
+import asyncio
+import compositions
+import totals
 
 router = APIRouter(prefix="/formule-produits", tags=["formule-produits"])
 supabase = get_supabase_client()
@@ -9,7 +12,7 @@ supabase = get_supabase_client()
 @router.get("/formule/{formule_id}")
 async def get_produits_by_formule(formule_id: str):
     """Get all produits for a formule"""
-    response = supabase.table("formule_produits").select("*, produits(name)").eq("formule_id", formule_id).execute()
+    response = await execute(supabase.table("formule_produits").select("*, produits(name)").eq("formule_id", formule_id))
 
     # Transformer les données pour aplatir la structure
     result = []
@@ -25,6 +28,65 @@ async def get_produits_by_formule(formule_id: str):
     
     return result
 
+@router.put("/formule/{formule_id}")
+async def replace_produits_of_formule(formule_id: str, produits: List[FormuleProduitItem]):
+    """
+    Replace the composition of a formule by the given list of produits.
+    Rows are matched on produit_id; only the difference is written
+    (bulk delete, upsert and insert). Returns the new composition.
+    """
+    produit_ids = [str(item.produit_id) for item in produits]
+    doublons = sorted({produit_id for produit_id in produit_ids if produit_ids.count(produit_id) > 1})
+    if doublons:
+        raise HTTPException(status_code=400, detail=f"Produits en double: {', '.join(doublons)}")
+    
+    formule, existing = await asyncio.gather(
+        execute(supabase.table("formules").select("id").eq("id", formule_id)),
+        execute(supabase.table("formule_produits").select("*").eq("formule_id", formule_id).order("id")),
+    )
+    if not formule.data:
+        raise HTTPException(status_code=404, detail="Formule not found")
+    
+    # Ligne enregistrée par produit (les doublons éventuels sont retirés)
+    stored = {}
+    removed = []
+    for row in existing.data:
+        if str(row["produit_id"]) in stored:
+            removed.append(row["id"])
+        else:
+            stored[str(row["produit_id"])] = row
+    
+    inserts, upserts = [], []
+    for item in produits:
+        data = item.model_dump(mode="json")
+        row = stored.pop(data["produit_id"], None)
+        if row is None:
+            inserts.append({**data, "formule_id": formule_id})
+        elif row.get("quantite") != data["quantite"] or row.get("unite") != data["unite"]:
+            upserts.append({**row, **data})
+    removed.extend(row["id"] for row in stored.values())
+    
+    writes = []
+    if removed:
+        writes.append(execute(supabase.table("formule_produits").delete().in_("id", removed)))
+    if upserts:
+        writes.append(execute(supabase.table("formule_produits").upsert(upserts)))
+    if inserts:
+        writes.append(execute(supabase.table("formule_produits").insert(inserts)))
+    
+    if writes:
+        results = await asyncio.gather(*writes, return_exceptions=True)
+        compositions.invalidate_index()
+        totals.invalidate_all()
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Erreur lors de la mise à jour de la composition: {str(errors[0])}"
+            )
+    
+    return await get_produits_by_formule(formule_id)
+
 @router.post("/")
 async def create_formule_produit(formule_produit: FormuleProduitCreate):
     """Add a produit to a formule"""
@@ -36,26 +98,32 @@ async def create_formule_produit(formule_produit: FormuleProduitCreate):
     if "produit_id" in data:
         data["produit_id"] = str(data["produit_id"])
     
-    response = supabase.table("formule_produits").insert(data).execute()
+    response = await execute(supabase.table("formule_produits").insert(data))
     
     if not response.data:
         raise HTTPException(status_code=400, detail="Failed to create Formule-Produit")
     
-    return jsonable_encoder(response.data[0])
+    compositions.invalidate_index()
+    totals.invalidate_all()
+    return response.data[0]
 
 @router.put("/{formule_produit_id}")
 async def update_formule_produit(formule_produit_id: int, formule_produit: FormuleProduitUpdate):
     """Update formule-produit association"""
     update_data = {k: v for k, v in formule_produit.model_dump().items() if v is not None}
-    response = supabase.table("formule_produits").update(update_data).eq("id", formule_produit_id).execute()
+    response = await execute(supabase.table("formule_produits").update(update_data).eq("id", formule_produit_id))
     if not response.data:
         raise HTTPException(status_code=404, detail="Formule-Produit not found")
+    compositions.invalidate_index()
+    totals.invalidate_all()
     return response.data[0]
 
 @router.delete("/{formule_produit_id}")
 async def delete_formule_produit(formule_produit_id: int):
     """Remove a produit from a formule"""
-    response = supabase.table("formule_produits").delete().eq("id", formule_produit_id).execute()
+    response = await execute(supabase.table("formule_produits").delete().eq("id", formule_produit_id))
     if not response.data:
         raise HTTPException(status_code=404, detail="Formule-Produit not found")
+    compositions.invalidate_index()
+    totals.invalidate_all()
     return {"message": "Formule-Produit deleted successfully"}
\ No newline at end of file
@@ -1,22 +1,27 @@
 from uuid import UUID
-from fastapi import APIRouter, HTTPException
-from database import get_supabase_client
+from fastapi import APIRouter, HTTPException, Request, Response
+from database import get_supabase_client, execute
 from models import FormuleCreate, FormuleUpdate
-from fastapi.encoders import jsonable_encoder
+import compositions
+import versions
+import totals
 
 router = APIRouter(prefix="/formules", tags=["formules"])
 supabase = get_supabase_client()
 
 @router.get("/")
-async def get_formules():
-    """Get all formules"""
-    response = supabase.table("formules").select("*").order("name").execute()
-    return response.data
+async def get_formules(request: Request, response: Response):
+    """Get all formules (ETag / If-None-Match)"""
+    not_modified = versions.conditional(request, response, "formules")
+    if not_modified:
+        return not_modified
+    result = await execute(supabase.table("formules").select("*").order("name"))
+    return result.data
 
 @router.get("/{formule_id}")
 async def get_formule(formule_id: str):
     """Get a single formule by ID"""
-    response = supabase.table("formules").select("*").eq("id", formule_id).execute()
+    response = await execute(supabase.table("formules").select("*").eq("id", formule_id))
     if not response.data:
         raise HTTPException(status_code=404, detail="Formule not found")
     return response.data[0]
@@ -32,17 +37,17 @@ async def create_formule(formule: FormuleCreate):
         if isinstance(value, UUID):
             data[key] = str(value)
 
-    response = supabase.table("formules").insert(data).execute()
+    response = await execute(supabase.table("formules").insert(data))
 
     if not response.data:
         raise HTTPException(status_code=400, detail="Failed to create Formule")
-    return jsonable_encoder(response.data[0])
+    return response.data[0]
 
 @router.put("/{formule_id}")
 async def update_formule(formule_id: str, formule: FormuleUpdate):
     """Update an existing formule"""
     update_data = {k: v for k, v in formule.model_dump().items() if v is not None}
-    response = supabase.table("formules").update(update_data).eq("id", formule_id).execute()
+    response = await execute(supabase.table("formules").update(update_data).eq("id", formule_id))
     if not response.data:
         raise HTTPException(status_code=404, detail="Formule not found")
     return response.data[0]
@@ -50,7 +55,10 @@ async def update_formule(formule_id: str, formule: FormuleUpdate):
 @router.delete("/{formule_id}")
 async def delete_formule(formule_id: str):
     """Delete a formule"""
-    response = supabase.table("formules").delete().eq("id", formule_id).execute()
+    response = await execute(supabase.table("formules").delete().eq("id", formule_id))
     if not response.data:
         raise HTTPException(status_code=404, detail="Formule not found")
+    # Les formule_produits de la formule disparaissent avec elle
+    compositions.invalidate_index()
+    totals.invalidate_all()
     return {"message": "Formule deleted successfully"}
\ No newline at end of file
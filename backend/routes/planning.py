@@ -1,193 +1,141 @@
-from fastapi import APIRouter, HTTPException
-from database import get_supabase_client
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
 from datetime import datetime, date
 from typing import List, Dict, Any
 from collections import defaultdict
-import traceback
+import planning_engine
+import planning_export
+import totals
+import versions
+from responses import json_response
+from xlsx_stream import CONTENT_TYPE as XLSX_CONTENT_TYPE
+from urllib.parse import quote
+from tracing import PipelineTrace
+import logging
+
+logger = logging.getLogger("omb.planning")
 
 router = APIRouter(prefix="/planning", tags=["planning"])
-supabase = get_supabase_client()
+
+# Tables lues par le planning : leur version forme l'ETag de la réponse
+PLANNING_TABLES = (
+    "carnet_commande", "commande_formules", "commande_produits", "commande_formule_exclusions",
+    "formules", "formule_produits", "produits", "categories", "types",
+)
 
 @router.get("/production")
-async def get_planning_production(date_debut: str, date_fin: str, type_formule: str = "toutes", categorie: str = "tous"):
+async def get_planning_production(
+    request: Request,
+    response: Response,
+    date_debut: str,
+    date_fin: str,
+    type_formule: str = "toutes",
+    categorie: str = "tous",
+    timings: bool = False
+):
+    """
+    Planning de production de la période (ETag / If-None-Match : 304 tant
+    qu'aucune table lue n'a changé). `timings=true` ajoute à la réponse la
+    durée, le nombre de lignes et le nombre d'appels Supabase de chaque étape
+    (réponse jamais mise en cache).
+    """
+    if not timings:
+        not_modified = versions.conditional(
+            request, response, *PLANNING_TABLES, extra=f"{date_debut}|{date_fin}|{type_formule}|{categorie}"
+        )
+        if not_modified:
+            return not_modified
+    # Réponse volumineuse : sérialisée en un seul passage, en-têtes ETag conservés
+    return json_response(await planning_production(date_debut, date_fin, type_formule, categorie, timings), response)
+
+async def planning_production(
+    date_debut: str,
+    date_fin: str,
+    type_formule: str = "toutes",
+    categorie: str = "tous",
+    timings: bool = False
+):
     """
     VERSION OPTIMISÉE - Récupération séparée puis jointure en mémoire
     """
     
+    trace = PipelineTrace(
+        "planning", logger,
+        date_debut=date_debut, date_fin=date_fin, type_formule=type_formule, categorie=categorie
+    )
+    
     try:
-        print(f"\n{'='*60}")
-        print(f"🚀 Génération du planning: {date_debut} → {date_fin}")
-        print(f"   Type formule: {type_formule}")
-        print(f"{'='*60}\n")
-        
         # =========================================
         # ÉTAPE 1: RÉCUPÉRER LES COMMANDES
         # =========================================
         
-        print("📦 Étape 1: Récupération des commandes...")
-        all_commandes_response = supabase.table("carnet_commande")\
-            .select("*")\
-            .gte("delivery_date", date_debut)\
-            .lte("delivery_date", date_fin)\
-            .order("delivery_date")\
-            .execute()
-        
-        all_commandes = all_commandes_response.data
+        sous_etapes = {}
+        exportees = []
+        with trace.stage("commandes") as stage:
+            # Lue avant les commandes : le seed des totaux est écarté si l'une change entre-temps
+            generation = totals.generation()
+            all_commandes = await planning_engine.fetch_commandes(date_debut, date_fin, sous_etapes, exportees)
 
-        commandes_non_validees = [c for c in all_commandes if c.get("validated") is False]
-        commandes = [c for c in all_commandes if c.get("validated") is not False]
+            commandes_non_validees = [c for c in all_commandes if c.get("validated") is False]
+            commandes = [c for c in all_commandes if c.get("validated") is not False]
 
-        print(f"   ✅ {len(commandes)} commandes validées")
-        print(f"   ⚠️ {len(commandes_non_validees)} commandes NON validées (exclues)")
+            stage.rows = len(all_commandes)
+            stage.detail = {"validees": len(commandes), "non_validees": len(commandes_non_validees)}
+            if exportees:
+                stage.detail["exportees"] = len(exportees)
         
         if not commandes:
-            return {
+            result = {
                 "periode": {"debut": date_debut, "fin": date_fin},
                 "commandes_count": 0,
                 "planning": {}
             }
+            trace_data = trace.finish(commandes=0, jours=0)
+            if timings:
+                result["timings"] = trace_data
+            return result
         
         commande_ids = [c["id"] for c in commandes]
         
         # =========================================
-        # ÉTAPE 2: PRÉ-CHARGER LES RELATIONS
-        # =========================================
-        
-        print("\n📦 Étape 2: Pré-chargement des relations...")
-        
-        # 2.1 Commande → Formules
-        print("   🔗 Récupération commande_formules...")
-        commande_formules_response = supabase.table("commande_formules")\
-            .select("*")\
-            .in_("commande_id", commande_ids)\
-            .execute()
-        
-        commande_formules_map = defaultdict(list)
-        formule_ids = set()
-        
-        for cf in commande_formules_response.data:
-            commande_formules_map[cf["commande_id"]].append(cf)
-            formule_ids.add(cf["formule_id"])
-        
-        print(f"      ✅ {len(commande_formules_response.data)} relations | {len(formule_ids)} formules uniques")
-        
-        # 2.2 Récupérer les infos des formules
-        formules_info_map = {}
-        if formule_ids:
-            print("   🔗 Récupération des formules...")
-            formules_response = supabase.table("formules")\
-                .select("id, name, type_formule")\
-                .in_("id", list(formule_ids))\
-                .execute()
-            
-            for f in formules_response.data:
-                formules_info_map[f["id"]] = f
-            
-            print(f"      ✅ {len(formules_info_map)} formules")
-        
-        # 2.3 Commande → Produits directs
-        print("   🔗 Récupération commande_produits...")
-        commande_produits_response = supabase.table("commande_produits")\
-            .select("*")\
-            .in_("commande_id", commande_ids)\
-            .execute()
-        
-        commande_produits_map = defaultdict(list)
-        produit_ids = set()
-        
-        for cp in commande_produits_response.data:
-            commande_produits_map[cp["commande_id"]].append(cp)
-            produit_ids.add(cp["produit_id"])
-        
-        print(f"      ✅ {len(commande_produits_response.data)} produits directs")
-        
-        # 2.4 Formule → Produits
-        formule_produits_map = defaultdict(list)
-        if formule_ids:
-            print("   🔗 Récupération formule_produits...")
-            formule_produits_response = supabase.table("formule_produits")\
-                .select("*")\
-                .in_("formule_id", list(formule_ids))\
-                .execute()
-            
-            for fp in formule_produits_response.data:
-                formule_produits_map[fp["formule_id"]].append(fp)
-                produit_ids.add(fp["produit_id"])
-            
-            print(f"      ✅ {len(formule_produits_response.data)} produits de formules")
-        
-        # =========================================
-        # ÉTAPE 3: PRÉ-CHARGER LES PRODUITS
+        # ÉTAPES 2-3: PRÉ-CHARGER RELATIONS ET PRODUITS (EN PARALLÈLE)
         # =========================================
         
-        print(f"\n📦 Étape 3: Pré-chargement des produits ({len(produit_ids)} uniques)...")
-        produits_infos = {}
-        
-        if produit_ids:
-            # 3.1 Récupérer TOUS les produits EN UNE FOIS
-            print("   🔗 Récupération des produits...")
-            produits_response = supabase.table("produits")\
-                .select("id, name, categorie_id, type_id")\
-                .in_("id", list(produit_ids))\
-                .execute()
+        with trace.stage("relations") as stage:
+            relations = await planning_engine.prefetch_relations(commande_ids, sous_etapes, exportees)
             
-            print(f"      ✅ {len(produits_response.data)} produits")
+            # 2.1 Commande → Formules
+            commande_formules_map = planning_engine.group_by_commande(relations["commande_formules"])
             
-            # 3.2 Extraire les IDs de catégories et types
-            categorie_ids = set()
-            type_ids = set()
+            # 2.2 Infos des formules
+            formules_info_map = {f["id"]: f for f in relations["formules"]}
             
-            for prod in produits_response.data:
-                if prod.get("categorie_id"):
-                    categorie_ids.add(prod["categorie_id"])
-                if prod.get("type_id"):
-                    type_ids.add(prod["type_id"])
+            # 2.3 Commande → Produits directs
+            commande_produits_map = planning_engine.group_by_commande(relations["commande_produits"])
             
-            # 3.3 Récupérer TOUTES les catégories EN UNE FOIS
-            categories_map = {}
-            if categorie_ids:
-                print(f"   🔗 Récupération de {len(categorie_ids)} catégories...")
-                categories_response = supabase.table("categories")\
-                    .select("id, name")\
-                    .in_("id", list(categorie_ids))\
-                    .execute()
-                
-                for cat in categories_response.data:
-                    categories_map[cat["id"]] = cat["name"]
-                
-                print(f"      ✅ {len(categories_map)} catégories")
+            # 2.4 Formule → Produits (index compilé) et exclusions par commande_formule
+            compositions_index = relations["compositions"]
+            exclusions_masks = relations["exclusions"]
             
-            # 3.4 Récupérer TOUS les types EN UNE FOIS
-            types_map = {}
-            if type_ids:
-                print(f"   🔗 Récupération de {len(type_ids)} types...")
-                types_response = supabase.table("types")\
-                    .select("id, name")\
-                    .in_("id", list(type_ids))\
-                    .execute()
-                
-                for typ in types_response.data:
-                    types_map[typ["id"]] = typ["name"]
-                
-                print(f"      ✅ {len(types_map)} types")
+            # 3. Produits enrichis (catégorie, type) depuis le catalogue
+            produits_infos = relations["produits_infos"]
             
-            # 3.5 JOINDRE EN MÉMOIRE (très rapide)
-            print("   🔧 Jointure en mémoire...")
-            for prod in produits_response.data:
-                produits_infos[prod["id"]] = {
-                    "name": prod["name"],
-                    "categorie": categories_map.get(prod.get("categorie_id"), "Autre"),
-                    "type": types_map.get(prod.get("type_id"), "Autre")
-                }
-            
-            print(f"      ✅ {len(produits_infos)} produits enrichis")
+            stage.rows = (
+                len(relations["commande_formules"]) + len(relations["commande_produits"]) + len(relations["formules"])
+            )
+            stage.detail = {
+                "commande_formules": len(relations["commande_formules"]),
+                "commande_produits": len(relations["commande_produits"]),
+                "formules": len(formules_info_map),
+                "formules_compilees": len(compositions_index),
+                "produits": len(produits_infos),
+                **{f"{nom}_ms": duree for nom, duree in sous_etapes.items() if nom not in ("commandes", "commandes_exportees")},
+            }
         
         # =========================================
-        # ÉTAPE 4: CONSTRUCTION DU PLANNING
+        # ÉTAPE 4: FILTRAGE PAR TYPE DE FORMULE
         # =========================================
         
-        print("\n📦 Étape 4: Construction du planning...")
-        
         planning = defaultdict(lambda: {
             "commandes": [],
             "totaux": defaultdict(lambda: {
@@ -200,170 +148,129 @@ async def get_planning_production(date_debut: str, date_fin: str, type_formule:
         })
         
         # Filtrer les commandes par type de formule
-        commandes_filtrees = []
-        
-        for commande in commandes:
-            commande_id = commande["id"]
+        with trace.stage("filtre") as stage:
+            commandes_filtrees = []
             
-            # Vérification du type de formule
-            if type_formule != "toutes":
-                formules_commande = commande_formules_map.get(commande_id, [])
-                
-                if not formules_commande:
-                    continue
+            for commande in commandes:
+                commande_id = commande["id"]
                 
-                # Vérifier si au moins une formule correspond
-                formule_correspond = False
-                for cf in formules_commande:
-                    formule_info = formules_info_map.get(cf["formule_id"])
-                    if formule_info and formule_info.get("type_formule") == type_formule:
-                        formule_correspond = True
-                        break
+                # Vérification du type de formule
+                if type_formule != "toutes":
+                    formules_commande = commande_formules_map.get(commande_id, [])
+                    
+                    if not formules_commande:
+                        continue
+                    
+                    # Vérifier si au moins une formule correspond
+                    formule_correspond = False
+                    for cf in formules_commande:
+                        formule_info = formules_info_map.get(cf["formule_id"])
+                        if formule_info and formule_info.get("type_formule") == type_formule:
+                            formule_correspond = True
+                            break
+                    
+                    if not formule_correspond:
+                        continue
                 
-                if not formule_correspond:
-                    continue
+                commandes_filtrees.append(commande)
             
-            commandes_filtrees.append(commande)
-        
-        print(f"   ✅ {len(commandes_filtrees)} commandes après filtrage")
+            stage.rows = len(commandes_filtrees)
         
         # =========================================
         # ÉTAPE 5: TRAITER CHAQUE COMMANDE
         # =========================================
         
-        print("\n📦 Étape 5: Traitement des commandes...")
-        
-        for commande in commandes_filtrees:
-            commande_id = commande["id"]
-            delivery_date = commande["delivery_date"]
+        with trace.stage("construction") as stage:
+            # Sans filtre sur le type de formule, les totaux du jour viennent du
+            # stock matérialisé (totals.py) au lieu d'être recalculés ici
+            totaux_materialises = type_formule == "toutes"
             
-            commande_data = {
-                "id": commande_id,
-                "client": commande.get('nom_client', ''),
-                "heure": commande.get("delivery_hour", ""),
-                "couverts": commande.get("nombre_couverts", 0),
-                "notes": commande.get("notes", ""),
-                "produits": {}
-            }
+            # Produits directs puis produits via formules (sans les exclusions),
+            # agrégés pour toutes les commandes à la fois
+            aggregation = planning_engine.aggregate_commandes(
+                commandes_filtrees, commande_produits_map, commande_formules_map,
+                compositions_index, exclusions_masks
+            )
             
-            # ----------------------------------------
-            # 5a. PRODUITS DIRECTS
-            # ----------------------------------------
+            # Produits retenus : présents au catalogue et de la catégorie demandée
+            produits_inconnus = [p for p in aggregation["produit_ids"] if p not in produits_infos]
+            if produits_inconnus:
+                logger.warning("pipeline=planning produits_inconnus=%s", ",".join(map(str, produits_inconnus)))
+            retenu = planning_engine.produits_retenus(aggregation, produits_infos, categorie)
+            details = planning_engine.commande_details(aggregation, len(commandes_filtrees), produits_infos, retenu)
             
-            produits_directs = commande_produits_map.get(commande_id, [])
+            for commande, produits_commande in zip(commandes_filtrees, details):
+                # Ajouter la commande au planning
+                planning[commande["delivery_date"]]["commandes"].append({
+                    "id": commande["id"],
+                    "client": commande.get('nom_client', ''),
+                    "heure": commande.get("delivery_hour", ""),
+                    "couverts": commande.get("nombre_couverts", 0),
+                    "notes": commande.get("notes", ""),
+                    "produits": produits_commande
+                })
             
-            for cp in produits_directs:
-                produit_id = cp["produit_id"]
-                quantite = cp["quantite"]
-                unite = cp["unite"]
-                
-                prod_info = produits_infos.get(produit_id)
-                if not prod_info:
-                    print(f"      ⚠️ Produit {produit_id} non trouvé")
-                    continue
-
-                if categorie != "tous":
-                    if prod_info["type"].lower() != categorie.lower():
-                        continue
-                
-                # Ajouter au dictionnaire de la commande
-                if produit_id in commande_data["produits"]:
-                    commande_data["produits"][produit_id]["quantite"] += quantite
-                    commande_data["produits"][produit_id]["source"] = "mixte"
-                else:
-                    commande_data["produits"][produit_id] = {
-                        "nom": prod_info["name"],
-                        "quantite": quantite,
-                        "unite": unite,
-                        "categorie": prod_info["categorie"],
-                        "type": prod_info["type"],
-                        "source": "suppl"
-                    }
-                
-                # Mettre à jour les totaux du jour
-                planning[delivery_date]["totaux"][produit_id]["quantite"] += quantite
-                planning[delivery_date]["totaux"][produit_id]["unite"] = unite
-                planning[delivery_date]["totaux"][produit_id]["nom"] = prod_info["name"]
-                planning[delivery_date]["totaux"][produit_id]["categorie"] = prod_info["categorie"]
-                planning[delivery_date]["totaux"][produit_id]["type"] = prod_info["type"]
-            
-            # ----------------------------------------
-            # 5b. PRODUITS VIA FORMULES
-            # ----------------------------------------
-            
-            formules_commande = commande_formules_map.get(commande_id, [])
+            # Totaux du jour (groupés par date et produit)
+            if not totaux_materialises:
+                totaux_calcules = planning_engine.daily_totals(
+                    aggregation, [c["delivery_date"] for c in commandes_filtrees], retenu
+                )
+                for date_key, totaux_jour in totaux_calcules.items():
+                    for produit_id, (quantite, unite) in totaux_jour.items():
+                        prod_info = produits_infos[produit_id]
+                        planning[date_key]["totaux"][produit_id] = {
+                            # Arrondi comme le stock matérialisé (type_formule=toutes)
+                            "quantite": round(quantite, totals.PRECISION),
+                            "unite": unite,
+                            "nom": prod_info["name"],
+                            "categorie": prod_info["categorie"],
+                            "type": prod_info["type"]
+                        }
             
-            for cf in formules_commande:
-                formule_id = cf["formule_id"]
-                quantite_finale = cf["quantite_finale"]
-                
-                # Récupérer les produits de cette formule
-                formule_produits = formule_produits_map.get(formule_id, [])
-                
-                for fp in formule_produits:
-                    produit_id = fp["produit_id"]
-                    quantite_par_personne = fp["quantite"]
-                    unite = fp["unite"]
-                    quantite_totale = quantite_par_personne * quantite_finale
-                    
-                    prod_info = produits_infos.get(produit_id)
-                    if not prod_info:
-                        print(f"      ⚠️ Produit {produit_id} non trouvé")
-                        continue
-
-                    if categorie != "tous":
-                        if prod_info["type"].lower() != categorie.lower():
+            # Totaux du jour depuis le stock matérialisé
+            if totaux_materialises:
+                contributions = planning_engine.commande_contributions(aggregation, commandes_filtrees)
+                totaux_stock = await planning_engine.timed(
+                    sous_etapes, "totaux", totals.get_totaux(date_debut, date_fin, seed=contributions, seed_generation=generation)
+                )
+                for date_key in planning:
+                    for produit_id, (quantite, unite) in totaux_stock.get(date_key, {}).items():
+                        prod_info = produits_infos.get(produit_id)
+                        if not prod_info:
                             continue
-                    
-                    # Ajouter au dictionnaire de la commande
-                    if produit_id in commande_data["produits"]:
-                        commande_data["produits"][produit_id]["quantite"] += quantite_totale
-                        commande_data["produits"][produit_id]["source"] = "mixte"
-                    else:
-                        commande_data["produits"][produit_id] = {
-                            "nom": prod_info["name"],
-                            "quantite": quantite_totale,
+                        if categorie != "tous" and prod_info["type"].lower() != categorie.lower():
+                            continue
+                        planning[date_key]["totaux"][produit_id] = {
+                            "quantite": quantite,
                             "unite": unite,
+                            "nom": prod_info["name"],
                             "categorie": prod_info["categorie"],
-                            "type": prod_info["type"],
-                            "source": "formule"
+                            "type": prod_info["type"]
                         }
-                    
-                    # Mettre à jour les totaux du jour
-                    planning[delivery_date]["totaux"][produit_id]["quantite"] += quantite_totale
-                    planning[delivery_date]["totaux"][produit_id]["unite"] = unite
-                    planning[delivery_date]["totaux"][produit_id]["nom"] = prod_info["name"]
-                    planning[delivery_date]["totaux"][produit_id]["categorie"] = prod_info["categorie"]
-                    planning[delivery_date]["totaux"][produit_id]["type"] = prod_info["type"]
+                stage.detail = {"totaux_ms": sous_etapes["totaux"]}
             
-            # Ajouter la commande au planning
-            planning[delivery_date]["commandes"].append(commande_data)
+            stage.rows = len(aggregation["sums"])
         
         # =========================================
         # ÉTAPE 6: FINALISATION
         # =========================================
         
-        print("\n📦 Étape 6: Finalisation...")
-        
-        # Trier les commandes par heure
-        for date_key in planning:
-            planning[date_key]["commandes"].sort(key=lambda x: x.get("heure", ""))
-        
-        # Convertir en format JSON-friendly
-        planning_dict = {}
-        for date_key, data in planning.items():
-            planning_dict[date_key] = {
-                "commandes": data["commandes"],
-                "totaux": dict(data["totaux"])
-            }
-        
-        print(f"\n{'='*60}")
-        print(f"✅ Planning généré avec succès!")
-        print(f"   {len(commandes_filtrees)} commandes")
-        print(f"   {len(planning_dict)} jours")
-        print(f"{'='*60}\n")
+        with trace.stage("finalisation") as stage:
+            # Trier les commandes par heure
+            for date_key in planning:
+                planning[date_key]["commandes"].sort(key=lambda x: x.get("heure", ""))
+            
+            # Convertir en format JSON-friendly
+            planning_dict = {}
+            for date_key, data in planning.items():
+                planning_dict[date_key] = {
+                    "commandes": data["commandes"],
+                    "totaux": dict(data["totaux"])
+                }
+            
+            stage.rows = len(planning_dict)
         
-        return {
+        result = {
             "periode": {
                 "debut": date_debut,
                 "fin": date_fin
@@ -381,15 +288,66 @@ async def get_planning_production(date_debut: str, date_fin: str, type_formule:
                 for c in commandes_non_validees
             ]
         }
+        trace_data = trace.finish(commandes=len(commandes_filtrees), jours=len(planning_dict))
+        if timings:
+            result["timings"] = trace_data
+        return result
     
     except Exception as e:
-        print(f"\n❌ ERREUR PLANNING:")
-        print(f"   {str(e)}")
-        print(f"\n📋 Traceback:")
-        traceback.print_exc()
-        print(f"{'='*60}\n")
+        logger.exception("pipeline=planning date_debut=%s date_fin=%s erreur", date_debut, date_fin)
+        trace.finish(level=logging.ERROR, erreur=type(e).__name__)
         
         raise HTTPException(
             status_code=500, 
             detail=f"Erreur lors de la génération du planning: {str(e)}"
-        )
\ No newline at end of file
+        )
+
+@router.get("/production/export.xlsx")
+async def export_planning_production(
+    date_debut: str,
+    date_fin: str,
+    type_formule: str = "toutes",
+    categorie: str = "tous",
+    afficher_totaux: bool = True
+):
+    """
+    Export Excel du planning de production (même feuille que l'export du frontend),
+    envoyé en streaming au fur et à mesure de l'écriture des lignes
+    """
+    # Vérifiées avant l'envoi des en-têtes : une erreur pendant le streaming
+    # donnerait un fichier tronqué avec un statut 200
+    try:
+        date.fromisoformat(date_debut)
+        date.fromisoformat(date_fin)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Dates invalides (format attendu: AAAA-MM-JJ)")
+
+    planning_data = await planning_production(date_debut, date_fin, type_formule, categorie)
+    filename = planning_export.export_filename(date_debut, date_fin, categorie)
+
+    return StreamingResponse(
+        planning_export.iter_planning_xlsx(planning_data, afficher_totaux),
+        media_type=XLSX_CONTENT_TYPE,
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="{filename.encode("ascii", "replace").decode()}"; '
+                f"filename*=UTF-8''{quote(filename)}"
+            )
+        }
+    )
+
+@router.get("/totaux/verification")
+async def verify_totaux(date_debut: str, date_fin: str):
+    """Compare the materialized daily totals with a full recompute"""
+    try:
+        return await totals.verify(date_debut, date_fin)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Période invalide: {str(e)}")
+
+@router.post("/totaux/rebuild")
+async def rebuild_totaux(date_debut: str, date_fin: str):
+    """Drop the materialized daily totals and rebuild them for the period"""
+    try:
+        return await totals.rebuild(date_debut, date_fin)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Période invalide: {str(e)}")
@@ -1,10 +1,12 @@
-from fastapi import APIRouter, HTTPException
-from database import get_supabase_client
+from fastapi import APIRouter, HTTPException, Request, Response
+import catalog
+import versions
 
 router = APIRouter(prefix="/types", tags=["types"])
-supabase = get_supabase_client()
 
 @router.get("/")
-async def get_types():
-    response = supabase.table("types").select("*").order("name").execute()
-    return response.data
\ No newline at end of file
+async def get_types(request: Request, response: Response):
+    not_modified = versions.conditional(request, response, "types")
+    if not_modified:
+        return not_modified
+    return await catalog.get_types()
\ No newline at end of file
@@ -1,14 +1,16 @@
-from fastapi import APIRouter
-from database import get_supabase_client
+from fastapi import APIRouter, Request, Response
+import catalog
+import versions
 
 router = APIRouter(prefix="/unite", tags=["unite"])
-supabase = get_supabase_client()
 
 @router.get("/")
-async def get_unite():
+async def get_unite(request: Request, response: Response):
     """Get all unite"""
-    response = supabase.table("unite").select("*").order("nom").execute()
-    return response.data
+    not_modified = versions.conditional(request, response, "unite")
+    if not_modified:
+        return not_modified
+    return await catalog.get_unite()
 
 
 
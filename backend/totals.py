@@ -0,0 +1,236 @@
+import asyncio
+import time
+from datetime import date, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from config import CACHE_TTL_SECONDS
+from database import get_supabase_client, fetch_in
+import planning_engine
+
+# ============================================
+# TOTAUX DE PRODUCTION JOURNALIERS (MATÉRIALISÉS)
+# ============================================
+# Pour chaque jour déjà calculé : produit_id → (quantite, unite), avec la
+# contribution de chacune de ses commandes. Les routeurs signalent les
+# commandes modifiées (mark_dirty) ; à la lecture suivante, seules celles-ci
+# sont relues et le jour est re-sommé depuis les contributions gardées, sans
+# recalculer les autres commandes du jour. Les commandes d'un jour sont
+# sommées par id croissant, l'ordre de planning_engine.fetch_commandes() :
+# ordre des produits et unité (celle de la dernière ligne) sont ceux d'un
+# recalcul complet.
+#
+# Le stock vit dans le processus : il est vidé après CACHE_TTL_SECONDS pour
+# reprendre les modifications faites hors de l'API (ex : dashboard Supabase).
+
+supabase = get_supabase_client()
+
+# Les quantités sont arrondies comme les totaux calculés à la volée du planning
+PRECISION = 6
+
+# Contribution d'une commande : produit_id → (quantite, unite)
+Contribution = Dict[str, Tuple[float, str]]
+
+_days: Dict[str, Dict[str, Tuple[float, str]]] = {}
+_day_commandes: Dict[str, set] = {}
+_contributions: Dict[str, Tuple[str, Contribution]] = {}
+_dirty: set = set()
+# Incrémentée à chaque signalement : un seed calculé pendant une écriture est écarté
+_generation = 0
+_built_at = time.monotonic()
+_lock = asyncio.Lock()
+
+def mark_dirty(*commande_ids: str):
+    """Signal commandes whose produits, date or validation changed"""
+    global _generation
+    _generation += 1
+    _dirty.update(str(commande_id) for commande_id in commande_ids)
+
+def generation() -> int:
+    """Read before fetching the commandes of a seed, passed back to get_totaux()"""
+    return _generation
+
+def invalidate_all():
+    """Drop every materialized day (compositions changed, rebuild requested)"""
+    global _built_at, _generation
+    _generation += 1
+    _days.clear()
+    _day_commandes.clear()
+    _contributions.clear()
+    _dirty.clear()
+    _built_at = time.monotonic()
+
+def _date_range(date_debut: str, date_fin: str) -> List[str]:
+    start, end = date.fromisoformat(date_debut), date.fromisoformat(date_fin)
+    return [(start + timedelta(days=i)).isoformat() for i in range((end - start).days + 1)]
+
+def to_contribution(produits: Dict[str, Dict[str, Any]]) -> Contribution:
+    """Keep quantite and unite from a planning_engine.commande_contribution() result"""
+    return {produit_id: (ligne["quantite"], ligne["derniere_unite"]) for produit_id, ligne in produits.items()}
+
+def _sum(contributions: Iterable[Contribution]) -> Dict[str, Tuple[float, str]]:
+    """Totals of the contributions in order: first-appearance produit order, last unite"""
+    sums: Dict[str, list] = {}
+    for contribution in contributions:
+        for produit_id, (quantite, unite) in contribution.items():
+            total = sums.get(produit_id)
+            if total is None:
+                sums[produit_id] = [quantite, unite]
+            else:
+                total[0] += quantite
+                total[1] = unite
+    return {produit_id: (round(quantite, PRECISION), unite) for produit_id, (quantite, unite) in sums.items()}
+
+def _resum(delivery_date: str):
+    _days[delivery_date] = _sum(
+        _contributions[commande_id][1] for commande_id in sorted(_day_commandes[delivery_date])
+    )
+
+def _add(commande_id: str, delivery_date: str, contribution: Contribution) -> Optional[str]:
+    if delivery_date not in _days:
+        return None
+    _contributions[commande_id] = (delivery_date, contribution)
+    _day_commandes[delivery_date].add(commande_id)
+    return delivery_date
+
+def _remove(commande_id: str) -> Optional[str]:
+    previous = _contributions.pop(commande_id, None)
+    if previous is None:
+        return None
+    _day_commandes[previous[0]].discard(commande_id)
+    return previous[0]
+
+async def _compute_contributions(
+    commandes: List[Dict[str, Any]],
+    exported: Sequence[Dict[str, Any]] = (),
+) -> Dict[str, Tuple[str, Contribution]]:
+    """Contribution of each validated commande, fetched in bulk (`exported` as in planning_engine)"""
+    commandes = [c for c in commandes if c.get("validated") is not False]
+    if not commandes:
+        return {}
+    commande_ids = [c["id"] for c in commandes]
+    relations = await planning_engine.prefetch_relations(commande_ids, {}, exported)
+    commande_produits_map = planning_engine.group_by_commande(relations["commande_produits"])
+    commande_formules_map = planning_engine.group_by_commande(relations["commande_formules"])
+    return {
+        str(c["id"]): (c["delivery_date"], to_contribution(planning_engine.commande_contribution(
+            c["id"], commande_produits_map, commande_formules_map,
+            relations["compositions"], relations["exclusions"],
+        )))
+        for c in commandes
+    }
+
+def _materialize(days: Iterable[str], contributions: Dict[str, Tuple[str, Contribution]]):
+    touched = set(days)
+    for day in touched:
+        _days[day] = {}
+        _day_commandes[day] = set()
+    for commande_id, (delivery_date, contribution) in contributions.items():
+        if delivery_date in days:
+            touched.add(_remove(commande_id))
+            _add(commande_id, delivery_date, contribution)
+    for day in touched - {None}:
+        _resum(day)
+
+async def _apply_dirty():
+    commande_ids = list(_dirty)
+    _dirty.clear()
+    if not commande_ids:
+        return
+    commandes = await fetch_in(
+        lambda: supabase.table("carnet_commande").select("id, delivery_date, validated"),
+        "id", commande_ids
+    )
+    contributions = await _compute_contributions(commandes)
+    touched = set()
+    for commande_id in commande_ids:
+        touched.add(_remove(commande_id))
+        if commande_id in contributions:
+            touched.add(_add(commande_id, *contributions[commande_id]))
+    for day in touched - {None}:
+        _resum(day)
+
+async def get_totaux(
+    date_debut: str,
+    date_fin: str,
+    seed: Optional[Dict[str, Tuple[str, Contribution]]] = None,
+    seed_generation: Optional[int] = None,
+) -> Dict[str, Dict[str, Tuple[float, str]]]:
+    """
+    Daily totals between the two dates: {date: {produit_id: (quantite, unite)}}.
+
+    Days not materialized yet are computed once, from `seed` when the caller
+    already holds the contributions of every validated commande of the range,
+    otherwise from the database. `seed_generation` is generation() read before
+    the seed's commandes were fetched: a commande signalled since then may be
+    stale in the seed, which is dropped. Pending changes are then applied.
+    """
+    async with _lock:
+        if seed is not None and seed_generation != _generation:
+            seed = None
+        if time.monotonic() - _built_at > CACHE_TTL_SECONDS:
+            invalidate_all()
+
+        days = _date_range(date_debut, date_fin)
+        missing = [day for day in days if day not in _days]
+        if missing:
+            if seed is None:
+                exported = []
+                commandes = await planning_engine.fetch_commandes(missing[0], missing[-1], {}, exported)
+                seed = await _compute_contributions(commandes, exported)
+            _materialize(set(missing), seed)
+
+        try:
+            await _apply_dirty()
+        except Exception:
+            # Les jours touchés ne sont plus fiables : ils seront recalculés
+            invalidate_all()
+            raise
+
+        return {day: dict(_days[day]) for day in days if _days.get(day)}
+
+async def verify(date_debut: str, date_fin: str, tolerance: float = 1e-6) -> Dict[str, Any]:
+    """
+    Compare the materialized totals with a full recompute over the range:
+    quantities (within `tolerance`), unites and produit order of each day.
+    Returns the differences found (empty when consistent).
+    """
+    stored = await get_totaux(date_debut, date_fin)
+    exported = []
+    commandes = await planning_engine.fetch_commandes(date_debut, date_fin, {}, exported)
+    by_day: Dict[str, List[Contribution]] = {}
+    for delivery_date, contribution in (await _compute_contributions(commandes, exported)).values():
+        by_day.setdefault(delivery_date, []).append(contribution)
+    recomputed = {day: _sum(contributions) for day, contributions in by_day.items()}
+
+    ecarts = []
+    for day in sorted(set(stored) | set(recomputed)):
+        stored_day, recomputed_day = stored.get(day, {}), recomputed.get(day, {})
+        for produit_id in list(recomputed_day) + [p for p in stored_day if p not in recomputed_day]:
+            attendu, obtenu = recomputed_day.get(produit_id), stored_day.get(produit_id)
+            if attendu is None or obtenu is None or abs(attendu[0] - obtenu[0]) > tolerance:
+                ecarts.append({
+                    "date": day, "produit_id": produit_id, "champ": "quantite",
+                    "attendu": attendu and attendu[0], "stocke": obtenu and obtenu[0],
+                })
+            elif attendu[1] != obtenu[1]:
+                ecarts.append({
+                    "date": day, "produit_id": produit_id, "champ": "unite",
+                    "attendu": attendu[1], "stocke": obtenu[1],
+                })
+        if set(stored_day) == set(recomputed_day) and list(stored_day) != list(recomputed_day):
+            # Premier produit mal placé, avec sa position attendue et stockée
+            position, produit_id = next(
+                (i, p) for i, (p, q) in enumerate(zip(recomputed_day, stored_day)) if p != q
+            )
+            ecarts.append({
+                "date": day, "produit_id": produit_id, "champ": "ordre",
+                "attendu": position, "stocke": list(stored_day).index(produit_id),
+            })
+
+    return {"coherent": not ecarts, "ecarts": ecarts}
+
+async def rebuild(date_debut: str, date_fin: str) -> Dict[str, Any]:
+    """Drop the store and materialize the range again from the database"""
+    async with _lock:
+        invalidate_all()
+    totaux = await get_totaux(date_debut, date_fin)
+    return {"jours": len(totaux), "produits": sum(len(day) for day in totaux.values())}
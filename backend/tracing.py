@@ -0,0 +1,109 @@
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+# ============================================
+# SUIVI DES ÉTAPES (DURÉES, LIGNES, APPELS SUPABASE)
+# ============================================
+# Une trace par requête : chaque étape enregistre sa durée, le nombre de
+# lignes produites et le nombre d'appels Supabase faits pendant l'étape.
+# Les étapes sont journalisées en DEBUG, le résumé de la requête en INFO,
+# sous forme de lignes clé=valeur.
+
+# Compteur d'appels Supabase de la requête en cours. La liste est partagée
+# par référence avec les tâches créées pendant la requête (asyncio copie le
+# contexte, pas la liste), donc leurs appels sont comptés aussi.
+_supabase_calls: ContextVar[Optional[List[int]]] = ContextVar("supabase_calls", default=None)
+
+def count_supabase_call():
+    """Called by database.execute() for each round-trip"""
+    counter = _supabase_calls.get()
+    if counter is not None:
+        counter[0] += 1
+
+def _format(fields: Dict[str, Any]) -> str:
+    parts = []
+    for key, value in fields.items():
+        if value is None:
+            continue
+        value = str(value)
+        if not value or " " in value or "=" in value:
+            value = '"' + value.replace('"', '\\"') + '"'
+        parts.append(f"{key}={value}")
+    return " ".join(parts)
+
+class Stage:
+    """Mutable handle yielded by PipelineTrace.stage(): set `rows` and `detail`"""
+
+    def __init__(self):
+        self.rows: Optional[int] = None
+        self.detail: Dict[str, Any] = {}
+
+class PipelineTrace:
+    """
+    Timings of one request through a pipeline.
+
+        trace = PipelineTrace("planning", logger, date_debut=...)
+        with trace.stage("commandes") as stage:
+            commandes = await ...
+            stage.rows = len(commandes)
+        trace.finish(commandes=len(commandes))
+
+    Must be created and finished in the request's own task.
+    """
+
+    def __init__(self, name: str, logger: logging.Logger, **context):
+        self.name = name
+        self.logger = logger
+        self.context = context
+        self.stages: Dict[str, Dict[str, Any]] = {}
+        self._calls = [0]
+        self._token = _supabase_calls.set(self._calls)
+        self._start = time.perf_counter()
+        self._finished = False
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[Stage]:
+        stage = Stage()
+        calls_before = self._calls[0]
+        start = time.perf_counter()
+        try:
+            yield stage
+        finally:
+            record = {
+                "ms": round((time.perf_counter() - start) * 1000, 1),
+                "rows": stage.rows,
+                "supabase_calls": self._calls[0] - calls_before,
+            }
+            if stage.detail:
+                record["detail"] = stage.detail
+            self.stages[name] = record
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(_format({
+                    "pipeline": self.name, "stage": name,
+                    "ms": record["ms"], "rows": record["rows"], "supabase_calls": record["supabase_calls"],
+                    **{f"{name}.{key}": value for key, value in stage.detail.items()},
+                }))
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "total_ms": round((time.perf_counter() - self._start) * 1000, 1),
+            "supabase_calls": self._calls[0],
+            "stages": self.stages,
+        }
+
+    def finish(self, level: int = logging.INFO, **fields) -> Dict[str, Any]:
+        """Log the request summary and stop counting; returns as_dict()"""
+        result = self.as_dict()
+        if not self._finished:
+            self._finished = True
+            _supabase_calls.reset(self._token)
+            if self.logger.isEnabledFor(level):
+                self.logger.log(level, _format({
+                    "pipeline": self.name, **self.context, **fields,
+                    "total_ms": result["total_ms"], "supabase_calls": result["supabase_calls"],
+                    **{f"{name}_ms": stage["ms"] for name, stage in self.stages.items()},
+                }))
+        return result
@@ -0,0 +1,166 @@
+import hashlib
+import json
+import logging
+import os
+import time
+import uuid
+from typing import Callable, Dict, List, Optional
+from fastapi import Request, Response
+from config import CACHE_TTL_SECONDS, ETAG_ENABLED, VERSIONS_FILE
+
+try:
+    import fcntl
+except ImportError:  # Windows : versions propres au processus (un seul worker)
+    fcntl = None
+
+# ============================================
+# VERSIONS DES TABLES ET ETAGS
+# ============================================
+# Chaque écriture passée par database.execute() incrémente la version de sa
+# table. L'ETag d'une réponse est dérivé des versions des tables qu'elle lit
+# (plus ses paramètres) : tant qu'aucune n'a changé, un GET avec
+# If-None-Match reçoit 304 sans requête Supabase ni sérialisation.
+#
+# Les versions sont partagées par les workers dans VERSIONS_FILE (verrou
+# flock) : une écriture sur un worker change l'ETag de tous les autres. Un
+# worker qui y voit une version modifiée par un autre processus prévient ses
+# caches (on_change), qui oublient les données de cette table. Le fichier est
+# local à la machine : avec plusieurs machines, il doit être sur un disque
+# partagé, sinon ETAG_ENABLED=false.
+#
+# Une réponse compressée (compression.py) porte l'ETag suffixé par son
+# encodage ("…-gzip", "…-br") : If-None-Match accepte les deux formes.
+#
+# Les modifications faites hors de l'API (dashboard Supabase) ne passent pas
+# par les compteurs : la fenêtre de CACHE_TTL_SECONDS entre dans l'ETag, comme
+# pour les caches, ce qui borne la durée pendant laquelle elles restent
+# invisibles.
+
+logger = logging.getLogger("omb.versions")
+
+# Distingue les fichiers de versions (recréé = compteurs repartis de zéro)
+_epoch = uuid.uuid4().hex[:8]
+_versions: Dict[str, int] = {}
+_listeners: List[Callable[[str], None]] = []
+
+# Encodages de compression.py : une version compressée a son propre ETag
+_ENCODINGS = ("gzip", "br")
+
+def on_change(callback: Callable[[str], None]):
+    """Call `callback(table)` when another worker wrote to `table`"""
+    _listeners.append(callback)
+
+def _read(f) -> Optional[dict]:
+    f.seek(0)
+    content = f.read()
+    try:
+        raw = json.loads(content) if content else None
+    except ValueError:
+        logger.warning("fichier de versions illisible, recréé : %s", VERSIONS_FILE)
+        raw = None
+    if not isinstance(raw, dict) or not isinstance(raw.get("epoch"), str) or not isinstance(raw.get("tables"), dict):
+        return None
+    return raw
+
+def _sync(raw: dict):
+    """Adopt the shared versions; notify the listeners of the tables changed elsewhere"""
+    global _epoch, _versions
+    tables = raw["tables"]
+    if raw["epoch"] != _epoch:
+        changed = set(_versions) | set(tables)
+    else:
+        changed = {table for table, version in tables.items() if _versions.get(table) != version}
+    _epoch, _versions = raw["epoch"], dict(tables)
+    for table in changed:
+        for callback in _listeners:
+            callback(table)
+
+def _shared(update: Optional[str] = None):
+    """Read VERSIONS_FILE under its lock, bumping `update` first if given"""
+    directory = os.path.dirname(VERSIONS_FILE)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(VERSIONS_FILE, "a+", encoding="utf-8") as f:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX if update else fcntl.LOCK_SH)
+        try:
+            raw = _read(f)
+            if raw is None and not update:
+                # Fichier absent ou illisible : un seul worker le (re)crée
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                raw = _read(f)
+            write = bool(update) or raw is None
+            if raw is None:
+                raw = {"epoch": uuid.uuid4().hex[:8], "tables": {}}
+            _sync(raw)
+            if update:
+                raw["tables"][update] = raw["tables"].get(update, 0) + 1
+                _versions[update] = raw["tables"][update]
+            if write:
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(raw, separators=(",", ":")))
+                f.flush()
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+def bump(table: str):
+    """Record a write on `table` (called once the write has completed)"""
+    if fcntl is None or not ETAG_ENABLED:
+        _versions[table] = _versions.get(table, 0) + 1
+        return
+    try:
+        _shared(update=table)
+    except OSError:
+        logger.exception("fichier de versions inaccessible : %s", VERSIONS_FILE)
+        # Version locale quand même : ce worker ne sert pas de 304 périmé
+        _versions[table] = _versions.get(table, 0) + 1
+
+def etag(*tables: str, extra: str = "") -> str:
+    """
+    Strong ETag of a response reading `tables`, for the given parameters.
+    Must be computed before the data is read, so a concurrent write can
+    only make the ETag older than the data, never newer.
+    """
+    if fcntl is not None:
+        try:
+            _shared()
+        except OSError:
+            logger.exception("fichier de versions inaccessible : %s", VERSIONS_FILE)
+    window = int(time.time() // CACHE_TTL_SECONDS) if CACHE_TTL_SECONDS > 0 else 0
+    state = "|".join(f"{table}:{_versions.get(table, 0)}" for table in tables)
+    digest = hashlib.sha1(f"{state}|{window}|{extra}".encode()).hexdigest()[:16]
+    return f'"{_epoch}-{digest}"'
+
+def encoded(etag: str, encoding: str) -> str:
+    """ETag of the `encoding` (gzip, br) version of a response: "abc" → "abc-gzip" """
+    if etag.startswith("W/") or not etag.endswith('"'):
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+def _matches(if_none_match: Optional[str], current: str) -> Optional[str]:
+    """The If-None-Match entry held for `current` (any encoding), None if absent"""
+    if not if_none_match:
+        return None
+    if if_none_match.strip() == "*":
+        return current
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        strong = candidate[2:] if candidate.startswith("W/") else candidate
+        if strong == current or strong in (encoded(current, encoding) for encoding in _ENCODINGS):
+            return candidate
+    return None
+
+def conditional(request: Request, response: Response, *tables: str, extra: str = "") -> Optional[Response]:
+    """
+    Set the ETag of `response` and return a 304 response when the client
+    already holds this version (If-None-Match); None otherwise.
+    """
+    if not ETAG_ENABLED:
+        return None
+    current = etag(*tables, extra=extra)
+    held = _matches(request.headers.get("if-none-match"), current)
+    if held:
+        # Même ETag que la réponse gardée par le client (compressée ou non)
+        return Response(status_code=304, headers={"ETag": held, "Cache-Control": "no-cache"})
+    response.headers.update({"ETag": current, "Cache-Control": "no-cache"})
+    return None
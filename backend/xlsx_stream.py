@@ -0,0 +1,252 @@
+import re
+import zipfile
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+from xml.sax.saxutils import escape
+
+# ============================================
+# ÉCRITURE XLSX EN STREAMING
+# ============================================
+# Classeur d'une seule feuille, écrit ligne par ligne dans une archive zip
+# envoyée au fil de l'eau : la mémoire utilisée ne dépend pas du nombre de
+# lignes. Chaînes en ligne (pas de table partagée) et styles enregistrés à la
+# volée, écrits en dernier.
+
+class Font(NamedTuple):
+    bold: bool = False
+    italic: bool = False
+    size: float = 11
+    color: Optional[str] = None  # ARGB, ex: "FFFFFFFF"
+
+class Border(NamedTuple):
+    # Style de chaque côté : None, "thin", "medium", "thick"
+    top: Optional[str] = None
+    left: Optional[str] = None
+    bottom: Optional[str] = None
+    right: Optional[str] = None
+
+class Alignment(NamedTuple):
+    horizontal: Optional[str] = None
+    vertical: Optional[str] = None
+    wrap: bool = False
+
+class Style(NamedTuple):
+    font: Font = Font()
+    fill: Optional[str] = None  # ARGB de remplissage uni
+    border: Border = Border()
+    alignment: Alignment = Alignment()
+
+Cell = Optional[Tuple[Any, Style]]
+
+CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+_INVALID_XML_CHARS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+_STATIC_PARTS = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+        '</Types>'
+    ),
+    "_rels/.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+        '</Relationships>'
+    ),
+    "xl/_rels/workbook.xml.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+        '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+        '</Relationships>'
+    ),
+}
+
+_CHUNK_SIZE = 64 * 1024
+
+def column_letter(index: int) -> str:
+    """1 → A, 27 → AA"""
+    letters = ""
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+def cell_ref(row: int, col: int) -> str:
+    return f"{column_letter(col)}{row}"
+
+class _Sink:
+    """Write-only file object collecting the zip bytes until they are yielded"""
+
+    def __init__(self):
+        self.chunks: List[bytes] = []
+        self.size = 0
+
+    def write(self, data) -> int:
+        self.chunks.append(bytes(data))
+        self.size += len(data)
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        self.size = 0
+        return data
+
+class _StyleRegistry:
+    """Assign an index to each distinct Style and render styles.xml"""
+
+    def __init__(self):
+        self.fonts: Dict[Font, int] = {Font(): 0}
+        self.fills: Dict[Optional[str], int] = {None: 0, "gray125": 1}
+        self.borders: Dict[Border, int] = {Border(): 0}
+        self.xfs: Dict[Style, int] = {Style(): 0}
+
+    def index(self, style: Style) -> int:
+        if style not in self.xfs:
+            self.fonts.setdefault(style.font, len(self.fonts))
+            self.fills.setdefault(style.fill, len(self.fills))
+            self.borders.setdefault(style.border, len(self.borders))
+            self.xfs[style] = len(self.xfs)
+        return self.xfs[style]
+
+    def render(self) -> str:
+        fonts = "".join(
+            "<font>"
+            + ("<b/>" if font.bold else "")
+            + ("<i/>" if font.italic else "")
+            + f'<sz val="{font.size}"/>'
+            + (f'<color rgb="{font.color}"/>' if font.color else "")
+            + '<name val="Calibri"/></font>'
+            for font in self.fonts
+        )
+        fills = "".join(
+            '<fill><patternFill patternType="none"/></fill>' if fill is None
+            else '<fill><patternFill patternType="gray125"/></fill>' if fill == "gray125"
+            else f'<fill><patternFill patternType="solid"><fgColor rgb="{fill}"/></patternFill></fill>'
+            for fill in self.fills
+        )
+        borders = "".join(
+            "<border>"
+            + "".join(
+                f'<{side} style="{getattr(border, side)}"><color rgb="FF000000"/></{side}>'
+                if getattr(border, side) else f"<{side}/>"
+                for side in ("left", "right", "top", "bottom")
+            )
+            + "<diagonal/></border>"
+            for border in self.borders
+        )
+        xfs = []
+        for style in self.xfs:
+            alignment = style.alignment
+            attributes = (
+                f'numFmtId="0" fontId="{self.fonts[style.font]}" fillId="{self.fills[style.fill]}" '
+                f'borderId="{self.borders[style.border]}" xfId="0"'
+                + (' applyFont="1"' if style.font != Font() else "")
+                + (' applyFill="1"' if style.fill else "")
+                + (' applyBorder="1"' if style.border != Border() else "")
+            )
+            if alignment != Alignment():
+                align = "".join([
+                    f' horizontal="{alignment.horizontal}"' if alignment.horizontal else "",
+                    f' vertical="{alignment.vertical}"' if alignment.vertical else "",
+                    ' wrapText="1"' if alignment.wrap else "",
+                ])
+                xfs.append(f'<xf {attributes} applyAlignment="1"><alignment{align}/></xf>')
+            else:
+                xfs.append(f"<xf {attributes}/>")
+
+        return (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+            f'<fonts count="{len(self.fonts)}">{fonts}</fonts>'
+            f'<fills count="{len(self.fills)}">{fills}</fills>'
+            f'<borders count="{len(self.borders)}">{borders}</borders>'
+            '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+            f'<cellXfs count="{len(xfs)}">{"".join(xfs)}</cellXfs>'
+            '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+            '</styleSheet>'
+        )
+
+def _cell_xml(ref: str, value: Any, style_index: int) -> str:
+    style = f' s="{style_index}"' if style_index else ""
+    if value is None or value == "":
+        return f'<c r="{ref}"{style}/>'
+    if isinstance(value, bool):
+        value = str(value)
+    if isinstance(value, (int, float)):
+        return f'<c r="{ref}"{style}><v>{value}</v></c>'
+    text = escape(_INVALID_XML_CHARS.sub("", str(value)))
+    return f'<c r="{ref}"{style} t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+def iter_workbook(
+    sheet_name: str,
+    rows: Iterable[Tuple[Optional[float], Sequence[Cell]]],
+    merges: List[str],
+    column_widths: Dict[int, float],
+) -> Iterator[bytes]:
+    """
+    Yield the bytes of a single-sheet workbook.
+
+    `rows` yields (height or None, cells); a cell is (value, Style) or None.
+    `merges` holds ranges like "A1:J1"; it is read once `rows` is exhausted,
+    so the row generator may keep appending to it.
+    """
+    sink = _Sink()
+    styles = _StyleRegistry()
+
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, content in _STATIC_PARTS.items():
+            archive.writestr(name, content)
+        archive.writestr("xl/workbook.xml", (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+            'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+            f'<sheets><sheet name="{escape(sheet_name)}" sheetId="1" r:id="rId1"/></sheets>'
+            '</workbook>'
+        ))
+        yield sink.drain()
+
+        with archive.open("xl/worksheets/sheet1.xml", "w") as sheet:
+            cols = "".join(
+                f'<col min="{col}" max="{col}" width="{width}" customWidth="1"/>'
+                for col, width in sorted(column_widths.items())
+            )
+            sheet.write((
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+                + (f"<cols>{cols}</cols>" if cols else "")
+                + "<sheetData>"
+            ).encode("utf-8"))
+
+            for row_number, (height, cells) in enumerate(rows, start=1):
+                row_attributes = f' ht="{height}" customHeight="1"' if height else ""
+                xml = "".join(
+                    _cell_xml(cell_ref(row_number, col), cell[0], styles.index(cell[1]))
+                    for col, cell in enumerate(cells, start=1)
+                    if cell is not None
+                )
+                sheet.write(f'<row r="{row_number}"{row_attributes}>{xml}</row>'.encode("utf-8"))
+                if sink.size >= _CHUNK_SIZE:
+                    yield sink.drain()
+
+            sheet.write("</sheetData>".encode("utf-8"))
+            if merges:
+                sheet.write((
+                    f'<mergeCells count="{len(merges)}">'
+                    + "".join(f'<mergeCell ref="{merge}"/>' for merge in merges)
+                    + "</mergeCells>"
+                ).encode("utf-8"))
+            sheet.write("</worksheet>".encode("utf-8"))
+
+        archive.writestr("xl/styles.xml", styles.render())
+
+    yield sink.drain()
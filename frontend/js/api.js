@@ -143,13 +143,26 @@ async function updateFormule(formuleId, formule) {
 // COMMANDES
 // ===========================================
 
-async function getCommandes() {
-  try {
-    const response = await fetch(`${API_URL}/commandes/`);
+// Les listes de commandes sont paginées : on suit l'en-tête X-Next-Cursor
+// jusqu'à la dernière page et on renvoie la liste complète.
+async function fetchAllPages(url) {
+  const commandes = [];
+  let cursor = null;
+  do {
+    const pageUrl = cursor ? `${url}?cursor=${encodeURIComponent(cursor)}` : url;
+    const response = await fetch(pageUrl);
     if (!response.ok) {
       throw new Error(`HTTP error! status: ${response.status}`);
     }
-    return await response.json();
+    commandes.push(...(await response.json()));
+    cursor = response.headers.get("X-Next-Cursor");
+  } while (cursor);
+  return commandes;
+}
+
+async function getCommandes() {
+  try {
+    return await fetchAllPages(`${API_URL}/commandes/`);
   } catch (error) {
     console.error("Erreur API getCommandes:", error);
     return [];
@@ -171,6 +184,21 @@ async function createCommande(commande) {
   }
 }
 
+async function createCommandeWithComposition(commande) {
+  try {
+    const response = await fetch(`${API_URL}/commandes/with-composition`, {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify(commande),
+    });
+    if (!response.ok) throw new Error("Erreur création commande");
+    return await response.json();
+  } catch (error) {
+    console.error("Erreur API createCommandeWithComposition:", error);
+    throw error;
+  }
+}
+
 async function deleteCommande(commandeId) {
   try {
     const response = await fetch(`${API_URL}/commandes/${commandeId}/`, {
@@ -271,6 +299,24 @@ async function createFormuleProduit(formuleProduit) {
   }
 }
 
+async function replaceFormuleProduits(formuleId, produits) {
+  try {
+    const response = await fetch(
+      `${API_URL}/formule-produits/formule/${formuleId}`,
+      {
+        method: "PUT",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify(produits),
+      },
+    );
+    if (!response.ok) throw new Error("Erreur mise à jour composition formule");
+    return await response.json();
+  } catch (error) {
+    console.error("Erreur API replaceFormuleProduits:", error);
+    throw error;
+  }
+}
+
 async function deleteFormuleProduit(formuleProduitId) {
   try {
     const response = await fetch(
@@ -316,6 +362,35 @@ async function getCommandeProduits(commandeId) {
   }
 }
 
+async function getCommandeFull(commandeId) {
+  const response = await fetch(`${API_URL}/commandes/${commandeId}/full`);
+  if (!response.ok) throw new Error("Erreur récupération détail commande");
+  return await response.json();
+}
+
+async function updateCommandeComposition(commandeId, composition) {
+  try {
+    const response = await fetch(
+      `${API_URL}/commandes/${commandeId}/composition`,
+      {
+        method: "PATCH",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify(composition),
+      },
+    );
+
+    if (!response.ok) {
+      const error = await response.json();
+      throw new Error(error.detail || "Erreur mise à jour composition");
+    }
+
+    return await response.json();
+  } catch (error) {
+    console.error("Erreur API updateCommandeComposition:", error);
+    throw error;
+  }
+}
+
 async function updateCommande(commandeId, commande) {
   try {
     const response = await fetch(`${API_URL}/commandes/${commandeId}`, {
@@ -411,11 +486,12 @@ async function getUnite() {
 // ===========================================
 
 async function getArchivedCommandes() {
-  const response = await fetch(`${API_URL}/commandes/archived`);
-  if (!response.ok) {
+  try {
+    return await fetchAllPages(`${API_URL}/commandes/archived`);
+  } catch (error) {
+    console.error("Erreur API getArchivedCommandes:", error);
     throw new Error("Erreur lors de la récupération des commandes archivées");
   }
-  return await response.json();
 }
 
 async function archiveCommande(commandeId) {
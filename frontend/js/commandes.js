@@ -758,11 +758,11 @@ async function handleViewDetails(commande) {
     document.getElementById("detail-notes").textContent =
       commande.notes || "Aucune note";
 
-    const formules = await getCommandeFormules(commande.id);
-    const produits = await getCommandeProduits(commande.id);
+    // Formules (composition, exclusions) et produits en un seul appel
+    const detail = await getCommandeFull(commande.id);
 
-    await displayDetailsFormules(formules);
-    displayDetailsProduits(produits);
+    displayDetailsFormules(detail.formules);
+    displayDetailsProduits(detail.produits);
 
     document.getElementById("detail-modal").style.display = "block";
   } catch (error) {
@@ -777,7 +777,7 @@ async function handleViewDetails(commande) {
   }
 }
 
-async function displayDetailsFormules(formules) {
+function displayDetailsFormules(formules) {
   const container = document.getElementById("detail-formules-list");
   const count = document.getElementById("detail-formules-count");
 
@@ -794,23 +794,9 @@ async function displayDetailsFormules(formules) {
     const div = document.createElement("div");
     div.className = "item-row";
 
-    const formuleData = allFormules.find((f) => f.id === formule.formule_id);
-    const formuleName = formuleData ? formuleData.name : "Formule Inconnue";
-
-    // Récupérer les exclusions
-    const exclusions = await getCommandeFormuleExclusions(formule.id);
-    console.log(`🚫 Exclusions pour la formule ${formuleName}:`, exclusions);
-
-    // Récupérer les produits de la formule
-    const formuleProduits = await getFormuleProduits(formule.formule_id);
-
-    // Filtrer les produits exclus
-    const produitsActifs = formuleProduits.filter(
-      (fp) => !exclusions.includes(fp.produit_id),
-    );
-    console.log(
-      `✅ Produits actifs (${produitsActifs.length}/${formuleProduits.length})`,
-    );
+    // Composition déjà filtrée des produits exclus par l'API
+    const exclusions = formule.produits_exclus;
+    const produitsActifs = formule.composition;
 
     let produitsHTML = "";
     if (produitsActifs.length > 0) {
@@ -819,13 +805,7 @@ async function displayDetailsFormules(formules) {
       produitsHTML += '<ul class="composition-list">';
 
       for (const fp of produitsActifs) {
-        const produitData = allProduits.find((p) => p.id === fp.produit_id);
-        const produitName = produitData ? produitData.name : "Produit Inconnu";
-
-        const totalQuantite =
-          fp.quantite_par_personne * formule.quantite_finale;
-
-        produitsHTML += `<li>${produitName} - ${totalQuantite} ${fp.unite}</li>`;
+        produitsHTML += `<li>${fp.produit_name} - ${fp.quantite_totale} ${fp.unite}</li>`;
       }
 
       produitsHTML += "</ul></div>";
@@ -838,7 +818,7 @@ async function displayDetailsFormules(formules) {
 
     div.innerHTML = `
       <div class="item-info">
-        <div class="item-name">${formuleName}</div>
+        <div class="item-name">${formule.formule_name}</div>
         <div class="item-detail">Quantité : ${formule.quantite_finale} couverts</div>
         ${produitsHTML}
       </div>
@@ -865,12 +845,9 @@ function displayDetailsProduits(produits) {
     const div = document.createElement("div");
     div.className = "item-row";
 
-    const produitData = allProduits.find((p) => p.id === produit.produit_id);
-    const produitName = produitData ? produitData.name : "Produit Inconnu";
-
     div.innerHTML = `
       <div class="item-info">
-        <div class="item-name">${produitName}</div>
+        <div class="item-name">${produit.produit_name}</div>
         <div class="item-detail">Quantité : ${produit.quantite} ${produit.unite}</div>
       </div>
     `;
@@ -909,44 +886,27 @@ async function handleEditCommande(commande) {
     document.getElementById("edit-formule-couverts").value =
       commande.nombre_couverts;
 
-    // 4. Load existing formules and products from API
-    const [formules, produits] = await Promise.all([
-      getCommandeFormules(commande.id),
-      getCommandeProduits(commande.id),
-    ]);
-
-    // 5. Convert to edit format et charger les exclusions
-    editFormules = await Promise.all(
-      formules.map(async (f) => {
-        const formuleData = allFormules.find(
-          (form) => form.id === f.formule_id,
-        );
-
-        // Charger les exclusions existantes
-        const exclusions = await getCommandeFormuleExclusions(f.id);
-
-        return {
-          id: f.id,
-          formule_id: f.formule_id,
-          formule_name: formuleData ? formuleData.name : "Formule Inconnue",
-          formule_type: formuleData ? formuleData.type_formule : "",
-          couverts: f.quantite_finale,
-          produits_exclus: exclusions || [],
-          expanded: false,
-        };
-      }),
-    );
-
-    editProduits = produits.map((p) => {
-      const produitData = allProduits.find((prod) => prod.id === p.produit_id);
-      return {
-        id: p.id,
-        produit_id: p.produit_id,
-        produit_name: produitData ? produitData.name : "Produit Inconnu",
-        quantite: p.quantite,
-        unite: p.unite,
-      };
-    });
+    // 4. Load existing formules (with exclusions) and products from API
+    const detail = await getCommandeFull(commande.id);
+
+    // 5. Convert to edit format
+    editFormules = detail.formules.map((f) => ({
+      id: f.id,
+      formule_id: f.formule_id,
+      formule_name: f.formule_name,
+      formule_type: f.type_formule,
+      couverts: f.quantite_finale,
+      produits_exclus: f.produits_exclus,
+      expanded: false,
+    }));
+
+    editProduits = detail.produits.map((p) => ({
+      id: p.id,
+      produit_id: p.produit_id,
+      produit_name: p.produit_name,
+      quantite: p.quantite,
+      unite: p.unite,
+    }));
 
     // 6. Populate selectors
     populateEditFormuleSelector();
@@ -1262,39 +1222,16 @@ function displayEditProduits() {
   });
 }
 
-async function handleRemoveEditFormule(index) {
-  const formule = editFormules[index];
-
-  if (formule.id) {
-    try {
-      await deleteCommandeFormule(formule.id);
-      // ✅ Will show toast at the end
-    } catch (error) {
-      console.error("Erreur lors de la suppression de la formule :", error);
-      showToast("Erreur lors de la suppression de la formule.", "error");
-      return;
-    }
-  }
-
+function handleRemoveEditFormule(index) {
+  // Retirée de l'état final : supprimée à l'enregistrement
   editFormules.splice(index, 1);
   displayEditFormules();
 
-  // ✅ One toast for both cases
   showToast("Formule retirée.", "success");
 }
 
-async function handleRemoveEditProduit(index) {
-  const produit = editProduits[index];
-  if (produit.id) {
-    try {
-      await deleteCommandeProduit(produit.id);
-      // ✅ Will show toast at the end
-    } catch (error) {
-      console.error("Erreur lors de la suppression du produit :", error);
-      showToast("Erreur lors de la suppression du produit.", "error");
-      return;
-    }
-  }
+function handleRemoveEditProduit(index) {
+  // Retiré de l'état final : supprimé à l'enregistrement
   editProduits.splice(index, 1);
   displayEditProduits();
   showToast("Produit retiré.", "success");
@@ -1463,80 +1400,41 @@ async function handleSaveEditCommande() {
     console.log("✅ Commande mise à jour.");
 
     // ===============================================
-    // STEP 4 : UPDATE EXISTING FORMULES EXCLUSIONS
-    // ===============================================
-
-    const existingFormules = editFormules.filter((f) => f.id);
-
-    if (existingFormules.length > 0) {
-      console.log(
-        `🔄 Mise à jour exclusions pour ${existingFormules.length} formule(s) existante(s)...`,
-      );
-
-      for (const formule of existingFormules) {
-        console.log(
-          `  📝 Formule ${formule.formule_name}: exclusions =`,
-          formule.produits_exclus,
-        );
-        await updateCommandeFormuleExclusions(
-          formule.id,
-          formule.produits_exclus || [],
-        );
-      }
-
-      console.log("✅ Exclusions mises à jour pour les formules existantes.");
-    }
-
-    // ===============================================
-    // STEP 5 : CREATE NEW FORMULES & PRODUITS
+    // STEP 4 : SAVE FORMULES & PRODUITS (FINAL STATE)
     // ===============================================
 
-    const newFormules = editFormules.filter((f) => !f.id);
-
-    if (newFormules.length > 0) {
-      console.log(
-        `➕ Ajout de ${newFormules.length} nouvelle(s) formule(s):`,
-        newFormules,
-      );
-
-      for (const formule of newFormules) {
-        const formuleData = {
-          commande_id: currentEditingCommande.id,
-          formule_id: formule.formule_id,
-          quantite_finale: formule.couverts,
-          produits_exclus: formule.produits_exclus || [],
-        };
-        console.log(" ➕ Ajout formule:", formuleData);
-        console.log("    - Produits exclus:", formuleData.produits_exclus);
-        await createCommandeFormule(formuleData);
-      }
-
-      console.log("✅ Nouvelles formules ajoutées.");
-    }
-
-    const newProduits = editProduits.filter((p) => !p.id);
-
-    if (newProduits.length > 0) {
-      console.log(
-        `➕ Ajout de ${newProduits.length} nouveau(x) produit(s):`,
-        newProduits,
-      );
-
-      for (const produit of newProduits) {
-        const produitData = {
-          commande_id: currentEditingCommande.id,
-          produit_id: produit.produit_id,
-          quantite: produit.quantite,
-          unite: produit.unite,
-        };
-        await createCommandeProduit(produitData);
-      }
+    // L'API compare avec les lignes enregistrées et n'écrit que les
+    // différences (ajouts, modifications, retraits, exclusions)
+    const composition = {
+      formules: editFormules.map((f) =>
+        f.id
+          ? {
+              id: f.id,
+              formule_id: f.formule_id,
+              quantite_finale: f.couverts,
+              produits_exclus: f.produits_exclus || [],
+            }
+          : {
+              formule_id: f.formule_id,
+              quantite_recommandee: f.couverts,
+              quantite_finale: f.couverts,
+              produits_exclus: f.produits_exclus || [],
+            },
+      ),
+      produits: editProduits.map((p) => ({
+        ...(p.id ? { id: p.id } : {}),
+        produit_id: p.produit_id,
+        quantite: p.quantite,
+        unite: p.unite,
+      })),
+    };
 
-      console.log("✅ Nouveaux produits ajoutés.");
-    }
+    console.log("📝 Mise à jour composition:", composition);
+    await updateCommandeComposition(currentEditingCommande.id, composition);
+    console.log("✅ Composition mise à jour.");
 
     // ===============================================
-    // STEP 6 : Finalize
+    // STEP 5 : Finalize
     // ===============================================
     console.log("🔄 Rafraîchissement des données...");
     await loadCommandes();
@@ -2153,78 +2051,45 @@ async function handleCreateCommande() {
       validated: !enAttente, // Pour compatibilité avec l'API
     };
 
+    // Formules (avec exclusions) et produits envoyés avec la commande :
+    // l'API écrit tout en une requête et annule la création en cas d'échec
+    commandeData.formules = tempFormules.map((formule) => ({
+      formule_id: formule.formule_id,
+      quantite_recommandee: formule.couverts,
+      quantite_finale: formule.couverts,
+      produits_exclus: formule.produits_exclus || [],
+    }));
+    commandeData.produits = tempProduits.map((produit) => ({
+      produit_id: produit.produit_id,
+      quantite: produit.quantite,
+      unite: produit.unite,
+    }));
+
     console.log("📤 Création de la commande:", commandeData);
     console.log(
       `✅ Statut validation: ${!enAttente ? "Validée directement" : "En attente"}`,
     );
 
-    // Appel API pour créer la commande
-    const nouvelleCommande = await createCommande(commandeData);
+    const nouvelleCommande = await createCommandeWithComposition(commandeData);
 
     console.log("✅ Commande créée:", nouvelleCommande);
 
     // ==========================================
-    // 4. AJOUTER LES FORMULES
-    // ==========================================
-
-    if (tempFormules.length > 0) {
-      console.log(`📦 Ajout de ${tempFormules.length} formule(s)...`);
-
-      for (const formule of tempFormules) {
-        const formuleData = {
-          commande_id: nouvelleCommande.id,
-          formule_id: formule.formule_id,
-          quantite_recommandee: formule.couverts,
-          quantite_finale: formule.couverts,
-          produits_exclus: formule.produits_exclus || [],
-        };
-
-        console.log("  ➕ Ajout formule:", formuleData);
-        console.log("  🚫 Produits exclus:", formuleData.produits_exclus);
-        await createCommandeFormule(formuleData);
-      }
-
-      console.log("✅ Formules ajoutées");
-    }
-
-    // ==========================================
-    // 5. AJOUTER LES PRODUITS
-    // ==========================================
-
-    if (tempProduits.length > 0) {
-      console.log(`📦 Ajout de ${tempProduits.length} produit(s)...`);
-
-      for (const produit of tempProduits) {
-        const produitData = {
-          commande_id: nouvelleCommande.id,
-          produit_id: produit.produit_id,
-          quantite: produit.quantite,
-          unite: produit.unite,
-        };
-
-        console.log("  ➕ Ajout produit:", produitData);
-        await createCommandeProduit(produitData);
-      }
-
-      console.log("✅ Produits ajoutés");
-    }
-
-    // ==========================================
-    // 6. RAFRAÎCHIR LA LISTE
+    // 4. RAFRAÎCHIR LA LISTE
     // ==========================================
 
     console.log("🔄 Rafraîchissement de la liste...");
     await loadCommandes();
 
     // ==========================================
-    // 7. VIDER LES DONNÉES TEMPORAIRES
+    // 5. VIDER LES DONNÉES TEMPORAIRES
     // ==========================================
 
     tempFormules = [];
     tempProduits = [];
 
     // ==========================================
-    // 8. FERMER LA MODALE
+    // 6. FERMER LA MODALE
     // ==========================================
 
     document.getElementById("create-modal").style.display = "none";
@@ -2240,7 +2105,7 @@ async function handleCreateCommande() {
     document.getElementById("formule-couverts").value = "1";
 
     // ==========================================
-    // 9. AFFICHER LE SUCCÈS
+    // 7. AFFICHER LE SUCCÈS
     // ==========================================
 
     showToast(`Commande "${nomClient}" créée avec succès ! 🎉`, "success");
@@ -698,15 +698,15 @@ async function handleCreateFormuleWithProduits() {
       type_formule: type,
     });
 
-    // 2. Ajouter tous les produits
-    for (const produit of tempProduitsToCreate) {
-      await createFormuleProduit({
-        formule_id: nouvelleFormule.id,
+    // 2. Ajouter tous les produits (une seule requête)
+    await replaceFormuleProduits(
+      nouvelleFormule.id,
+      tempProduitsToCreate.map((produit) => ({
         produit_id: produit.produit_id,
         quantite: produit.quantite,
         unite: produit.unite,
-      });
-    }
+      })),
+    );
 
     // 3. Ajouter à la liste et réafficher
     allFormules.push(nouvelleFormule);